@@ -0,0 +1,64 @@
+# Compares two benchmark suite result files and exits non-zero if any metric regressed
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def change(base: dict, head: dict) -> float:
+    """Relative change from base to head; positive means the value went up."""
+    if base["value"] == 0:
+        return 0.0 if head["value"] == 0 else float("inf")
+    return (head["value"] - base["value"]) / base["value"]
+
+
+def regressed(result: dict, delta: float, threshold: float) -> bool:
+    if result["better"] == "lower":
+        return delta > threshold
+    if result["better"] == "higher":
+        return delta < -threshold
+    return delta != 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("base", help="Results from the baseline commit")
+    parser.add_argument("head", help="Results from the commit under test")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative change counted as a regression")
+    args = parser.parse_args()
+
+    base, head = load(args.base), load(args.head)
+    print(f"base {base['meta']['commit']}  head {head['meta']['commit']}")
+    for key in ("args", "config", "cpus"):
+        if base["meta"].get(key) != head["meta"].get(key):
+            print(f"warning: runs used different {key}; results may not be comparable")
+
+    regressions = []
+    for name, result in head["results"].items():
+        if name not in base["results"]:
+            print(f"{name:<28} {'':>14} {result['value']:>14,.3f} {result['unit']:<10} new")
+            continue
+        before = base["results"][name]
+        delta = change(before, result)
+        flag = ""
+        if regressed(result, delta, args.threshold):
+            flag = "REGRESSION"
+            regressions.append(name)
+        print(
+            f"{name:<28} {before['value']:>14,.3f} {result['value']:>14,.3f} "
+            f"{result['unit']:<10} {delta:+7.1%} {flag}"
+        )
+    for name in base["results"].keys() - head["results"].keys():
+        print(f"{name:<28} removed")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
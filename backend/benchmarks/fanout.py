@@ -0,0 +1,74 @@
+# Compares sequential vs concurrent source fan-out using stubbed sources
+import asyncio
+import time
+from typing import Optional
+
+from config import DEFAULT_REVIEW_COUNT
+from services.scanner import fetch_sources
+from services.sources.base import BaseSource, Review, SourceResult, Watermark
+
+# Simulated network latency per source (seconds)
+LATENCIES = {
+    "Google Play Store": 0.8,
+    "iOS App Store": 0.6,
+    "YouTube": 1.2,
+    "Product Hunt": 0.4,
+    "Reddit": 1.5,
+}
+
+
+class StubSource(BaseSource):
+    def __init__(self, platform_name: str, latency: float):
+        self.platform_name = platform_name
+        self.latency = latency
+
+    async def fetch_reviews(
+        self,
+        identifier: str,
+        count: int = DEFAULT_REVIEW_COUNT,
+        since: Optional[Watermark] = None
+    ) -> SourceResult:
+        await asyncio.sleep(self.latency)
+        review_list = [
+            Review(id=f"{identifier}-{i}", user="stub", comment="great app", date="", platform=self.platform_name)
+            for i in range(count)
+        ]
+        review_list = self.take_new(review_list, since)
+        return SourceResult(
+            platform=self.platform_name,
+            identifier=identifier,
+            average_rating=0.0,
+            total_reviews=len(review_list),
+            reviews=review_list
+        )
+
+
+async def run_sequential(jobs):
+    return [await source.fetch_reviews(identifier) for source, identifier in jobs]
+
+
+async def main():
+    jobs = [(StubSource(name, latency), "stub") for name, latency in LATENCIES.items()]
+
+    start = time.perf_counter()
+    await run_sequential(jobs)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = await fetch_sources(jobs)
+    concurrent = time.perf_counter() - start
+
+    print(f"sum(latency)   {sum(LATENCIES.values()):.2f}s")
+    print(f"max(latency)   {max(LATENCIES.values()):.2f}s")
+    print(f"sequential     {sequential:.2f}s")
+    print(f"concurrent     {concurrent:.2f}s")
+    print(f"result order   {[r.platform for r in results]}")
+
+    # A deadline shorter than the slowest source returns partial results
+    results = await fetch_sources(jobs, deadline=1.0)
+    timed_out = [r.platform for r in results if r.error]
+    print(f"deadline=1.0s  timed out: {timed_out}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
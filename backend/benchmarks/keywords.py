@@ -0,0 +1,36 @@
+# Measures keyword extraction time and peak memory as the number of texts grows
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks.sentiment_batch import make_texts
+from services.keywords import KeywordAccumulator
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    for size in args.sizes:
+        texts = make_texts(size)
+        scores = [rng.uniform(-1, 1) for _ in texts]
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        accumulator = KeywordAccumulator().add_many(texts, scores)
+        top = accumulator.top(20)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"texts={size:<7} {elapsed:6.2f}s  {size / elapsed:9.0f} texts/s  "
+            f"vocabulary={len(accumulator.counts)}  peak={peak / 1024:.0f} KiB  top={top[0][0]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Writes the replay fixtures in benchmarks/fixtures/: one payload per source in that API's response shape
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.sentiment_batch import WORDS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# Newest review in every fixture; older ones step back from here
+NEWEST = datetime(2026, 9, 30, 12, 0, 0)
+
+REDDIT_POSTS = 25
+REDDIT_COMMENTS_PER_POST = 12
+
+
+def comment_text(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(6, 45)))
+
+
+def google_play(rng: random.Random, pages: int = 2, page_size: int = 100) -> dict:
+    """Pages of google_play_scraper.reviews() dicts (the library's own field names)."""
+    result = []
+    for page in range(pages):
+        result.append([
+            {
+                "reviewId": f"gp-{page * page_size + i}",
+                "userName": f"user{rng.randint(1, 5000)}",
+                "content": comment_text(rng),
+                "score": rng.randint(1, 5),
+                "thumbsUpCount": rng.randint(0, 40),
+                "at": (NEWEST - timedelta(hours=page * page_size + i)).isoformat(),
+            }
+            for i in range(page_size)
+        ])
+    return {"pages": result}
+
+
+def ios_rss(rng: random.Random, pages: int = 2, page_size: int = 50) -> dict:
+    """Pages of the customer reviews RSS feed JSON read by app_store_web_scraper."""
+    result = []
+    for page in range(pages):
+        entries = [
+            {
+                "id": {"label": str(900000 + page * page_size + i)},
+                "updated": {"label": (NEWEST - timedelta(hours=page * page_size + i)).strftime("%Y-%m-%dT%H:%M:%S-07:00")},
+                "author": {"name": {"label": f"user{rng.randint(1, 5000)}"}},
+                "title": {"label": " ".join(rng.choices(WORDS, k=3))},
+                "content": {"label": comment_text(rng)},
+                "im:rating": {"label": str(rng.randint(1, 5))},
+                "im:version": {"label": "4.2.0"},
+            }
+            for i in range(page_size)
+        ]
+        result.append({"feed": {"link": [{"attributes": {"rel": "self", "href": "https://itunes.apple.com"}}], "entry": entries}})
+    return {"pages": result}
+
+
+def youtube(rng: random.Random, pages: int = 2, page_size: int = 100) -> dict:
+    """videos.list and pages of commentThreads.list responses (YouTube Data API v3)."""
+    result = []
+    for page in range(pages):
+        result.append({
+            "items": [
+                {
+                    "id": f"yt-{page * page_size + i}",
+                    "snippet": {"topLevelComment": {"snippet": {
+                        "authorDisplayName": f"@viewer{rng.randint(1, 5000)}",
+                        "textDisplay": comment_text(rng),
+                        "publishedAt": (NEWEST - timedelta(hours=page * page_size + i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "likeCount": rng.randint(0, 200),
+                    }}},
+                }
+                for i in range(page_size)
+            ],
+            "nextPageToken": f"page-{page + 1}" if page + 1 < pages else None,
+        })
+    return {"video": {"items": [{"id": "bench-video", "snippet": {"title": "Benchmark video"}}]}, "pages": result}
+
+
+def product_hunt(rng: random.Random, comments: int = 100) -> dict:
+    """GraphQL response to the post query sent by ProductHuntSource."""
+    edges = [
+        {"node": {
+            "id": f"ph-{i}",
+            "body": comment_text(rng),
+            "createdAt": (NEWEST - timedelta(hours=i)).isoformat() + "Z",
+            "votesCount": rng.randint(0, 30),
+            "user": {"name": f"Maker {rng.randint(1, 5000)}", "username": f"maker{i}"},
+        }}
+        for i in range(comments)
+    ]
+    return {"data": {"post": {
+        "id": "1", "name": "Bench", "tagline": "Benchmark product", "votesCount": 512,
+        "commentsCount": comments, "reviewsRating": 4.6, "comments": {"edges": edges},
+    }}}
+
+
+def reddit(rng: random.Random) -> dict:
+    """A /new.json listing plus the <permalink>.json response for each of its posts."""
+    posts, comments = [], {}
+    for p in range(REDDIT_POSTS):
+        permalink = f"/r/bench/comments/p{p}/post_{p}/"
+        created = (NEWEST - timedelta(hours=p)).replace(tzinfo=timezone.utc).timestamp()
+        post = {"kind": "t3", "data": {
+            "name": f"t3_p{p}", "id": f"p{p}", "title": comment_text(rng)[:80], "permalink": permalink,
+            "num_comments": REDDIT_COMMENTS_PER_POST, "created_utc": created,
+        }}
+        posts.append(post)
+        comments[permalink] = [
+            {"kind": "Listing", "data": {"children": [post]}},
+            {"kind": "Listing", "data": {"children": [
+                {"kind": "t1", "data": {
+                    "id": f"c{p}_{c}", "author": f"redditor{rng.randint(1, 5000)}", "body": comment_text(rng),
+                    "created_utc": created - c * 60, "score": rng.randint(-5, 120),
+                }}
+                for c in range(REDDIT_COMMENTS_PER_POST)
+            ]}},
+        ]
+    return {"listing": {"kind": "Listing", "data": {"children": posts, "after": None}}, "comments": comments}
+
+
+FIXTURES = {
+    "google_play": google_play,
+    "ios_rss": ios_rss,
+    "youtube": youtube,
+    "product_hunt": product_hunt,
+    "reddit": reddit,
+}
+
+
+def main():
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for name, build in FIXTURES.items():
+        path = os.path.join(FIXTURES_DIR, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(build(random.Random(name)), f, separators=(",", ":"))
+        print(f"wrote {path} ({os.path.getsize(path) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Serves the recorded payloads in benchmarks/fixtures/ to the real sources, with no network access
+import asyncio
+import json
+import os
+import re
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import httpx
+from app_store_web_scraper import AppStoreSession
+
+from benchmarks.make_fixtures import FIXTURES_DIR
+
+# iOS RSS feed path, as requested by app_store_web_scraper
+FEED_PAGE_PATTERN = re.compile(r"/page=(\d+)/")
+
+
+def load_fixtures() -> Dict[str, Any]:
+    fixtures = {}
+    for name in ("google_play", "ios_rss", "youtube", "product_hunt", "reddit"):
+        path = os.path.join(FIXTURES_DIR, f"{name}.json")
+        if not os.path.exists(path):
+            raise SystemExit(f"Missing {path}; run: python -m benchmarks.make_fixtures")
+        with open(path, encoding="utf-8") as f:
+            fixtures[name] = json.load(f)
+    return fixtures
+
+
+class ReplaySession(AppStoreSession):
+    """AppStoreSession whose feed requests are answered from the iOS fixture."""
+
+    def __init__(self, pages: list, latency: float):
+        super().__init__()
+        self.pages = pages
+        self.latency = latency
+
+    def _get(self, path: str) -> dict:
+        time.sleep(self.latency)
+        page = int(FEED_PAGE_PATTERN.search(path).group(1))
+        if page > len(self.pages):
+            return {"feed": {"link": self.pages[0]["feed"]["link"]}}
+        return self.pages[page - 1]
+
+
+class ReplayYouTube:
+    """The slice of the googleapiclient YouTube resource that YouTubeSource calls."""
+
+    def __init__(self, fixture: dict, latency: float):
+        self.fixture = fixture
+        self.latency = latency
+
+    def _request(self, response: dict) -> SimpleNamespace:
+        def execute():
+            time.sleep(self.latency)
+            return response
+        return SimpleNamespace(execute=execute)
+
+    def videos(self):
+        return SimpleNamespace(list=lambda **_: self._request(self.fixture["video"]))
+
+    def commentThreads(self):
+        def list_threads(pageToken: Optional[str] = None, **_):
+            index = int(pageToken.split("-")[1]) if pageToken else 0
+            return self._request(self.fixture["pages"][index])
+        return SimpleNamespace(list=list_threads)
+
+
+def replay_google_play(pages: list, latency: float):
+    """Stand-in for google_play_scraper.reviews: one fixture page per call, newest first."""
+    def reviews(app_id: str, continuation_token=None, count: int = 100, **_):
+        time.sleep(latency)
+        index = continuation_token.page if continuation_token else 0
+        page = [{**r, "at": datetime.fromisoformat(r["at"])} for r in pages[index][:count]]
+        has_more = index + 1 < len(pages)
+        token = SimpleNamespace(page=index + 1, token="next" if has_more else None)
+        return page, token
+    return reviews
+
+
+def http_handler(fixtures: Dict[str, Any], latency: float):
+    """httpx transport handler for the sources that go through http_client."""
+    reddit = fixtures["reddit"]
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if latency:
+            await asyncio.sleep(latency)
+        host, path = request.url.host, request.url.path
+        if host == "itunes.apple.com" and path == "/lookup":
+            return httpx.Response(200, json={"resultCount": 1, "results": [{"trackId": 1}]})
+        if host == "api.producthunt.com":
+            return httpx.Response(200, json=fixtures["product_hunt"])
+        if host == "www.reddit.com":
+            if path.endswith("/new.json"):
+                return httpx.Response(200, json=reddit["listing"])
+            comments = reddit["comments"].get(path[:-len(".json")])
+            if comments is not None:
+                return httpx.Response(200, json=comments)
+        return httpx.Response(404, json={"error": 404, "message": "Not found"})
+
+    return handle
+
+
+def install(sources: Dict[str, Any], latency: float = 0.0) -> None:
+    """Point the given source instances (by request field) and http_client at the fixtures.
+
+    `latency` is added to every replayed request, in seconds.
+    """
+    from services.http import http_client
+    from services.sources import google_play
+
+    fixtures = load_fixtures()
+    os.environ.setdefault("YOUTUBE_API_KEY", "replay")
+    os.environ.setdefault("PRODUCT_HUNT_API_TOKEN", "replay")
+
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(http_handler(fixtures, latency)))
+    google_play.reviews = replay_google_play(fixtures["google_play"]["pages"], latency)
+    sources["ios_app"]._session = ReplaySession(fixtures["ios_rss"]["pages"], latency)
+    youtube = ReplayYouTube(fixtures["youtube"], latency)
+    sources["youtube_video"]._get_youtube_client = lambda: youtube
@@ -0,0 +1,94 @@
+# Measures DatabaseService.save_reviews throughput and statement count at several table sizes
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from database.models import Base, Product, Review
+from database.service import DatabaseService
+
+BATCH_SIZE = 1000
+
+
+def seed(session, product_id: int, rows: int) -> None:
+    now = datetime.utcnow()
+    for start in range(0, rows, 50000):
+        session.execute(insert(Review), [
+            {
+                "product_id": product_id,
+                "external_id": f"old-{i}",
+                "platform": "Google Play Store",
+                "comment": "seeded review",
+                "sentiment_score": 0.0,
+                "sentiment_label": "neutral",
+                "fetched_at": now,
+            }
+            for i in range(start, min(start + 50000, rows))
+        ])
+    session.commit()
+
+
+def make_batch(prefix: str, existing: int):
+    # Half of each batch collides with stored reviews, as a repeat scan would
+    reviews = [
+        {"id": f"old-{i}", "user": "u", "comment": "seen before", "date": "", "sentiment_score": 0.1}
+        for i in range(min(existing, BATCH_SIZE // 2))
+    ]
+    reviews += [
+        {"id": f"{prefix}-{i}", "user": "u", "comment": "brand new", "date": "", "sentiment_score": 0.2}
+        for i in range(BATCH_SIZE - len(reviews))
+    ]
+    return reviews
+
+
+def measure(size: int) -> dict:
+    """Time one save_reviews batch against a fresh database holding `size` stored reviews."""
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    product = Product(name="bench")
+    session.add(product)
+    session.commit()
+    seed(session, product.id, size)
+
+    statements = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    service = DatabaseService(session)
+    batch = make_batch("new", size)
+    start = time.perf_counter()
+    inserted = service.save_reviews(product.id, "Google Play Store", batch)
+    session.commit()
+    elapsed = time.perf_counter() - start
+
+    session.close()
+    engine.dispose()
+    return {"batch": len(batch), "inserted": len(inserted), "statements": statements, "seconds": elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run = measure(size)
+        print(
+            f"existing={size:<8} batch={run['batch']} inserted={run['inserted']} "
+            f"statements={run['statements']} {run['seconds'] * 1000:7.1f} ms  "
+            f"{run['batch'] / run['seconds']:9.0f} reviews/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Measures SentimentAnalyzer.analyze_batch throughput across worker counts, and the batch size
+# from which the worker pool beats in-process scoring (SENTIMENT_BATCH_CUTOVER)
+import argparse
+import math
+import os
+import random
+import statistics
+import time
+
+# Score every text for real; the content cache would hide the scaling
+os.environ["SENTIMENT_CACHE_SIZE"] = "0"
+os.environ["SENTIMENT_CACHE_PATH"] = ""
+
+from services.sentiment import SentimentAnalyzer  # noqa: E402
+
+WORDS = (
+    "love hate great terrible slow fast crash bug update sync offline works broken "
+    "amazing awful support team price worth fine okay useless helpful notes app "
+    "design clean cluttered battery drains smooth laggy reliable annoying"
+).split()
+
+
+def make_texts(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    return [
+        f"{' '.join(rng.choices(WORDS, k=rng.randint(8, 40)))} #{i}"
+        for i in range(n)
+    ]
+
+
+def timed(analyzer: SentimentAnalyzer, texts, repeat: int) -> float:
+    """Median seconds for analyze_batch(texts)."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        analyzer.analyze_batch(texts)
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs)
+
+
+def crossover(args):
+    """Time batch sizes in-process and through a warm pool of `--workers[-1]` workers.
+
+    Pool time is modelled as overhead + n * per_text / workers; the fitted
+    overhead gives the smallest batch the pool wins on a machine with that
+    many free CPUs, even when this one has fewer.
+    """
+    workers = args.workers[-1]
+    in_process = SentimentAnalyzer(workers=1)
+    pooled = SentimentAnalyzer(workers=workers, batch_cutover=1)
+    pooled.analyze_batch(make_texts(workers * 4, seed=workers))
+    cpus = os.cpu_count() or 1
+    print(f"{workers} workers, {cpus} CPUs")
+
+    overheads, per_text, measured = [], [], None
+    for n in args.sizes:
+        texts = make_texts(n, seed=n)
+        local = timed(in_process, texts, args.repeat)
+        pool = timed(pooled, texts, args.repeat)
+        per_text.append(local / n)
+        # With fewer CPUs than workers the pool runs no faster than one process
+        overheads.append(pool - local / min(workers, cpus))
+        if measured is None and pool < local:
+            measured = n
+        print(f"batch={n:<6} in-process {local * 1000:8.2f}ms  pool {pool * 1000:8.2f}ms")
+    in_process.shutdown()
+    pooled.shutdown()
+
+    overhead, cost = statistics.median(overheads), statistics.median(per_text)
+    estimate = math.ceil(overhead / (cost * (1 - 1 / workers))) if workers > 1 else None
+    print(f"pool overhead {overhead * 1000:.2f}ms per batch, {cost * 1e6:.0f}us per text in-process")
+    print(f"measured crossover: {measured if measured else 'none up to ' + str(args.sizes[-1])}")
+    print(f"estimated crossover with {workers} free CPUs: {estimate}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--texts", type=int, default=50000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--crossover", action="store_true", help="Find the SENTIMENT_BATCH_CUTOVER batch size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 400, 800, 1600, 3200])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.crossover:
+        crossover(args)
+        return
+
+    texts = make_texts(args.texts)
+    print(f"{args.texts} texts, {os.cpu_count()} CPUs")
+
+    baseline = None
+    for workers in args.workers:
+        analyzer = SentimentAnalyzer(workers=workers, batch_cutover=1)
+        if workers > 1:
+            # Start the pool outside the timed region; workers load VADER once
+            analyzer.analyze_batch(make_texts(workers * 4, seed=workers))
+
+        start = time.perf_counter()
+        analyzer.analyze_batch(texts)
+        elapsed = time.perf_counter() - start
+        analyzer.shutdown()
+
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:<2} {elapsed:6.2f}s  {args.texts / elapsed:9.0f} texts/s  "
+            f"speedup x{baseline / elapsed:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Counts VADER polarity_scores calls made by one POST /api/reviews scan
+import os
+import random
+import tempfile
+import time
+
+# Keep the benchmark's SQLite file out of the working tree
+os.chdir(tempfile.mkdtemp())
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.fanout import StubSource  # noqa: E402
+from services.sentiment import sentiment_analyzer  # noqa: E402
+
+REVIEWS_PER_SOURCE = 200
+PHRASES = [
+    "I love how fast the new sync is",
+    "crashes every time I open settings, terrible",
+    "works fine but the dark mode could be better",
+    "support never replied, really disappointed",
+    "best note taking tool I have used",
+    "the update broke offline mode again",
+]
+
+
+class TextStubSource(StubSource):
+    async def fetch_reviews(self, identifier, count=REVIEWS_PER_SOURCE, since=None):
+        result = await super().fetch_reviews(identifier, count=REVIEWS_PER_SOURCE, since=since)
+        rng = random.Random(self.platform_name)
+        for review in result.reviews:
+            review.comment = " ".join(rng.sample(PHRASES, 2))
+        return result
+
+
+def main_benchmark():
+    calls = 0
+    original = sentiment_analyzer.analyzer.polarity_scores
+
+    def counting_polarity_scores(text):
+        nonlocal calls
+        calls += 1
+        return original(text)
+
+    sentiment_analyzer.analyzer.polarity_scores = counting_polarity_scores
+    main.SOURCE_REGISTRY[:] = [
+        ("google_play_app", TextStubSource("Google Play Store", 0.0)),
+        ("ios_app", TextStubSource("iOS App Store", 0.0)),
+        ("reddit_subreddit", TextStubSource("Reddit", 0.0)),
+    ]
+    payload = {
+        "product_name": "benchmark",
+        "sources": {"google_play_app": "gp", "ios_app": "ios", "reddit_subreddit": "rd"},
+    }
+
+    with TestClient(main.app) as client:
+        for label in ("first scan", "repeat scan"):
+            calls = 0
+            start = time.perf_counter()
+            response = client.post("/api/reviews", json=payload)
+            elapsed = time.perf_counter() - start
+            total = sum(len(s["reviews"]) for s in response.json()["sources"])
+            print(
+                f"{label:12} reviews={total} polarity_scores calls={calls} "
+                f"({calls / total:.2f}/review) {elapsed:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,92 @@
+# Mixed read/write load against SQLite with each engine profile
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from database.connection import SQLITE_PROFILES, make_engine
+from database.models import Base, Product
+from database.service import DatabaseService
+
+
+def run_profile(profile: str, writers: int, readers: int, duration: float) -> dict:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = make_engine(f"sqlite:///{path}", profile=profile)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as session:
+        product = Product(name="bench")
+        session.add(product)
+        session.commit()
+        product_id = product.id
+
+    counts = {"writes": 0, "reads": 0, "errors": 0}
+    lock = threading.Lock()
+    stop = time.perf_counter() + duration
+
+    def writer(worker: int):
+        n = 0
+        while time.perf_counter() < stop:
+            # One small scan-sized transaction: 20 reviews + a snapshot
+            reviews = [
+                {"id": f"w{worker}-{n}-{i}", "user": "u", "comment": "ok", "date": "", "sentiment_score": 0.0}
+                for i in range(20)
+            ]
+            n += 1
+            try:
+                with Session() as session:
+                    service = DatabaseService(session)
+                    service.save_reviews(product_id, "Reddit", reviews)
+                    service.save_sentiment_snapshot(product_id, "Reddit", {"breakdown": {"neutral": 20}})
+                    session.commit()
+                key = "writes"
+            except OperationalError:
+                key = "errors"
+            with lock:
+                counts[key] += 1
+
+    def reader():
+        while time.perf_counter() < stop:
+            try:
+                with Session() as session:
+                    service = DatabaseService(session)
+                    service.get_reviews(product_id, limit=100)
+                    service.get_sentiment_history(product_id)
+                key = "reads"
+            except OperationalError:
+                key = "errors"
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for profile in SQLITE_PROFILES:
+        counts = run_profile(profile, args.writers, args.readers, args.duration)
+        print(
+            f"profile={profile:<10} writes/s={counts['writes'] / args.duration:7.1f} "
+            f"reads/s={counts['reads'] / args.duration:7.1f} errors={counts['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# Reproducible benchmark suite: replays the recorded source payloads through the scan path and writes JSON results
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+PLATFORMS = ("GOOGLE_PLAY", "IOS", "YOUTUBE", "PRODUCT_HUNT", "REDDIT")
+
+# Fixed settings so results from different commits are comparable; applied before the app reads its config
+BENCH_CONFIG = {
+    "SCHEDULER_ENABLED": "false",
+    "TRACING_ENABLED": "false",
+    # Every scan scores its reviews for real instead of reading cached scores
+    "SENTIMENT_CACHE_SIZE": "0",
+    "SENTIMENT_CACHE_PATH": "",
+    # Replayed requests are never throttled, but still pass through the limiter
+    "RATE_LIMIT_BURST": "1000000",
+    "YOUTUBE_DAILY_QUOTA": "1000000000",
+    **{f"RATE_LIMIT_{name}_PER_MINUTE": "1000000000" for name in PLATFORMS},
+    **{f"SCAN_CACHE_TTL_{name}_SECONDS": "0" for name in PLATFORMS},
+}
+os.environ.update(BENCH_CONFIG)
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+import httpx  # noqa: E402
+
+from benchmarks import replay  # noqa: E402
+from benchmarks.save_reviews import measure as measure_save_reviews  # noqa: E402
+
+SCAN_SOURCES = {
+    "google_play_app": "com.bench.app",
+    "ios_app": "900000001",
+    "youtube_video": "bench-video",
+    "product_hunt_product": "bench",
+    "reddit_subreddit": "bench",
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile, 0 < q <= 1."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def median_of(repeat: int, func: Callable[[], float]) -> float:
+    """Median duration of `repeat` calls of `func`, which returns the seconds it measured."""
+    return statistics.median(func() for _ in range(repeat))
+
+
+def metric(value: float, unit: str, better: str) -> Dict[str, Any]:
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+
+def fixture_texts(n: int) -> List[str]:
+    """`n` distinct review texts built from the replayed comments."""
+    fixtures = replay.load_fixtures()
+    comments = [r["content"] for page in fixtures["google_play"]["pages"] for r in page]
+    comments += [e["content"]["label"] for page in fixtures["ios_rss"]["pages"] for e in page["feed"]["entry"]]
+    comments += [
+        item["snippet"]["topLevelComment"]["snippet"]["textDisplay"]
+        for page in fixtures["youtube"]["pages"] for item in page["items"]
+    ]
+    # A suffix keeps repeats from being deduplicated within a batch
+    return [f"{comments[i % len(comments)]} #{i}" for i in range(n)]
+
+
+async def bench_scans(args) -> Dict[str, Dict[str, Any]]:
+    """POST /api/reviews end to end: sequential full and incremental scans, then concurrent throughput."""
+    from main import app, SOURCE_REGISTRY
+
+    replay.install(dict(SOURCE_REGISTRY), latency=args.latency)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+            async def scan(product_name: str, incremental: bool):
+                start = time.perf_counter()
+                response = await client.post(
+                    "/api/reviews",
+                    json={"product_name": product_name, "sources": SCAN_SOURCES, "incremental": incremental}
+                )
+                elapsed = time.perf_counter() - start
+                body = response.json()
+                if response.status_code != 200 or body.get("error") or body.get("errors"):
+                    raise SystemExit(f"Scan of '{product_name}' failed: {body}")
+                return elapsed, sum(len(source["reviews"]) for source in body["sources"])
+
+            # Warm-up loads VADER, opens pools and stores the product
+            for _ in range(args.warmup):
+                await scan("bench", False)
+
+            full = [await scan("bench", False) for _ in range(args.scans)]
+            incremental = [await scan("bench", True) for _ in range(args.scans)]
+
+            start = time.perf_counter()
+            concurrent = await asyncio.gather(
+                *(scan(f"bench-{i}", False) for i in range(args.concurrency))
+            )
+            elapsed = time.perf_counter() - start
+
+    full_times = [seconds for seconds, _ in full]
+    incremental_times = [seconds for seconds, _ in incremental]
+    return {
+        "scan_full_p50": metric(statistics.median(full_times) * 1000, "ms", "lower"),
+        "scan_full_p95": metric(percentile(full_times, 0.95) * 1000, "ms", "lower"),
+        "scan_incremental_p50": metric(statistics.median(incremental_times) * 1000, "ms", "lower"),
+        "scan_incremental_p95": metric(percentile(incremental_times, 0.95) * 1000, "ms", "lower"),
+        # Fixed by the fixtures; a change means the replay or a source's parsing changed
+        "scan_reviews": metric(full[0][1], "reviews", "same"),
+        "scan_throughput": metric(args.concurrency / elapsed, "scans/s", "higher"),
+        "scan_review_throughput": metric(sum(n for _, n in concurrent) / elapsed, "reviews/s", "higher"),
+    }
+
+
+def bench_vader(args) -> Dict[str, Dict[str, Any]]:
+    """In-process VADER scoring of distinct texts (no cache, no worker pool)."""
+    from services.sentiment import SentimentAnalyzer
+
+    texts = fixture_texts(args.texts)
+    analyzer = SentimentAnalyzer(workers=1)
+
+    def run() -> float:
+        start = time.perf_counter()
+        analyzer.analyze_batch(texts)
+        return time.perf_counter() - start
+
+    seconds = median_of(args.repeat, run)
+    analyzer.shutdown()
+    return {"vader_rate": metric(len(texts) / seconds, "texts/s", "higher")}
+
+
+def bench_keywords(args) -> Dict[str, Dict[str, Any]]:
+    """extract_keywords over already scored texts, so only keyword counting is timed."""
+    from services.sentiment import SentimentAnalyzer
+
+    texts = fixture_texts(args.texts)
+    analyzer = SentimentAnalyzer(workers=1)
+    scores = [s["compound"] for s in analyzer.analyze_batch(texts)]
+
+    def run() -> float:
+        start = time.perf_counter()
+        analyzer.extract_keywords(texts, scores=scores)
+        return time.perf_counter() - start
+
+    seconds = median_of(args.repeat, run)
+    analyzer.shutdown()
+    return {"keywords_rate": metric(len(texts) / seconds, "texts/s", "higher")}
+
+
+def bench_save_reviews(args) -> Dict[str, Dict[str, Any]]:
+    """save_reviews insert rate for one batch at each stored-review count."""
+    results = {}
+    for size in args.db_sizes:
+        runs = [measure_save_reviews(size) for _ in range(args.repeat)]
+        seconds = statistics.median(run["seconds"] for run in runs)
+        results[f"save_reviews_rate_{size}"] = metric(runs[0]["batch"] / seconds, "reviews/s", "higher")
+    return results
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--scans", type=int, default=20, help="Timed scans per mode")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=8, help="Scans run at once for throughput")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every replayed request")
+    parser.add_argument("--texts", type=int, default=20000, help="Texts for the VADER and keyword runs")
+    parser.add_argument("--db-sizes", type=int, nargs="+", default=[0, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per micro-benchmark; the median is kept")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    results.update(asyncio.run(bench_scans(args)))
+    results.update(bench_vader(args))
+    results.update(bench_keywords(args))
+    results.update(bench_save_reviews(args))
+
+    for name, result in results.items():
+        print(f"{name:<28} {result['value']:>14,.3f} {result['unit']}", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "args": {k: v for k, v in vars(args).items() if k != "output"},
+            "config": BENCH_CONFIG,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,108 @@
+import os
+
 DEFAULT_REVIEW_COUNT = 100
+
+# Per-source fetch timeout and overall deadline for one scan (seconds)
+SOURCE_TIMEOUT_SECONDS = float(os.getenv("SOURCE_TIMEOUT_SECONDS", "30"))
+SCAN_DEADLINE_SECONDS = float(os.getenv("SCAN_DEADLINE_SECONDS", "45"))
+
+# Background scan jobs (POST /api/jobs, streams, schedules; POST /api/reviews runs outside this limit):
+# scans run at once, scans waiting in the queue, finished jobs kept for polling
+MAX_CONCURRENT_SCANS = int(os.getenv("MAX_CONCURRENT_SCANS", "2"))
+MAX_QUEUED_SCANS = int(os.getenv("MAX_QUEUED_SCANS", "100"))
+JOB_HISTORY_SIZE = int(os.getenv("JOB_HISTORY_SIZE", "200"))
+
+# Scan result cache for POST /api/reviews: seconds a result stays fresh per platform (a scan
+# uses the shortest of its platforms), seconds after that it is served stale while a refresh
+# runs, and results kept
+SCAN_CACHE_TTL_GOOGLE_PLAY_SECONDS = float(os.getenv("SCAN_CACHE_TTL_GOOGLE_PLAY_SECONDS", "600"))
+SCAN_CACHE_TTL_IOS_SECONDS = float(os.getenv("SCAN_CACHE_TTL_IOS_SECONDS", "600"))
+SCAN_CACHE_TTL_YOUTUBE_SECONDS = float(os.getenv("SCAN_CACHE_TTL_YOUTUBE_SECONDS", "300"))
+SCAN_CACHE_TTL_PRODUCT_HUNT_SECONDS = float(os.getenv("SCAN_CACHE_TTL_PRODUCT_HUNT_SECONDS", "300"))
+SCAN_CACHE_TTL_REDDIT_SECONDS = float(os.getenv("SCAN_CACHE_TTL_REDDIT_SECONDS", "120"))
+SCAN_CACHE_STALE_SECONDS = float(os.getenv("SCAN_CACHE_STALE_SECONDS", "600"))
+# Results where any source failed: short freshness and never served stale (0 = not cached)
+SCAN_CACHE_ERROR_TTL_SECONDS = float(os.getenv("SCAN_CACHE_ERROR_TTL_SECONDS", "15"))
+SCAN_CACHE_MAX_ENTRIES = int(os.getenv("SCAN_CACHE_MAX_ENTRIES", "500"))
+
+# Recurring scans: scheduler switch, seconds between due checks, +/- fraction of the interval
+# added as jitter, scans started per source per check, window overdue scans are spread over
+# after a restart, and the shortest interval a product may be scheduled at
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", "30"))
+SCHEDULER_JITTER = float(os.getenv("SCHEDULER_JITTER", "0.1"))
+SCHEDULER_MAX_PER_SOURCE = int(os.getenv("SCHEDULER_MAX_PER_SOURCE", "2"))
+SCHEDULER_CATCHUP_WINDOW_MINUTES = float(os.getenv("SCHEDULER_CATCHUP_WINDOW_MINUTES", "30"))
+MIN_SCAN_INTERVAL_MINUTES = int(os.getenv("MIN_SCAN_INTERVAL_MINUTES", "5"))
+
+# Incremental scans: first page size when resuming from a watermark, ids kept per watermark
+INCREMENTAL_PAGE_SIZE = int(os.getenv("INCREMENTAL_PAGE_SIZE", "20"))
+WATERMARK_ID_COUNT = int(os.getenv("WATERMARK_ID_COUNT", "20"))
+
+# Worker threads for third-party scraper libraries that only offer blocking calls
+SOURCE_IO_WORKERS = int(os.getenv("SOURCE_IO_WORKERS", "8"))
+
+# Shared HTTP client pool used by the API-based sources
+HTTP_TIMEOUT_SECONDS = float(os.getenv("HTTP_TIMEOUT_SECONDS", "30"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "10"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "30"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+# Per-platform request rates (requests per minute, 0 for no limit) and burst size for the shared rate limiter;
+# response rate-limit headers tighten these at runtime
+RATE_LIMIT_GOOGLE_PLAY_PER_MINUTE = float(os.getenv("RATE_LIMIT_GOOGLE_PLAY_PER_MINUTE", "100"))
+RATE_LIMIT_IOS_PER_MINUTE = float(os.getenv("RATE_LIMIT_IOS_PER_MINUTE", "100"))
+RATE_LIMIT_YOUTUBE_PER_MINUTE = float(os.getenv("RATE_LIMIT_YOUTUBE_PER_MINUTE", "600"))
+RATE_LIMIT_PRODUCT_HUNT_PER_MINUTE = float(os.getenv("RATE_LIMIT_PRODUCT_HUNT_PER_MINUTE", "60"))
+RATE_LIMIT_REDDIT_PER_MINUTE = float(os.getenv("RATE_LIMIT_REDDIT_PER_MINUTE", "60"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "10"))
+# Times a 429 response is retried after waiting out Retry-After
+RATE_LIMIT_MAX_RETRIES = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "2"))
+
+# YouTube Data API units per day (resets at midnight Pacific time)
+YOUTUBE_DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+
+# Reddit subreddit scans: posts listed, comments read per post, parallel permalink fetches;
+# permalinks are also capped by what the rate limiter can grant within the source timeout
+REDDIT_MAX_POSTS = int(os.getenv("REDDIT_MAX_POSTS", "100"))
+REDDIT_COMMENTS_PER_POST = int(os.getenv("REDDIT_COMMENTS_PER_POST", "25"))
+REDDIT_CONCURRENCY = int(os.getenv("REDDIT_CONCURRENCY", "8"))
+# Incremental scans: posts created before the last scan that are still re-read for new comments
+REDDIT_RECHECK_POSTS = int(os.getenv("REDDIT_RECHECK_POSTS", "10"))
+
+# Sentiment score cache: in-memory LRU entries, optional SQLite file that survives restarts
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "50000"))
+SENTIMENT_CACHE_PATH = os.getenv("SENTIMENT_CACHE_PATH", "")
+
+# Batch sentiment scoring: worker processes, and batch size below which scoring stays in-process.
+# Set the cutover to the crossover `python -m benchmarks.sentiment_batch --crossover` measures on the
+# deployment machine; the default sits above 100-text batches, where the pool measured slower
+SENTIMENT_WORKERS = int(os.getenv("SENTIMENT_WORKERS", str(os.cpu_count() or 1)))
+SENTIMENT_BATCH_CUTOVER = int(os.getenv("SENTIMENT_BATCH_CUTOVER", "200"))
+
+# Database: SQLAlchemy URL, engine tuning profile ("production" or "default") and pool sizing
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./perception_scanner.db")
+DB_PROFILE = os.getenv("DB_PROFILE", "production")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+
+# Timers and counters on the scan path, served at /metrics; when off the hot paths are left unwrapped
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# Request tracing: span export to a JSON-lines file ("file"), stderr ("console") or nowhere ("none")
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "file")
+TRACING_FILE = os.getenv("TRACING_FILE", "traces.jsonl")
+
+# Largest page the stored-reviews endpoint serves (use stream=true for full exports)
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+# Sentiment history: longest window served, and most points returned per platform
+MAX_HISTORY_DAYS = int(os.getenv("MAX_HISTORY_DAYS", "365"))
+HISTORY_MAX_POINTS = int(os.getenv("HISTORY_MAX_POINTS", "1000"))
@@ -1,8 +1,10 @@
 from .models import init_db, get_db
-from .service import DatabaseService
+from .service import DatabaseService, AsyncDatabaseService, get_async_db
 
 __all__ = [
     "init_db",
     "get_db",
+    "get_async_db",
     "DatabaseService",
+    "AsyncDatabaseService",
 ]
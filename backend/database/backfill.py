@@ -0,0 +1,36 @@
+# Rebuild the derived sentiment tables (hourly/daily rollups, all-time totals) from stored data
+# Usage (from backend/): python -m database.backfill [--product NAME]
+import argparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from .connection import SessionLocal
+from .models import init_db
+from .service import DatabaseService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild sentiment rollups and all-time totals.")
+    parser.add_argument("--product", help="only rebuild this product (default: all products)")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        service = DatabaseService(db)
+        product_id = None
+        if args.product:
+            product = service.get_product_by_name(args.product)
+            if not product:
+                raise SystemExit(f"Product '{args.product}' not found")
+            product_id = product.id
+
+        print(f"Wrote {service.rebuild_rollups(product_id)} rollup rows")
+        print(f"Wrote {service.rebuild_sentiment_totals(product_id)} sentiment totals rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,142 @@
 # Database connection - separated from models to avoid import-time side effects
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, TypeVar
 
-DATABASE_URL = "sqlite:///./perception_scanner.db"
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+from config import (
+    DATABASE_URL,
+    DB_PROFILE,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT_SECONDS,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE_KB,
+)
+
+# PRAGMAs applied to every new SQLite connection, per profile
+SQLITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "production": {
+        # Readers no longer block the writer, and commits append to the WAL
+        "journal_mode": "WAL",
+        # Safe with WAL: only a power loss can drop the latest commits
+        "synchronous": "NORMAL",
+        "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": SQLITE_MMAP_SIZE,
+        # Negative values are KiB rather than pages
+        "cache_size": -SQLITE_CACHE_SIZE_KB,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+T = TypeVar("T")
+
+
+def resolve_url(url: str) -> str:
+    """Pick the psycopg driver for Postgres.
+
+    Lets DATABASE_URL be written without a driver, e.g. postgresql://user@host/db.
+    """
+    parsed = make_url(url)
+    # An explicit driver (e.g. postgresql+pg8000://) is left as given
+    if parsed.drivername in ("postgres", "postgresql"):
+        return parsed.set(drivername="postgresql+psycopg").render_as_string(hide_password=False)
+    return url
+
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return make_url(url).database in (None, "", ":memory:")
+
+
+def _engine_kwargs(url: str, profile: str) -> Dict[str, Any]:
+    if not _is_sqlite(url):
+        return {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+            "pool_pre_ping": True
+        }
+
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown DB_PROFILE '{profile}', expected one of {sorted(SQLITE_PROFILES)}")
+
+    kwargs: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if _is_memory_sqlite(url):
+        # Every connection would open its own empty database; share one, so migrations
+        # and requests see the same tables
+        kwargs["poolclass"] = StaticPool
+    else:
+        kwargs.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT_SECONDS
+        )
+    return kwargs
+
+
+def _apply_sqlite_profile(engine: Engine, url: str, profile: str) -> None:
+    pragmas = SQLITE_PROFILES[profile] if _is_sqlite(url) else {}
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def make_engine(url: str = DATABASE_URL, profile: str = DB_PROFILE) -> Engine:
+    """Create a sync engine for `url`, applying the SQLite tuning `profile` on connect."""
+    url = resolve_url(url)
+    engine = create_engine(url, **_engine_kwargs(url, profile))
+    _apply_sqlite_profile(engine, url, profile)
+    return engine
+
+
+# Sync engine shared by the API, migrations, scripts and benchmarks
+engine = make_engine()
 SessionLocal = sessionmaker(bind=engine)
+
+# The API's database work (queries, ORM flushes, result processing) runs on these threads,
+# never on the event loop; one per pooled connection so no thread waits for the pool.
+# An in-memory database has a single shared connection, so its work runs one call at a time
+db_executor = ThreadPoolExecutor(
+    max_workers=1 if _is_sqlite(str(engine.url)) and _is_memory_sqlite(str(engine.url)) else DB_POOL_SIZE,
+    thread_name_prefix="db"
+)
+
+
+async def run_in_db_thread(func: Callable[..., T], *args: Any) -> T:
+    """Run blocking database work on db_executor, keeping the caller's context (trace spans)."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(db_executor, functools.partial(context.run, func, *args))
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[Session]:
+    """Session for async code, to be used only through run_in_db_thread (see AsyncDatabaseService).
+
+    expire_on_commit=False so results stay readable after commit without another query.
+    """
+    session = SessionLocal(expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        await run_in_db_thread(session.close)
@@ -1,11 +1,17 @@
-# SQLite database models for storing reviews and sentiment
+# Database models for storing reviews and sentiment (SQLite or Postgres)
+import os
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON, Index, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
 from .connection import engine, SessionLocal
 
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+# Schema that databases created before migrations existed already match
+BASELINE_REVISION = "0001"
+
 Base = declarative_base()
 
 
@@ -22,14 +28,27 @@ class Product(Base):
     reddit_subreddit = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Recurring scans: NULL interval means the scheduler leaves the product alone
+    scan_interval_minutes = Column(Integer, nullable=True)
+    next_scan_at = Column(DateTime, nullable=True, index=True)
+    last_scan_at = Column(DateTime, nullable=True)
 
     reviews = relationship("Review", back_populates="product", cascade="all, delete-orphan")
     sentiment_snapshots = relationship("SentimentSnapshot", back_populates="product", cascade="all, delete-orphan")
+    sentiment_rollups = relationship("SentimentRollup", back_populates="product", cascade="all, delete-orphan")
+    source_watermarks = relationship("SourceWatermark", back_populates="product", cascade="all, delete-orphan")
+    sentiment_totals = relationship("SentimentTotal", back_populates="product", cascade="all, delete-orphan")
 
 
 # Individual review from any platform
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Dedup key for save_reviews; also serves its bulk existence lookup
+        Index("ux_reviews_product_platform_external", "product_id", "platform", "external_id", unique=True),
+        # Keyset pagination order for stored reviews (newest first)
+        Index("ix_reviews_product_fetched", "product_id", "fetched_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -65,10 +84,93 @@ class SentimentSnapshot(Base):
 
     product = relationship("Product", back_populates="sentiment_snapshots")
 
+    __table_args__ = (
+        # History window scans and per-platform bucketing
+        Index("ix_sentiment_snapshots_product_created", "product_id", "created_at", "platform"),
+    )
+
+
+# Snapshot totals per product, platform and hour/day, maintained as snapshots are saved
+class SentimentRollup(Base):
+    __tablename__ = "sentiment_rollups"
+    __table_args__ = (
+        # Upsert key; also serves history range reads
+        Index("ux_sentiment_rollups_bucket", "product_id", "granularity", "bucket_start", "platform", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    platform = Column(String(50), nullable=False)  # "Combined" for the combined snapshot
+    granularity = Column(String(10), nullable=False)  # "hour" or "day"
+    bucket_start = Column(DateTime, nullable=False)
+    snapshot_count = Column(Integer, nullable=False, default=0)
+    total_reviews = Column(Integer, nullable=False, default=0)
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)  # sum of average_score * total_reviews
+    average_score_sum = Column(Float, nullable=False, default=0.0)  # sum of average_score, for empty snapshots
+
+    product = relationship("Product", back_populates="sentiment_rollups")
+
+
+# Newest reviews stored per product and platform, so repeat scans only fetch what is new
+class SourceWatermark(Base):
+    __tablename__ = "source_watermarks"
+    __table_args__ = (
+        Index("ux_source_watermarks_product_platform", "product_id", "platform", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    platform = Column(String(50), nullable=False)
+    identifier = Column(String(255), nullable=False)  # Watermark only applies while this is unchanged
+    latest_ids = Column(JSON, nullable=True)  # Newest external ids, newest first
+    latest_date = Column(String(50), nullable=True)
+    cursor = Column(String(255), nullable=True)  # Source-specific resume position
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    product = relationship("Product", back_populates="source_watermarks")
+
+
+# All-time sentiment aggregate per product and platform, updated with each scan's new reviews
+class SentimentTotal(Base):
+    __tablename__ = "sentiment_totals"
+    __table_args__ = (
+        Index("ux_sentiment_totals_product_platform", "product_id", "platform", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    platform = Column(String(50), nullable=False)  # "Combined" for all platforms together
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+    compound_sum = Column(Float, nullable=False, default=0.0)
+    keywords = Column(JSON, nullable=True)  # KeywordAccumulator.to_dict()
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    product = relationship("Product", back_populates="sentiment_totals")
+
 
 def init_db():
-    """Initialize the database tables."""
-    Base.metadata.create_all(bind=engine)
+    """Bring the database schema up to date by running the Alembic migrations."""
+    from alembic import command
+    from alembic.config import Config
+
+    with engine.begin() as connection:
+        config = Config(ALEMBIC_INI)
+        config.attributes["connection"] = connection
+
+        inspector = inspect(connection)
+        if inspector.has_table("products") and not inspector.has_table("alembic_version"):
+            # Pre-migration database: add the dedup index it may predate, then adopt the baseline
+            for index in Review.__table__.indexes:
+                if index.name == "ux_reviews_product_platform_external":
+                    index.create(bind=connection, checkfirst=True)
+            command.stamp(config, BASELINE_REVISION)
+
+        command.upgrade(config, "head")
 
 
 def get_db():
@@ -1,14 +1,144 @@
 # Database CRUD operations for products, reviews, and sentiment
+import base64
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Callable, TypeVar, Tuple, AsyncIterator
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select, tuple_, Select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from config import DEFAULT_REVIEW_COUNT
-from .models import Product, Review, SentimentSnapshot
+from config import DEFAULT_REVIEW_COUNT, WATERMARK_ID_COUNT
+from .models import Product, Review, SentimentSnapshot, SentimentRollup, SourceWatermark, SentimentTotal
+from .connection import run_in_db_thread, session_scope
+from services.aggregate import AggregateState
+from services.keywords import tokenize
+from services.metrics import instrument_methods, DB_SECONDS, REVIEWS_DEDUPLICATED, REVIEWS_INSERTED
+from services.tracing import tracer
 from services.sentiment import sentiment_analyzer
+from services.sources.base import Watermark
 
+# Ids per existence lookup; stays under SQLite's bound-parameter limit
+LOOKUP_CHUNK_SIZE = 500
 
+# Rows fetched per round trip when streaming reviews from a server-side cursor
+STREAM_BATCH_SIZE = 1000
+
+T = TypeVar("T")
+
+# Granularities kept in sentiment_rollups; week buckets are folded from days
+ROLLUP_GRANULARITIES = ("hour", "day")
+
+# Rollup platform key for combined (platform NULL) snapshots
+COMBINED_PLATFORM = "Combined"
+
+# Rollup columns that an upsert adds to instead of replacing
+ROLLUP_SUM_COLUMNS = (
+    "snapshot_count", "total_reviews", "positive_count", "negative_count",
+    "neutral_count", "score_sum", "average_score_sum",
+)
+
+# Columns served by the stored-reviews endpoints, labelled with their API names
+REVIEW_EXPORT_COLUMNS = (
+    Review.external_id.label("id"),
+    Review.platform,
+    Review.user,
+    Review.rating,
+    Review.comment,
+    Review.review_date.label("date"),
+    Review.likes,
+    Review.sentiment_score,
+    Review.sentiment_label,
+)
+
+
+def encode_review_cursor(fetched_at: datetime, review_id: int) -> str:
+    """Opaque keyset cursor for the review after which the next page starts."""
+    raw = f"{fetched_at.isoformat()}|{review_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_review_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_review_cursor; raises ValueError for malformed cursors."""
+    try:
+        fetched_at, review_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        return datetime.fromisoformat(fetched_at), int(review_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def build_reviews_query(
+    product_id: int,
+    platform: Optional[str] = None,
+    cursor: Optional[str] = None
+) -> Select:
+    """Stored reviews newest first, ordered on (fetched_at, id) to match ix_reviews_product_fetched."""
+    query = select(*REVIEW_EXPORT_COLUMNS, Review.fetched_at, Review.id.label("row_id")).where(
+        Review.product_id == product_id
+    )
+
+    if platform:
+        query = query.where(Review.platform == platform)
+
+    if cursor:
+        fetched_at, review_id = decode_review_cursor(cursor)
+        query = query.where(tuple_(Review.fetched_at, Review.id) < tuple_(fetched_at, review_id))
+
+    return query.order_by(Review.fetched_at.desc(), Review.id.desc())
+
+
+def review_row_to_dict(row) -> Dict[str, Any]:
+    return {column.key: getattr(row, column.key) for column in REVIEW_EXPORT_COLUMNS}
+
+
+def history_bucket_expression(granularity: str, dialect: str):
+    """SQL start of the hour or day containing each snapshot (used to backfill rollups)."""
+    created_at = SentimentSnapshot.created_at
+    if dialect == "postgresql":
+        return func.date_trunc(granularity, created_at)
+    if granularity == "hour":
+        return func.strftime("%Y-%m-%d %H:00:00", created_at)
+    return func.date(created_at)
+
+
+def bucket_floor(moment: datetime, bucket: str) -> datetime:
+    """Start of the hour, day or week (weeks start Monday) containing `moment`."""
+    if bucket == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def totals_to_state(total: SentimentTotal) -> AggregateState:
+    return AggregateState.from_dict({
+        "breakdown": {
+            "positive": total.positive_count or 0,
+            "negative": total.negative_count or 0,
+            "neutral": total.neutral_count or 0
+        },
+        "compound_sum": total.compound_sum or 0.0,
+        "keywords": total.keywords
+    })
+
+
+def snapshot_to_history_point(snapshot: SentimentSnapshot) -> Dict[str, Any]:
+    return {
+        "platform": snapshot.platform or "Combined",
+        "overall": snapshot.overall_sentiment,
+        "average_score": snapshot.average_score,
+        "breakdown": {
+            "positive": snapshot.positive_count,
+            "negative": snapshot.negative_count,
+            "neutral": snapshot.neutral_count
+        },
+        "total_reviews": snapshot.total_reviews,
+        "timestamp": snapshot.created_at.isoformat()
+    }
+
+
+@instrument_methods(DB_SECONDS)
+@tracer.trace_methods("db")
 class DatabaseService:
     def __init__(self, db: Session):
         self.db = db
@@ -23,7 +153,11 @@ class DatabaseService:
         product_hunt_slug: Optional[str] = None,
         reddit_subreddit: Optional[str] = None
     ) -> Product:
-        """Get existing product or create a new one."""
+        """Get existing product or create a new one.
+
+        Like the other write methods this only flushes; the caller commits
+        (see save_scan).
+        """
         name = name.strip().lower()
         product = self.db.query(Product).filter(Product.name == name).first()
 
@@ -37,8 +171,8 @@ class DatabaseService:
                 reddit_subreddit=reddit_subreddit
             )
             self.db.add(product)
-            self.db.commit()
-            self.db.refresh(product)
+            # Flush to get product.id without ending the transaction
+            self.db.flush()
         else:
             # Update source IDs if provided
             updated = False
@@ -60,8 +194,6 @@ class DatabaseService:
 
             if updated:
                 product.updated_at = datetime.utcnow()
-                self.db.commit()
-                self.db.refresh(product)
 
         return product
 
@@ -70,54 +202,124 @@ class DatabaseService:
         name = name.strip().lower()
         return self.db.query(Product).filter(Product.name == name).first()
 
+    # Scan schedule operations (each commits, as the scheduler runs outside any scan)
+    def set_scan_schedule(
+        self,
+        name: str,
+        interval_minutes: Optional[int],
+        next_scan_at: Optional[datetime]
+    ) -> Optional[Product]:
+        """Set or clear (interval None) a product's recurring scan interval."""
+        product = self.get_product_by_name(name)
+        if product:
+            product.scan_interval_minutes = interval_minutes
+            product.next_scan_at = next_scan_at if interval_minutes else None
+            self.db.commit()
+        return product
+
+    def get_due_products(self, now: datetime, limit: Optional[int] = None) -> List[Product]:
+        """Scheduled products whose next scan is due, most overdue first."""
+        return self.db.query(Product).filter(
+            and_(
+                Product.scan_interval_minutes.is_not(None),
+                Product.next_scan_at <= now
+            )
+        ).order_by(Product.next_scan_at).limit(limit).all()
+
+    def set_next_scan(self, product_id: int, next_scan_at: datetime) -> None:
+        self.db.query(Product).filter(Product.id == product_id).update(
+            {Product.next_scan_at: next_scan_at}, synchronize_session=False
+        )
+        self.db.commit()
+
     # Review operations
+    def _dialect_insert(self, model):
+        """INSERT supporting ON CONFLICT clauses, for the bound dialect."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql_insert(model)
+        return sqlite_insert(model)
+
+    def _insert_ignoring_duplicates(self, model, index_elements: List[str]):
+        """INSERT that skips rows conflicting with a unique index."""
+        return self._dialect_insert(model).on_conflict_do_nothing(index_elements=index_elements)
+
+    def _existing_external_ids(self, product_id: int, platform: str, external_ids: List[str]) -> Set[str]:
+        existing = set()
+        for i in range(0, len(external_ids), LOOKUP_CHUNK_SIZE):
+            chunk = external_ids[i:i + LOOKUP_CHUNK_SIZE]
+            existing.update(
+                external_id for (external_id,) in self.db.query(Review.external_id).filter(
+                    and_(
+                        Review.product_id == product_id,
+                        Review.platform == platform,
+                        Review.external_id.in_(chunk)
+                    )
+                )
+            )
+        return existing
+
     def save_reviews(
         self,
         product_id: int,
         platform: str,
         reviews_data: List[Dict[str, Any]]
-    ) -> List[Review]:
-        """Save reviews to database, avoiding duplicates."""
-        saved_reviews = []
+    ) -> List[Dict[str, Any]]:
+        """Save reviews to database, avoiding duplicates.
 
+        One lookup per chunk of ids finds reviews already stored, and the rest
+        go in with a single bulk INSERT that also ignores conflicts on the
+        (product_id, platform, external_id) unique index. Returns the review
+        dicts this call actually inserted (RETURNING, so a concurrent scan
+        that stored some of them first is not double counted). Not committed.
+        """
+        incoming: Dict[str, Dict[str, Any]] = {}
         for r in reviews_data:
-            external_id = str(r.get("id", ""))
-
-            # Check if review already exists
-            existing = self.db.query(Review).filter(
-                and_(
-                    Review.product_id == product_id,
-                    Review.external_id == external_id,
-                    Review.platform == platform
-                )
-            ).first()
+            incoming.setdefault(str(r.get("id", "")), r)
 
-            if existing:
-                continue
+        with tracer.span("db.dedup_lookup", platform=platform, ids=len(incoming)) as span:
+            existing = self._existing_external_ids(product_id, platform, list(incoming))
+            if span:
+                span.set(existing=len(existing))
+        new_reviews = [r for external_id, r in incoming.items() if external_id not in existing]
 
-            # Analyze sentiment
+        # Sources list newest first; insert oldest first so ids grow with recency
+        fetched_at = datetime.utcnow()
+        rows = []
+        for r in reversed(new_reviews):
+            # Reuse the score computed during analysis when available
             comment = r.get("comment", "")
-            sentiment = sentiment_analyzer.analyze_text(comment)
-
-            review = Review(
-                product_id=product_id,
-                external_id=external_id,
-                platform=platform,
-                user=r.get("user", "Anonymous"),
-                rating=r.get("rating"),
-                comment=comment,
-                review_date=r.get("date", ""),
-                likes=r.get("likes", 0),
-                sentiment_score=sentiment["compound"],
-                sentiment_label=sentiment_analyzer.get_sentiment_label(sentiment["compound"])
-            )
-            self.db.add(review)
-            saved_reviews.append(review)
+            compound = r.get("sentiment_score")
+            if compound is None:
+                compound = r["sentiment_score"] = sentiment_analyzer.analyze_text(comment)["compound"]
 
-        if saved_reviews:
-            self.db.commit()
+            rows.append({
+                "product_id": product_id,
+                "external_id": str(r.get("id", "")),
+                "platform": platform,
+                "user": r.get("user", "Anonymous"),
+                "rating": r.get("rating"),
+                "comment": comment,
+                "review_date": r.get("date", ""),
+                "likes": r.get("likes", 0),
+                "sentiment_score": compound,
+                "sentiment_label": sentiment_analyzer.get_sentiment_label(compound),
+                "fetched_at": fetched_at
+            })
+
+        inserted: Set[str] = set()
+        if rows:
+            # A concurrent scan can insert some of these first; RETURNING reports only the rows written here
+            result = self.db.execute(
+                self._insert_ignoring_duplicates(Review, ["product_id", "platform", "external_id"])
+                .returning(Review.external_id),
+                rows
+            )
+            inserted = set(result.scalars())
+            new_reviews = [r for r in new_reviews if str(r.get("id", "")) in inserted]
 
-        return saved_reviews
+        REVIEWS_DEDUPLICATED.inc(len(reviews_data) - len(inserted), platform=platform)
+        REVIEWS_INSERTED.inc(len(inserted), platform=platform)
+        return new_reviews
 
     def get_reviews(
         self,
@@ -133,6 +335,23 @@ class DatabaseService:
 
         return query.order_by(Review.fetched_at.desc()).limit(limit).all()
 
+    def get_reviews_page(
+        self,
+        product_id: int,
+        platform: Optional[str] = None,
+        limit: int = DEFAULT_REVIEW_COUNT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """One keyset page of stored reviews plus the cursor for the next page (None at the end)."""
+        rows = self.db.execute(build_reviews_query(product_id, platform, cursor).limit(limit + 1)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_review_cursor(last.fetched_at, last.row_id)
+
+        return [review_row_to_dict(row) for row in rows[:limit]], next_cursor
+
     # Sentiment snapshot operations
     def save_sentiment_snapshot(
         self,
@@ -140,7 +359,7 @@ class DatabaseService:
         platform: Optional[str],
         sentiment_data: Dict[str, Any]
     ) -> SentimentSnapshot:
-        """Save a sentiment analysis snapshot."""
+        """Save a sentiment analysis snapshot (not committed)."""
         snapshot = SentimentSnapshot(
             product_id=product_id,
             platform=platform,
@@ -150,13 +369,251 @@ class DatabaseService:
             negative_count=sentiment_data.get("breakdown", {}).get("negative", 0),
             neutral_count=sentiment_data.get("breakdown", {}).get("neutral", 0),
             total_reviews=sum(sentiment_data.get("breakdown", {}).values()),
-            keywords=sentiment_data.get("keywords", [])
+            keywords=sentiment_data.get("keywords", []),
+            created_at=datetime.utcnow()
         )
         self.db.add(snapshot)
-        self.db.commit()
-        self.db.refresh(snapshot)
+        self._add_to_rollups(snapshot)
         return snapshot
 
+    # Rollup operations
+    def _add_to_rollups(self, snapshot: SentimentSnapshot) -> None:
+        """Add one snapshot to its hour and day rollup rows (upsert, not committed)."""
+        total = snapshot.total_reviews or 0
+        rows = [
+            {
+                "product_id": snapshot.product_id,
+                "platform": snapshot.platform or COMBINED_PLATFORM,
+                "granularity": granularity,
+                "bucket_start": bucket_floor(snapshot.created_at, granularity),
+                "snapshot_count": 1,
+                "total_reviews": total,
+                "positive_count": snapshot.positive_count or 0,
+                "negative_count": snapshot.negative_count or 0,
+                "neutral_count": snapshot.neutral_count or 0,
+                "score_sum": snapshot.average_score * total,
+                "average_score_sum": snapshot.average_score,
+            }
+            for granularity in ROLLUP_GRANULARITIES
+        ]
+
+        stmt = self._dialect_insert(SentimentRollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["product_id", "granularity", "bucket_start", "platform"],
+            set_={
+                column: getattr(SentimentRollup, column) + getattr(stmt.excluded, column)
+                for column in ROLLUP_SUM_COLUMNS
+            }
+        )
+        self.db.execute(stmt, rows)
+
+    def rebuild_rollups(self, product_id: Optional[int] = None) -> int:
+        """Recompute sentiment_rollups from the stored snapshots and commit.
+
+        Covers one product or, by default, all of them. Returns the number of
+        rollup rows written.
+        """
+        dialect = self.db.get_bind().dialect.name
+        try:
+            delete_query = self.db.query(SentimentRollup)
+            if product_id is not None:
+                delete_query = delete_query.filter(SentimentRollup.product_id == product_id)
+            delete_query.delete(synchronize_session=False)
+
+            rows = []
+            for granularity in ROLLUP_GRANULARITIES:
+                bucket_start = history_bucket_expression(granularity, dialect).label("bucket_start")
+                query = select(
+                    SentimentSnapshot.product_id,
+                    SentimentSnapshot.platform,
+                    bucket_start,
+                    func.count(SentimentSnapshot.id).label("snapshot_count"),
+                    func.sum(SentimentSnapshot.total_reviews).label("total_reviews"),
+                    func.sum(SentimentSnapshot.positive_count).label("positive_count"),
+                    func.sum(SentimentSnapshot.negative_count).label("negative_count"),
+                    func.sum(SentimentSnapshot.neutral_count).label("neutral_count"),
+                    func.sum(
+                        SentimentSnapshot.average_score * func.coalesce(SentimentSnapshot.total_reviews, 0)
+                    ).label("score_sum"),
+                    func.sum(SentimentSnapshot.average_score).label("average_score_sum"),
+                ).where(SentimentSnapshot.created_at.is_not(None))
+                if product_id is not None:
+                    query = query.where(SentimentSnapshot.product_id == product_id)
+                query = query.group_by(SentimentSnapshot.product_id, SentimentSnapshot.platform, bucket_start)
+
+                for row in self.db.execute(query):
+                    start = row.bucket_start
+                    if isinstance(start, str):
+                        start = datetime.fromisoformat(start)
+                    rows.append({
+                        "product_id": row.product_id,
+                        "platform": row.platform or COMBINED_PLATFORM,
+                        "granularity": granularity,
+                        "bucket_start": start,
+                        **{column: getattr(row, column) or 0 for column in ROLLUP_SUM_COLUMNS},
+                    })
+
+            if rows:
+                self.db.execute(SentimentRollup.__table__.insert(), rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return len(rows)
+
+    # All-time sentiment totals
+    def add_to_sentiment_totals(self, product_id: int, platform: str, state: AggregateState) -> None:
+        """Merge an aggregate of newly stored reviews into a platform's totals (not committed)."""
+        if not state.total:
+            return
+        total = self.db.query(SentimentTotal).filter(
+            and_(SentimentTotal.product_id == product_id, SentimentTotal.platform == platform)
+        ).first()
+        if total is None:
+            total = SentimentTotal(product_id=product_id, platform=platform)
+            self.db.add(total)
+
+        merged = totals_to_state(total).merge(state)
+        total.positive_count = merged.breakdown["positive"]
+        total.negative_count = merged.breakdown["negative"]
+        total.neutral_count = merged.breakdown["neutral"]
+        total.compound_sum = merged.compound_sum
+        total.keywords = merged.keywords.to_dict()
+
+    def get_sentiment_totals(self, product_id: int) -> Dict[str, AggregateState]:
+        """All-time aggregate state by platform ("Combined" for every platform)."""
+        return {
+            total.platform: totals_to_state(total)
+            for total in self.db.query(SentimentTotal).filter(SentimentTotal.product_id == product_id)
+        }
+
+    def rebuild_sentiment_totals(self, product_id: Optional[int] = None) -> int:
+        """Recompute sentiment_totals from every stored review and commit.
+
+        Covers one product or, by default, all of them. Returns the number of
+        totals rows written.
+        """
+        try:
+            delete_query = self.db.query(SentimentTotal)
+            if product_id is not None:
+                delete_query = delete_query.filter(SentimentTotal.product_id == product_id)
+            delete_query.delete(synchronize_session=False)
+
+            query = select(Review.product_id, Review.platform, Review.comment, Review.sentiment_score)
+            if product_id is not None:
+                query = query.where(Review.product_id == product_id)
+            query = query.order_by(Review.product_id, Review.id).execution_options(yield_per=STREAM_BATCH_SIZE)
+
+            states: Dict[Tuple[int, str], AggregateState] = {}
+            for row in self.db.execute(query):
+                if not row.comment:
+                    continue
+                score = row.sentiment_score
+                if score is None:
+                    score = sentiment_analyzer.analyze_text(row.comment)["compound"]
+                tokens = tokenize(row.comment)
+                for platform in (row.platform, COMBINED_PLATFORM):
+                    key = (row.product_id, platform)
+                    if key not in states:
+                        states[key] = AggregateState()
+                    states[key].add(score, tokens)
+
+            for (total_product_id, platform), state in states.items():
+                self.add_to_sentiment_totals(total_product_id, platform, state)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return len(states)
+
+    # Incremental scan watermarks
+    def get_watermarks(self, product_id: int, identifiers: Dict[str, str]) -> Dict[str, Watermark]:
+        """Watermarks by platform, for platforms still scanned with the same identifier."""
+        watermarks = {}
+        for row in self.db.query(SourceWatermark).filter(SourceWatermark.product_id == product_id):
+            if identifiers.get(row.platform) == row.identifier:
+                watermarks[row.platform] = Watermark(
+                    ids=row.latest_ids or [],
+                    date=row.latest_date or "",
+                    cursor=row.cursor
+                )
+        return watermarks
+
+    def save_watermark(self, product_id: int, source: Dict[str, Any]) -> SourceWatermark:
+        """Advance a platform's watermark past the reviews a scan fetched (not committed).
+
+        `source` is a processed source payload; its first `new_reviews` reviews
+        are the ones fetched from the platform, newest first.
+        """
+        watermark = self.db.query(SourceWatermark).filter(
+            and_(
+                SourceWatermark.product_id == product_id,
+                SourceWatermark.platform == source["platform"]
+            )
+        ).first()
+        if watermark is None:
+            watermark = SourceWatermark(product_id=product_id, platform=source["platform"])
+            self.db.add(watermark)
+        if watermark.identifier != source["identifier"]:
+            # A different app/video/subreddit starts from scratch
+            watermark.identifier = source["identifier"]
+            watermark.latest_ids, watermark.latest_date, watermark.cursor = [], "", None
+
+        fetched = source["reviews"][:source.get("new_reviews", len(source["reviews"]))]
+        ids = [str(r.get("id", "")) for r in fetched] + (watermark.latest_ids or [])
+        watermark.latest_ids = list(dict.fromkeys(ids))[:WATERMARK_ID_COUNT]
+        watermark.latest_date = max(
+            [r["date"] for r in fetched if r.get("date")] + [watermark.latest_date or ""]
+        )
+        watermark.cursor = source.get("cursor") or watermark.cursor
+        return watermark
+
+    # Scan persistence
+    def save_scan(
+        self,
+        name: str,
+        product_ids: Dict[str, Optional[str]],
+        sources: List[Dict[str, Any]],
+        combined: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Persist one scan as a single transaction and return the product id.
+
+        `product_ids` are the get_or_create_product source id kwargs, and
+        `sources` are processed source payloads (platform, reviews, sentiment)
+        for sources that succeeded. Everything, including each source's
+        watermark, is committed together, so a failure part way through leaves
+        no partial reviews or snapshots.
+        """
+        try:
+            product = self.get_or_create_product(name, **product_ids)
+            product.last_scan_at = datetime.utcnow()
+            # Read before commit; expired attributes would cost a refresh query
+            product_id = product.id
+
+            # All-time totals only ever see reviews stored for the first time
+            combined_new = AggregateState()
+            for source in sources:
+                new_reviews = self.save_reviews(product_id, source["platform"], source["reviews"])
+                self.save_sentiment_snapshot(product_id, source["platform"], source["sentiment"])
+                self.save_watermark(product_id, source)
+
+                source_new = AggregateState().add_reviews(new_reviews)
+                self.add_to_sentiment_totals(product_id, source["platform"], source_new)
+                combined_new.merge(source_new)
+            self.add_to_sentiment_totals(product_id, COMBINED_PLATFORM, combined_new)
+
+            if combined:
+                self.save_sentiment_snapshot(product_id, None, combined)
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return product_id
+
     def get_sentiment_history(
         self,
         product_id: int,
@@ -177,3 +634,180 @@ class DatabaseService:
             query = query.filter(SentimentSnapshot.platform == platform)
 
         return query.order_by(SentimentSnapshot.created_at.desc()).all()
+
+    def get_sentiment_history_buckets(
+        self,
+        product_id: int,
+        bucket: str,
+        platform: Optional[str] = None,
+        days: int = 30
+    ) -> List[Dict[str, Any]]:
+        """Sentiment history per platform and hour/day/week bucket, newest first.
+
+        Reads the precomputed sentiment_rollups rows rather than the snapshots;
+        week buckets are summed from day rollups. The average score is
+        weighted by each snapshot's review count.
+        """
+        granularity = "day" if bucket == "week" else bucket
+        cutoff = bucket_floor(datetime.utcnow() - timedelta(days=days), bucket)
+
+        query = self.db.query(SentimentRollup).filter(
+            and_(
+                SentimentRollup.product_id == product_id,
+                SentimentRollup.granularity == granularity,
+                SentimentRollup.bucket_start >= cutoff
+            )
+        )
+
+        if platform is not None:
+            query = query.filter(SentimentRollup.platform == platform)
+
+        buckets: Dict[Tuple[datetime, str], Dict[str, float]] = {}
+        for rollup in query:
+            key = (bucket_floor(rollup.bucket_start, bucket), rollup.platform)
+            sums = buckets.setdefault(key, dict.fromkeys(ROLLUP_SUM_COLUMNS, 0))
+            for column in ROLLUP_SUM_COLUMNS:
+                sums[column] += getattr(rollup, column)
+
+        ordered = sorted(buckets.items(), key=lambda item: item[0][1])
+        ordered.sort(key=lambda item: item[0][0], reverse=True)
+
+        points = []
+        for (start, bucket_platform), sums in ordered:
+            total = sums["total_reviews"]
+            # Snapshots with no reviews carry no weight; fall back to the plain mean
+            score = sums["score_sum"] / total if total else sums["average_score_sum"] / sums["snapshot_count"]
+            points.append({
+                "platform": bucket_platform,
+                "overall": sentiment_analyzer.get_sentiment_label(score),
+                "average_score": round(score, 3),
+                "breakdown": {
+                    "positive": sums["positive_count"],
+                    "negative": sums["negative_count"],
+                    "neutral": sums["neutral_count"]
+                },
+                "total_reviews": total,
+                "timestamp": start.isoformat(),
+                "snapshots": sums["snapshot_count"]
+            })
+        return points
+
+
+class AsyncDatabaseService:
+    """Async facade over DatabaseService for the API endpoints.
+
+    Each call runs the sync implementation on a database thread (see
+    run_in_db_thread), so queries, ORM flushes and the Python work around
+    them (e.g. aggregating a scan in save_scan) stay off the event loop
+    thread. Calls on one instance must be awaited one at a time, since they
+    share a Session.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def _run(self, operation: Callable[[DatabaseService], T]) -> T:
+        return await run_in_db_thread(operation, DatabaseService(self.db))
+
+    async def get_product_by_name(self, name: str) -> Optional[Product]:
+        return await self._run(lambda service: service.get_product_by_name(name))
+
+    async def set_scan_schedule(
+        self,
+        name: str,
+        interval_minutes: Optional[int],
+        next_scan_at: Optional[datetime]
+    ) -> Optional[Product]:
+        return await self._run(lambda service: service.set_scan_schedule(name, interval_minutes, next_scan_at))
+
+    async def get_due_products(self, now: datetime, limit: Optional[int] = None) -> List[Product]:
+        return await self._run(lambda service: service.get_due_products(now, limit))
+
+    async def set_next_scan(self, product_id: int, next_scan_at: datetime) -> None:
+        await self._run(lambda service: service.set_next_scan(product_id, next_scan_at))
+
+    async def get_reviews(
+        self,
+        product_id: int,
+        platform: Optional[str] = None,
+        limit: int = DEFAULT_REVIEW_COUNT
+    ) -> List[Review]:
+        return await self._run(lambda service: service.get_reviews(product_id, platform=platform, limit=limit))
+
+    async def get_reviews_page(
+        self,
+        product_id: int,
+        platform: Optional[str] = None,
+        limit: int = DEFAULT_REVIEW_COUNT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return await self._run(
+            lambda service: service.get_reviews_page(product_id, platform=platform, limit=limit, cursor=cursor)
+        )
+
+    async def stream_reviews(
+        self,
+        product_id: int,
+        platform: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every matching review from a server-side cursor, in page order.
+
+        Rows arrive in batches of STREAM_BATCH_SIZE, so memory stays constant
+        however many reviews the product has.
+        """
+        query = build_reviews_query(product_id, platform, cursor).execution_options(
+            yield_per=STREAM_BATCH_SIZE
+        )
+        result = await run_in_db_thread(self.db.execute, query)
+        try:
+            while True:
+                rows = await run_in_db_thread(result.fetchmany, STREAM_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield review_row_to_dict(row)
+        finally:
+            await run_in_db_thread(result.close)
+
+    async def get_sentiment_history(
+        self,
+        product_id: int,
+        platform: Optional[str] = None,
+        days: int = 30
+    ) -> List[SentimentSnapshot]:
+        return await self._run(
+            lambda service: service.get_sentiment_history(product_id, platform=platform, days=days)
+        )
+
+    async def get_sentiment_history_buckets(
+        self,
+        product_id: int,
+        bucket: str,
+        platform: Optional[str] = None,
+        days: int = 30
+    ) -> List[Dict[str, Any]]:
+        return await self._run(
+            lambda service: service.get_sentiment_history_buckets(product_id, bucket, platform=platform, days=days)
+        )
+
+    async def get_sentiment_totals(self, product_id: int) -> Dict[str, AggregateState]:
+        return await self._run(lambda service: service.get_sentiment_totals(product_id))
+
+    async def get_watermarks(self, product_id: int, identifiers: Dict[str, str]) -> Dict[str, Watermark]:
+        return await self._run(lambda service: service.get_watermarks(product_id, identifiers))
+
+    async def save_scan(
+        self,
+        name: str,
+        product_ids: Dict[str, Optional[str]],
+        sources: List[Dict[str, Any]],
+        combined: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return await self._run(lambda service: service.save_scan(name, product_ids, sources, combined))
+
+
+async def get_async_db() -> AsyncIterator[AsyncDatabaseService]:
+    """AsyncDatabaseService over a request-scoped session (used by the API endpoints)."""
+    async with session_scope() as db:
+        yield AsyncDatabaseService(db)
@@ -1,18 +1,33 @@
 # FastAPI backend for Perception Scanner
+import asyncio
 import os
+import json
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 # Load .env file before anything else uses os.getenv()
 load_dotenv()
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
-from sqlalchemy.orm import Session
-
-from config import DEFAULT_REVIEW_COUNT
-from database import init_db, get_db, DatabaseService
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from config import (
+    DEFAULT_REVIEW_COUNT,
+    MAX_PAGE_SIZE,
+    MAX_HISTORY_DAYS,
+    HISTORY_MAX_POINTS,
+    SCHEDULER_ENABLED,
+    METRICS_ENABLED,
+    MIN_SCAN_INTERVAL_MINUTES,
+)
+from database import init_db, get_async_db, AsyncDatabaseService
+from database.connection import engine, run_in_db_thread, session_scope
+from database.models import Product
+from database.service import decode_review_cursor, snapshot_to_history_point, COMBINED_PLATFORM
 from services.sources import (
     GooglePlaySource,
     IOSAppStoreSource,
@@ -21,11 +36,41 @@ from services.sources import (
     RedditSource
 )
 from services.sentiment import sentiment_analyzer
+from services.aggregate import AggregateState
+from services.scanner import iter_source_results, SourceJob
+from services.jobs import job_manager, ScanJob, QueueFullError, ScanFailedError, COMPLETED
+from services.scan_cache import scan_cache, make_key, ttl_for
+from services.scheduler import scheduler, first_run
+from services.http import http_client
+from services.rate_limit import rate_limiter
+from services.metrics import registry as metrics_registry
+from services.tracing import tracer
+from services.downsample import lttb
 
 # Initialize database
 init_db()
 
-app = FastAPI(title="Perception Scanner")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources on startup and release them on shutdown."""
+    await http_client.start()
+    await job_manager.start()
+    if sentiment_analyzer.uses_pool:
+        # Spawning workers takes about a second; pay it at startup rather than in the first scan
+        await asyncio.get_running_loop().run_in_executor(None, sentiment_analyzer.warm_up)
+    if SCHEDULER_ENABLED:
+        await scheduler.start(submit_product_scan)
+    yield
+    await scheduler.stop()
+    await job_manager.stop()
+    await http_client.close()
+    await run_in_db_thread(engine.dispose)
+    sentiment_analyzer.shutdown()
+    tracer.shutdown()
+
+
+app = FastAPI(title="Perception Scanner", lifespan=lifespan)
 
 # Initialize sources
 google_play_source = GooglePlaySource()
@@ -34,6 +79,15 @@ youtube_source = YouTubeSource()
 product_hunt_source = ProductHuntSource()
 reddit_source = RedditSource()
 
+# Request field -> source, in the order results appear in responses
+SOURCE_REGISTRY = [
+    ("google_play_app", google_play_source),
+    ("ios_app", ios_app_store_source),
+    ("youtube_video", youtube_source),
+    ("product_hunt_product", product_hunt_source),
+    ("reddit_subreddit", reddit_source),
+]
+
 # Allow frontend to call API (CORS)
 cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
 app.add_middleware(
@@ -42,9 +96,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Cache", "X-Trace-Id", "traceparent"],
 )
 
 
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """Root span per request; the trace id goes back in X-Trace-Id and traceparent headers."""
+    with tracer.span(
+        f"{request.method} {request.url.path}",
+        traceparent=request.headers.get("traceparent"),
+        method=request.method,
+        path=request.url.path
+    ) as span:
+        response = await call_next(request)
+        if span:
+            span.set(status_code=response.status_code)
+            response.headers["X-Trace-Id"] = span.trace_id
+            response.headers["traceparent"] = span.traceparent
+        return response
+
+
 # Request body: which platform identifiers to scan
 class SourceConfig(BaseModel):
     youtube_video: Optional[str] = None
@@ -54,23 +126,54 @@ class SourceConfig(BaseModel):
     reddit_subreddit: Optional[str] = None
 
 
+class ScanScheduleRequest(BaseModel):
+    # None turns recurring scans off
+    interval_minutes: Optional[int] = Field(None, ge=MIN_SCAN_INTERVAL_MINUTES)
+
+
 class ProductReviewRequest(BaseModel):
     product_name: str
     sources: SourceConfig
-
-
-def process_source_result(source_result) -> dict:
-    """Process source result and add sentiment analysis."""
+    # Only fetch reviews newer than the last scan's, topping results up from the database
+    incremental: bool = True
+    # POST /api/reviews: run a new scan instead of returning a cached result
+    refresh: bool = False
+
+
+async def process_source_result(
+    source_result,
+    stored_reviews: Optional[List[Dict[str, Any]]] = None
+) -> Tuple[dict, AggregateState]:
+    """Process source result and add sentiment analysis.
+
+    `stored_reviews` (already scored) follow the fetched ones, so an
+    incremental result still covers the latest reviews. Also returns the
+    source's aggregate state so the combined sentiment is a merge rather
+    than a second pass over every review.
+    """
     reviews = [r.model_dump() for r in source_result.reviews]
-    sentiment = sentiment_analyzer.analyze_reviews(reviews)
-
-    return {
+    new_reviews = len(reviews)
+    average_rating = source_result.average_rating
+    if stored_reviews:
+        reviews.extend(stored_reviews)
+        ratings = [r["rating"] for r in reviews if r.get("rating") is not None]
+        if ratings:
+            average_rating = round(sum(ratings) / len(ratings), 2)
+
+    # Score each review once; aggregation, keywords and persistence reuse it.
+    # Both run off the event loop so other scans and requests keep being served
+    await sentiment_analyzer.score_reviews_async(reviews)
+    sentiment = await sentiment_analyzer.analyze_reviews_async(reviews)
+
+    processed = {
         "platform": source_result.platform,
         "identifier": source_result.identifier,
-        "average_rating": source_result.average_rating,
-        "total_reviews": source_result.total_reviews,
+        "average_rating": average_rating,
+        "total_reviews": max(source_result.total_reviews, len(reviews)),
+        "new_reviews": new_reviews,
         "reviews": reviews,
         "error": source_result.error,
+        "cursor": source_result.cursor,
         "sentiment": {
             "overall": sentiment["overall"],
             "breakdown": sentiment["breakdown"],
@@ -80,6 +183,22 @@ def process_source_result(source_result) -> dict:
             "keywords": sentiment["keywords"][:10]
         }
     }
+    return processed, sentiment["aggregate_state"]
+
+
+async def stored_reviews_for(
+    db_service: AsyncDatabaseService,
+    product_id: int,
+    source_result,
+    count: int
+) -> List[Dict[str, Any]]:
+    """Newest stored reviews that bring an incremental source result back up to `count`."""
+    missing = count - len(source_result.reviews)
+    if missing <= 0:
+        return []
+    fetched_ids = {r.id for r in source_result.reviews}
+    stored, _ = await db_service.get_reviews_page(product_id, source_result.platform, limit=count)
+    return [r for r in stored if r["id"] not in fetched_ids][:missing]
 
 
 @app.get("/api/health")
@@ -99,135 +218,110 @@ async def health_check():
                 "requires_key": True
             },
             "reddit": {"available": True, "requires_key": False},
-        }
+        },
+        "http": http_client.get_stats(),
+        "rate_limits": rate_limiter.get_stats(),
+        "jobs": job_manager.get_stats(),
+        "scan_cache": scan_cache.get_stats(),
+        "scheduler": scheduler.get_stats(),
+        "sentiment_cache": sentiment_analyzer.cache.get_stats()
     }
 
 
-@app.post("/api/reviews")
-async def get_reviews(request: ProductReviewRequest, db: Session = Depends(get_db)):
-    """Fetch reviews from configured sources and store in database."""
-    db_service = DatabaseService(db)
-
-    # Get or create product
-    product = db_service.get_or_create_product(
-        name=request.product_name,
-        google_play_id=request.sources.google_play_app,
-        ios_app_id=request.sources.ios_app,
-        youtube_video_id=request.sources.youtube_video,
-        product_hunt_slug=request.sources.product_hunt_product,
-        reddit_subreddit=request.sources.reddit_subreddit
-    )
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of the scan-path timers and counters."""
+    if not METRICS_ENABLED:
+        return PlainTextResponse("Metrics are disabled (METRICS_ENABLED=false)\n", status_code=404)
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+
+def scan_jobs(request: ProductReviewRequest) -> List[SourceJob]:
+    """(source, identifier) pairs for every platform configured in the request, in registry order."""
+    return [
+        (source, getattr(request.sources, field))
+        for field, source in SOURCE_REGISTRY
+        if getattr(request.sources, field)
+    ]
+
 
+async def run_scan(request: ProductReviewRequest, job: Optional[ScanJob] = None) -> dict:
+    """Fetch, analyze and store one scan; progress is reported on `job` when given."""
     result = {
         "product_name": request.product_name,
-        "product_id": product.id,
+        "product_id": None,
         "sources": [],
         "combined_sentiment": None,
         "errors": []
     }
 
-    all_reviews = []
-    count = DEFAULT_REVIEW_COUNT
-
-    # Google Play Store
-    if request.sources.google_play_app:
-        gplay_result = await google_play_source.fetch_reviews(
-            request.sources.google_play_app,
-            count=count
-        )
-        processed = process_source_result(gplay_result)
+    combined_state = AggregateState()
+    succeeded = []
+
+    def report(source_result) -> None:
+        if job:
+            job.update_source(
+                source_result.platform,
+                status="error" if source_result.error else "fetched",
+                reviews=len(source_result.reviews),
+                error=source_result.error
+            )
+
+    # Sessions are short-lived: none is held open while sources are fetched, which can take up
+    # to the scan deadline (on Postgres that would keep a pooled connection idle in transaction)
+    jobs = scan_jobs(request)
+    if job:
+        job.set_stage("fetching")
+
+    # Repeat scans resume from each platform's watermark instead of refetching everything
+    product = None
+    watermarks = {}
+    if request.incremental:
+        async with session_scope() as db:
+            db_service = AsyncDatabaseService(db)
+            product = await db_service.get_product_by_name(request.product_name)
+            if product:
+                watermarks = await db_service.get_watermarks(
+                    product.id, {source.platform_name: identifier for source, identifier in jobs}
+                )
+
+    # Fetch every configured source concurrently and process each one as soon as it finishes
+    processed_by_index = {}
+    async for index, source_result in iter_source_results(
+        jobs, count=DEFAULT_REVIEW_COUNT, watermarks=watermarks
+    ):
+        report(source_result)
+        with tracer.span("scan.process_source", platform=source_result.platform):
+            stored = []
+            if source_result.platform in watermarks and not source_result.error:
+                async with session_scope() as db:
+                    stored = await stored_reviews_for(
+                        AsyncDatabaseService(db), product.id, source_result, DEFAULT_REVIEW_COUNT
+                    )
+            processed, state = await process_source_result(source_result, stored)
+        processed_by_index[index] = (processed, state)
+        if job:
+            job.publish("source", processed)
+
+    if job:
+        job.set_stage("analyzing")
+    # The response lists sources in registry order, whatever order they finished in
+    for index in range(len(jobs)):
+        processed, state = processed_by_index[index]
         result["sources"].append(processed)
-
         if processed["error"]:
             result["errors"].append({
-                "platform": "Google Play Store",
+                "platform": processed["platform"],
                 "error": processed["error"]
             })
         else:
-            all_reviews.extend(processed["reviews"])
-            # Save to database
-            db_service.save_reviews(product.id, "Google Play Store", processed["reviews"])
-            db_service.save_sentiment_snapshot(product.id, "Google Play Store", processed["sentiment"])
-
-    # iOS App Store
-    if request.sources.ios_app:
-        ios_result = await ios_app_store_source.fetch_reviews(
-            request.sources.ios_app,
-            count=count
-        )
-        processed = process_source_result(ios_result)
-        result["sources"].append(processed)
+            combined_state.merge(state)
+            succeeded.append(processed)
 
-        if processed["error"]:
-            result["errors"].append({
-                "platform": "iOS App Store",
-                "error": processed["error"]
-            })
-        else:
-            all_reviews.extend(processed["reviews"])
-            db_service.save_reviews(product.id, "iOS App Store", processed["reviews"])
-            db_service.save_sentiment_snapshot(product.id, "iOS App Store", processed["sentiment"])
-
-    # YouTube
-    if request.sources.youtube_video:
-        yt_result = await youtube_source.fetch_reviews(
-            request.sources.youtube_video,
-            count=count
-        )
-        processed = process_source_result(yt_result)
-        result["sources"].append(processed)
-
-        if processed["error"]:
-            result["errors"].append({
-                "platform": "YouTube",
-                "error": processed["error"]
-            })
-        else:
-            all_reviews.extend(processed["reviews"])
-            db_service.save_reviews(product.id, "YouTube", processed["reviews"])
-            db_service.save_sentiment_snapshot(product.id, "YouTube", processed["sentiment"])
-
-    # Product Hunt
-    if request.sources.product_hunt_product:
-        ph_result = await product_hunt_source.fetch_reviews(
-            request.sources.product_hunt_product,
-            count=count
-        )
-        processed = process_source_result(ph_result)
-        result["sources"].append(processed)
-
-        if processed["error"]:
-            result["errors"].append({
-                "platform": "Product Hunt",
-                "error": processed["error"]
-            })
-        else:
-            all_reviews.extend(processed["reviews"])
-            db_service.save_reviews(product.id, "Product Hunt", processed["reviews"])
-            db_service.save_sentiment_snapshot(product.id, "Product Hunt", processed["sentiment"])
-
-    # Reddit
-    if request.sources.reddit_subreddit:
-        reddit_result = await reddit_source.fetch_reviews(
-            request.sources.reddit_subreddit,
-            count=count
-        )
-        processed = process_source_result(reddit_result)
-        result["sources"].append(processed)
-
-        if processed["error"]:
-            result["errors"].append({
-                "platform": "Reddit",
-                "error": processed["error"]
-            })
-        else:
-            all_reviews.extend(processed["reviews"])
-            db_service.save_reviews(product.id, "Reddit", processed["reviews"])
-            db_service.save_sentiment_snapshot(product.id, "Reddit", processed["sentiment"])
-
-    # Combined sentiment analysis
-    if all_reviews:
-        combined = sentiment_analyzer.analyze_reviews(all_reviews)
+    # Combined sentiment analysis, merged from the per-source states
+    combined = None
+    if any(processed["reviews"] for processed in succeeded):
+        combined = sentiment_analyzer.summarize(combined_state)
         result["combined_sentiment"] = {
             "overall": combined["overall"],
             "breakdown": combined["breakdown"],
@@ -236,75 +330,338 @@ async def get_reviews(request: ProductReviewRequest, db: Session = Depends(get_d
             "average_score": combined["average_score"],
             "keywords": combined["keywords"][:20]
         }
-        # Save combined sentiment snapshot
-        db_service.save_sentiment_snapshot(product.id, None, combined)
+    if job:
+        job.publish("combined", {
+            "combined_sentiment": result["combined_sentiment"],
+            "errors": result["errors"]
+        })
+
+    # Product, reviews and every snapshot are written in one transaction
+    if job:
+        job.set_stage("saving")
+    async with session_scope() as db:
+        result["product_id"] = await AsyncDatabaseService(db).save_scan(
+            request.product_name,
+            product_ids={
+                "google_play_id": request.sources.google_play_app,
+                "ios_app_id": request.sources.ios_app,
+                "youtube_video_id": request.sources.youtube_video,
+                "product_hunt_slug": request.sources.product_hunt_product,
+                "reddit_subreddit": request.sources.reddit_subreddit
+            },
+            sources=succeeded,
+            combined=combined
+        )
 
     return result
 
 
+async def submit_scan(request: ProductReviewRequest) -> ScanJob:
+    platforms = [source.platform_name for source, _ in scan_jobs(request)]
+    return await job_manager.submit(request.product_name, platforms, lambda job: run_scan(request, job))
+
+
+async def submit_product_scan(product: Product) -> ScanJob:
+    """Queue a scan of a stored product's saved source identifiers (used by the scheduler)."""
+    return await submit_scan(ProductReviewRequest(
+        product_name=product.name,
+        sources=SourceConfig(
+            google_play_app=product.google_play_id,
+            ios_app=product.ios_app_id,
+            youtube_video=product.youtube_video_id,
+            product_hunt_product=product.product_hunt_slug,
+            reddit_subreddit=product.reddit_subreddit
+        )
+    ))
+
+
+async def scan_and_wait(request: ProductReviewRequest) -> dict:
+    """Run a scan in the calling request; raises ScanFailedError if it fails.
+
+    Interactive scans don't wait for a MAX_CONCURRENT_SCANS worker, so a
+    dashboard request is never stuck behind background jobs; they still
+    share the per-platform rate limits and the database pool.
+    """
+    try:
+        return await run_scan(request)
+    except Exception as e:
+        raise ScanFailedError(str(e)) from e
+
+
+@app.post("/api/reviews")
+async def get_reviews(request: ProductReviewRequest, response: Response):
+    """Fetch reviews from configured sources and store in database.
+
+    The scan runs in this request rather than the background job queue,
+    so it doesn't count against MAX_CONCURRENT_SCANS. Results are cached
+    per product and sources (X-Cache: hit, stale, miss or coalesced) and
+    identical requests arriving during a scan wait for that scan. A cached
+    result can be up to the platforms' TTL old, plus SCAN_CACHE_STALE_SECONDS
+    while it refreshes; `"refresh": true` always runs a new scan (X-Cache:
+    bypass) and caches its result.
+    """
+    ttl = ttl_for(source.platform_name for source, _ in scan_jobs(request))
+    key = make_key(request.product_name, request.sources.model_dump())
+    try:
+        if request.refresh:
+            result, cache_status = await scan_and_wait(request), "bypass"
+            scan_cache.put(key, result, ttl)
+        else:
+            result, cache_status = await scan_cache.get_or_scan(key, ttl, lambda: scan_and_wait(request))
+    except (QueueFullError, ScanFailedError) as e:
+        return {"error": str(e)}
+
+    response.headers["X-Cache"] = cache_status
+    return result
+
+
+@app.post("/api/reviews/stream")
+async def stream_reviews(
+    request: ProductReviewRequest,
+    format: Literal["ndjson", "sse"] = "ndjson"
+):
+    """Run a scan and stream its results as they become available.
+
+    Emits a `source` event with each source's result as soon as that source
+    finishes, then `combined` (combined sentiment and errors), then `done`
+    with the product id once everything is saved, or `error` if the scan
+    failed. The finished result is cached for POST /api/reviews.
+    """
+    try:
+        job = await submit_scan(request)
+    except QueueFullError as e:
+        return {"error": str(e)}
+
+    async def scan_events():
+        async for event in job_manager.events(job):
+            yield event
+        if job.status == COMPLETED:
+            ttl = ttl_for(source.platform_name for source, _ in scan_jobs(request))
+            scan_cache.put(make_key(request.product_name, request.sources.model_dump()), job.result, ttl)
+            yield "done", {"job_id": job.id, "product_id": job.result["product_id"]}
+        else:
+            yield "error", {"job_id": job.id, "error": job.error or f"Scan {job.status}"}
+
+    if format == "sse":
+        async def sse():
+            async for event, data in scan_events():
+                yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+        return StreamingResponse(sse(), media_type="text/event-stream")
+
+    async def ndjson():
+        async for event, data in scan_events():
+            yield json.dumps({"event": event, "data": data}, default=str) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@app.post("/api/jobs")
+async def create_scan_job(request: ProductReviewRequest):
+    """Queue a scan in the background and return its job id for polling."""
+    try:
+        job = await submit_scan(request)
+    except QueueFullError as e:
+        return {"error": str(e)}
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/jobs/{job.id}",
+        "events_url": f"/api/jobs/{job.id}/events"
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_scan_job(job_id: str):
+    """Job status, per-source progress and, once completed, the scan result."""
+    job = job_manager.get(job_id)
+    if not job:
+        return {"error": f"Job '{job_id}' not found"}
+    return job.to_dict()
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_scan_job(job_id: str):
+    """Cancel a queued or running job."""
+    job = job_manager.get(job_id)
+    if not job:
+        return {"error": f"Job '{job_id}' not found"}
+    return {"job_id": job_id, "cancelled": job_manager.cancel(job_id)}
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_scan_job(job_id: str):
+    """Server-sent events with the job state after every change, ending when it finishes."""
+    job = job_manager.get(job_id)
+    if not job:
+        return {"error": f"Job '{job_id}' not found"}
+
+    async def events():
+        async for state in job_manager.watch(job):
+            yield f"data: {json.dumps(state, default=str)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def downsample_history(points: List[Dict[str, Any]], max_points: int) -> List[Dict[str, Any]]:
+    """LTTB-downsample each platform's series to at most max_points, keeping newest-first order."""
+    series: Dict[str, List[Dict[str, Any]]] = {}
+    for point in points:
+        series.setdefault(point["platform"], []).append(point)
+
+    kept = []
+    for platform_points in series.values():
+        platform_points.reverse()
+        kept.extend(lttb(
+            platform_points,
+            max_points,
+            x=lambda p: datetime.fromisoformat(p["timestamp"]).timestamp(),
+            y=lambda p: p["average_score"]
+        ))
+    kept.sort(key=lambda p: p["timestamp"], reverse=True)
+    return kept
+
+
 @app.get("/api/products/{product_name}/history")
-async def get_product_history(product_name: str, days: int = 30, db: Session = Depends(get_db)):
-    """Get sentiment history for a product."""
-    db_service = DatabaseService(db)
-    product = db_service.get_product_by_name(product_name)
+async def get_product_history(
+    product_name: str,
+    days: int = Query(30, ge=1, le=MAX_HISTORY_DAYS),
+    bucket: Optional[Literal["hour", "day", "week"]] = None,
+    max_points: Optional[int] = Query(None, ge=3, le=HISTORY_MAX_POINTS),
+    db_service: AsyncDatabaseService = Depends(get_async_db)
+):
+    """Get sentiment history for a product.
+
+    `bucket` aggregates snapshots per hour/day/week in SQL; each platform's
+    series is then capped at `max_points` (default HISTORY_MAX_POINTS).
+    """
+    product = await db_service.get_product_by_name(product_name)
 
     if not product:
         return {"error": f"Product '{product_name}' not found"}
 
-    history = db_service.get_sentiment_history(product.id, days=days)
+    if bucket:
+        history = await db_service.get_sentiment_history_buckets(product.id, bucket, days=days)
+    else:
+        snapshots = await db_service.get_sentiment_history(product.id, days=days)
+        history = [snapshot_to_history_point(s) for s in snapshots]
 
     return {
         "product_name": product_name,
-        "history": [
-            {
-                "platform": s.platform or "Combined",
-                "overall": s.overall_sentiment,
-                "average_score": s.average_score,
-                "breakdown": {
-                    "positive": s.positive_count,
-                    "negative": s.negative_count,
-                    "neutral": s.neutral_count
-                },
-                "total_reviews": s.total_reviews,
-                "timestamp": s.created_at.isoformat()
-            }
-            for s in history
+        "history": downsample_history(history, max_points or HISTORY_MAX_POINTS)
+    }
+
+
+@app.get("/api/products/{product_name}/summary")
+async def get_product_summary(product_name: str, db_service: AsyncDatabaseService = Depends(get_async_db)):
+    """All-time sentiment for a product, read from its running totals."""
+    product = await db_service.get_product_by_name(product_name)
+
+    if not product:
+        return {"error": f"Product '{product_name}' not found"}
+
+    totals = await db_service.get_sentiment_totals(product.id)
+    combined = totals.pop(COMBINED_PLATFORM, None)
+
+    def summary(state, top_n):
+        sentiment = sentiment_analyzer.summarize(state, top_n)
+        sentiment.pop("aggregate_state")
+        return sentiment
+
+    return {
+        "product_name": product_name,
+        "combined": summary(combined, 20) if combined else None,
+        "platforms": [
+            {"platform": platform, **summary(state, 10)}
+            for platform, state in sorted(totals.items())
         ]
     }
 
 
+def schedule_to_dict(product: Product) -> dict:
+    return {
+        "product_name": product.name,
+        "interval_minutes": product.scan_interval_minutes,
+        "next_scan_at": product.next_scan_at.isoformat() if product.next_scan_at else None,
+        "last_scan_at": product.last_scan_at.isoformat() if product.last_scan_at else None
+    }
+
+
+@app.get("/api/products/{product_name}/schedule")
+async def get_scan_schedule(product_name: str, db_service: AsyncDatabaseService = Depends(get_async_db)):
+    """Recurring scan interval and next/last scan times for a product."""
+    product = await db_service.get_product_by_name(product_name)
+    if not product:
+        return {"error": f"Product '{product_name}' not found"}
+    return schedule_to_dict(product)
+
+
+@app.put("/api/products/{product_name}/schedule")
+async def set_scan_schedule(
+    product_name: str,
+    request: ScanScheduleRequest,
+    db_service: AsyncDatabaseService = Depends(get_async_db)
+):
+    """Scan a product every `interval_minutes`, rescanning its stored source identifiers.
+
+    The first run is placed randomly within the first interval so products
+    scheduled together don't all scan at once.
+    """
+    interval = request.interval_minutes
+    next_scan_at = first_run(datetime.utcnow(), interval) if interval else None
+    product = await db_service.set_scan_schedule(product_name, interval, next_scan_at)
+    if not product:
+        return {"error": f"Product '{product_name}' not found"}
+    return schedule_to_dict(product)
+
+
 @app.get("/api/products/{product_name}/reviews")
 async def get_stored_reviews(
     product_name: str,
     platform: Optional[str] = None,
-    limit: int = DEFAULT_REVIEW_COUNT,
-    db: Session = Depends(get_db)
+    limit: int = Query(DEFAULT_REVIEW_COUNT, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    db_service: AsyncDatabaseService = Depends(get_async_db)
 ):
-    """Get stored reviews for a product."""
-    db_service = DatabaseService(db)
-    product = db_service.get_product_by_name(product_name)
+    """Get stored reviews for a product, newest first.
+
+    Pages are keyset-paginated: pass the returned `next_cursor` as `cursor`
+    to get the next page. With `stream=true` every review from `cursor`
+    onwards is streamed as NDJSON instead.
+    """
+    product = await db_service.get_product_by_name(product_name)
 
     if not product:
         return {"error": f"Product '{product_name}' not found"}
 
-    reviews = db_service.get_reviews(product.id, platform=platform, limit=limit)
+    if cursor:
+        try:
+            decode_review_cursor(cursor)
+        except ValueError as e:
+            return {"error": str(e)}
+
+    if stream:
+        product_id = product.id
+
+        async def ndjson_rows():
+            # The request's session is closed before the body is sent, so stream on our own
+            async with session_scope() as session:
+                async for row in AsyncDatabaseService(session).stream_reviews(product_id, platform, cursor):
+                    yield json.dumps(row) + "\n"
+
+        return StreamingResponse(ndjson_rows(), media_type="application/x-ndjson")
+
+    reviews, next_cursor = await db_service.get_reviews_page(
+        product.id, platform=platform, limit=limit, cursor=cursor
+    )
 
     return {
         "product_name": product_name,
         "total": len(reviews),
-        "reviews": [
-            {
-                "id": r.external_id,
-                "platform": r.platform,
-                "user": r.user,
-                "rating": r.rating,
-                "comment": r.comment,
-                "date": r.review_date,
-                "sentiment_score": r.sentiment_score,
-                "sentiment_label": r.sentiment_label
-            }
-            for r in reviews
-        ]
+        "reviews": reviews,
+        "next_cursor": next_cursor
     }
 
 
@@ -0,0 +1,43 @@
+# Alembic environment: migrates DATABASE_URL, or the connection handed over by init_db()
+from logging.config import fileConfig
+
+from alembic import context
+
+from database.connection import make_engine
+from database.models import Base
+
+config = context.config
+target_metadata = Base.metadata
+
+# init_db() passes its own connection; only the CLI sets up logging from alembic.ini
+connection = config.attributes.get("connection")
+if connection is None and config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+
+def run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite can only alter tables by copying them
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    context.configure(
+        url=str(make_engine().url),
+        target_metadata=target_metadata,
+        literal_binds=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+elif connection is not None:
+    run_migrations(connection)
+else:
+    engine = make_engine()
+    with engine.connect() as connection:
+        run_migrations(connection)
+    engine.dispose()
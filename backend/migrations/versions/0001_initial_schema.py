@@ -0,0 +1,82 @@
+"""initial schema: products, reviews, sentiment snapshots
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "products",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("google_play_id", sa.String(length=255), nullable=True),
+        sa.Column("ios_app_id", sa.String(length=255), nullable=True),
+        sa.Column("youtube_video_id", sa.String(length=255), nullable=True),
+        sa.Column("product_hunt_slug", sa.String(length=255), nullable=True),
+        sa.Column("reddit_subreddit", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_products_id", "products", ["id"])
+    op.create_index("ix_products_name", "products", ["name"])
+
+    op.create_table(
+        "reviews",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("external_id", sa.String(length=255), nullable=False),
+        sa.Column("platform", sa.String(length=50), nullable=False),
+        sa.Column("user", sa.String(length=255), nullable=True),
+        sa.Column("rating", sa.Float(), nullable=True),
+        sa.Column("comment", sa.Text(), nullable=True),
+        sa.Column("review_date", sa.String(length=50), nullable=True),
+        sa.Column("likes", sa.Integer(), nullable=True),
+        sa.Column("sentiment_score", sa.Float(), nullable=True),
+        sa.Column("sentiment_label", sa.String(length=20), nullable=True),
+        sa.Column("fetched_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_reviews_id", "reviews", ["id"])
+    op.create_index("ix_reviews_platform", "reviews", ["platform"])
+    op.create_index(
+        "ux_reviews_product_platform_external",
+        "reviews",
+        ["product_id", "platform", "external_id"],
+        unique=True,
+    )
+
+    op.create_table(
+        "sentiment_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("platform", sa.String(length=50), nullable=True),
+        sa.Column("overall_sentiment", sa.String(length=20), nullable=False),
+        sa.Column("average_score", sa.Float(), nullable=False),
+        sa.Column("positive_count", sa.Integer(), nullable=True),
+        sa.Column("negative_count", sa.Integer(), nullable=True),
+        sa.Column("neutral_count", sa.Integer(), nullable=True),
+        sa.Column("total_reviews", sa.Integer(), nullable=True),
+        sa.Column("keywords", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_sentiment_snapshots_id", "sentiment_snapshots", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("sentiment_snapshots")
+    op.drop_table("reviews")
+    op.drop_table("products")
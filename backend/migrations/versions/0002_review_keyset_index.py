@@ -0,0 +1,21 @@
+"""review keyset pagination index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_reviews_product_fetched", "reviews", ["product_id", "fetched_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reviews_product_fetched", table_name="reviews")
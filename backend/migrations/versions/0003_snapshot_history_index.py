@@ -0,0 +1,25 @@
+"""sentiment snapshot history index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_sentiment_snapshots_product_created",
+        "sentiment_snapshots",
+        ["product_id", "created_at", "platform"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sentiment_snapshots_product_created", table_name="sentiment_snapshots")
@@ -0,0 +1,117 @@
+"""sentiment rollups
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# Tables as they are at this revision, so the backfill never depends on the current models
+sentiment_snapshots = sa.table(
+    "sentiment_snapshots",
+    sa.column("id", sa.Integer()),
+    sa.column("product_id", sa.Integer()),
+    sa.column("platform", sa.String()),
+    sa.column("average_score", sa.Float()),
+    sa.column("positive_count", sa.Integer()),
+    sa.column("negative_count", sa.Integer()),
+    sa.column("neutral_count", sa.Integer()),
+    sa.column("total_reviews", sa.Integer()),
+    sa.column("created_at", sa.DateTime()),
+)
+sentiment_rollups = sa.table(
+    "sentiment_rollups",
+    sa.column("product_id", sa.Integer()),
+    sa.column("platform", sa.String()),
+    sa.column("granularity", sa.String()),
+    sa.column("bucket_start", sa.DateTime()),
+    sa.column("snapshot_count", sa.Integer()),
+    sa.column("total_reviews", sa.Integer()),
+    sa.column("positive_count", sa.Integer()),
+    sa.column("negative_count", sa.Integer()),
+    sa.column("neutral_count", sa.Integer()),
+    sa.column("score_sum", sa.Float()),
+    sa.column("average_score_sum", sa.Float()),
+)
+
+
+def sql_string(value: str):
+    # Inlined rather than bound: Postgres only matches GROUP BY expressions with identical parameters
+    return sa.literal_column(f"'{value}'")
+
+
+def bucket_start(granularity: str, dialect: str):
+    """Start of each snapshot's hour or day, stored the way the app writes DateTime values."""
+    created_at = sentiment_snapshots.c.created_at
+    if dialect == "postgresql":
+        return sa.func.date_trunc(sql_string(granularity), created_at)
+    if granularity == "hour":
+        return sa.func.strftime(sql_string("%Y-%m-%d %H:00:00.000000"), created_at)
+    return sa.func.strftime(sql_string("%Y-%m-%d 00:00:00.000000"), created_at)
+
+
+def backfill_rollups(dialect: str) -> None:
+    snapshots = sentiment_snapshots.c
+    for granularity in ("hour", "day"):
+        start = bucket_start(granularity, dialect)
+        platform = sa.func.coalesce(snapshots.platform, sql_string("Combined"))
+        query = sa.select(
+            snapshots.product_id,
+            platform,
+            sa.literal(granularity),
+            start,
+            sa.func.count(snapshots.id),
+            sa.func.coalesce(sa.func.sum(snapshots.total_reviews), 0),
+            sa.func.coalesce(sa.func.sum(snapshots.positive_count), 0),
+            sa.func.coalesce(sa.func.sum(snapshots.negative_count), 0),
+            sa.func.coalesce(sa.func.sum(snapshots.neutral_count), 0),
+            sa.func.coalesce(sa.func.sum(snapshots.average_score * sa.func.coalesce(snapshots.total_reviews, 0)), 0.0),
+            sa.func.coalesce(sa.func.sum(snapshots.average_score), 0.0),
+        ).where(snapshots.created_at.is_not(None)).group_by(snapshots.product_id, platform, start)
+        op.execute(sentiment_rollups.insert().from_select(
+            [
+                "product_id", "platform", "granularity", "bucket_start", "snapshot_count", "total_reviews",
+                "positive_count", "negative_count", "neutral_count", "score_sum", "average_score_sum",
+            ],
+            query
+        ))
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sentiment_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("platform", sa.String(length=50), nullable=False),
+        sa.Column("granularity", sa.String(length=10), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("snapshot_count", sa.Integer(), nullable=False),
+        sa.Column("total_reviews", sa.Integer(), nullable=False),
+        sa.Column("positive_count", sa.Integer(), nullable=False),
+        sa.Column("negative_count", sa.Integer(), nullable=False),
+        sa.Column("neutral_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("average_score_sum", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_sentiment_rollups_bucket",
+        "sentiment_rollups",
+        ["product_id", "granularity", "bucket_start", "platform"],
+        unique=True,
+    )
+
+    # Existing snapshots would otherwise be missing from bucketed history until a manual backfill
+    backfill_rollups(op.get_context().dialect.name)
+
+
+def downgrade() -> None:
+    op.drop_table("sentiment_rollups")
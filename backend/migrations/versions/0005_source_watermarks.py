@@ -0,0 +1,40 @@
+"""source watermarks for incremental scans
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "source_watermarks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("platform", sa.String(length=50), nullable=False),
+        sa.Column("identifier", sa.String(length=255), nullable=False),
+        sa.Column("latest_ids", sa.JSON(), nullable=True),
+        sa.Column("latest_date", sa.String(length=50), nullable=True),
+        sa.Column("cursor", sa.String(length=255), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_source_watermarks_product_platform",
+        "source_watermarks",
+        ["product_id", "platform"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("source_watermarks")
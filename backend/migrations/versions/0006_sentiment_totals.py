@@ -0,0 +1,153 @@
+"""all-time sentiment totals per product and platform
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+import re
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+# Tables as they are at this revision, so the backfill never depends on the current models
+reviews = sa.table(
+    "reviews",
+    sa.column("id", sa.Integer()),
+    sa.column("product_id", sa.Integer()),
+    sa.column("platform", sa.String()),
+    sa.column("comment", sa.Text()),
+    sa.column("sentiment_score", sa.Float()),
+)
+sentiment_totals = sa.table(
+    "sentiment_totals",
+    sa.column("product_id", sa.Integer()),
+    sa.column("platform", sa.String()),
+    sa.column("positive_count", sa.Integer()),
+    sa.column("negative_count", sa.Integer()),
+    sa.column("neutral_count", sa.Integer()),
+    sa.column("compound_sum", sa.Float()),
+    sa.column("keywords", sa.JSON()),
+    sa.column("updated_at", sa.DateTime()),
+)
+
+# Keyword tokenizing as of this revision (services/keywords.py)
+TOKEN_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "must", "shall", "can", "need",
+    "this", "that", "these", "those", "i", "you", "he", "she", "it",
+    "we", "they", "what", "which", "who", "whom", "whose", "where",
+    "when", "why", "how", "all", "each", "every", "both", "few", "more",
+    "most", "other", "some", "such", "no", "nor", "not", "only", "own",
+    "same", "so", "than", "too", "very", "just", "also", "now", "here",
+    "there", "then", "once", "if", "my", "your", "its", "our", "their",
+    "app", "use", "using", "used", "really", "much", "get", "got",
+    "one", "two", "first", "new", "even", "still", "well", "way", "many"
+})
+SCORE_SCALE = 10_000
+
+
+def scored_reviews():
+    # Every version of the app stores a score with each review; rows without one are skipped
+    r = reviews.c
+    return sa.and_(r.comment.is_not(None), r.comment != "", r.sentiment_score.is_not(None))
+
+
+def backfill_counts() -> None:
+    """Label counts and compound sums per platform and "Combined", in SQL."""
+    r = reviews.c
+    score = r.sentiment_score
+    now = sa.literal(datetime.utcnow(), sa.DateTime())
+    for platform, group_by in ((r.platform, (r.product_id, r.platform)), (sa.literal("Combined"), (r.product_id,))):
+        query = sa.select(
+            r.product_id,
+            platform,
+            sa.func.sum(sa.case((score >= 0.05, 1), else_=0)),
+            sa.func.sum(sa.case((score <= -0.05, 1), else_=0)),
+            sa.func.sum(sa.case((sa.and_(score > -0.05, score < 0.05), 1), else_=0)),
+            sa.func.sum(score),
+            now,
+        ).where(scored_reviews()).group_by(*group_by)
+        op.execute(sentiment_totals.insert().from_select(
+            ["product_id", "platform", "positive_count", "negative_count", "neutral_count", "compound_sum", "updated_at"],
+            query
+        ))
+
+
+def backfill_keywords() -> None:
+    """Per-word counts and score sums ({word: [count, score_sum]}), first-seen order."""
+    r = reviews.c
+    keywords: Dict[Tuple[int, str], Dict[str, List[int]]] = {}
+    query = sa.select(r.product_id, r.platform, r.comment, r.sentiment_score).where(
+        scored_reviews()
+    ).order_by(r.product_id, r.id)
+    for row in op.get_bind().execute(query.execution_options(yield_per=1000)):
+        units = round(row.sentiment_score * SCORE_SCALE)
+        words = [word for word in TOKEN_PATTERN.findall(row.comment.lower()) if word not in STOP_WORDS]
+        for platform in (row.platform, "Combined"):
+            counts = keywords.setdefault((row.product_id, platform), {})
+            for word in words:
+                entry = counts.setdefault(word, [0, 0])
+                entry[0] += 1
+                entry[1] += units
+
+    if keywords:
+        op.get_bind().execute(
+            sentiment_totals.update().where(
+                sa.and_(
+                    sentiment_totals.c.product_id == sa.bindparam("b_product_id"),
+                    sentiment_totals.c.platform == sa.bindparam("b_platform"),
+                )
+            ).values(keywords=sa.bindparam("b_keywords")),
+            [
+                {
+                    "b_product_id": product_id,
+                    "b_platform": platform,
+                    "b_keywords": {word: [count, score_sum / SCORE_SCALE] for word, (count, score_sum) in counts.items()},
+                }
+                for (product_id, platform), counts in keywords.items()
+            ]
+        )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sentiment_totals",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("platform", sa.String(length=50), nullable=False),
+        sa.Column("positive_count", sa.Integer(), nullable=False),
+        sa.Column("negative_count", sa.Integer(), nullable=False),
+        sa.Column("neutral_count", sa.Integer(), nullable=False),
+        sa.Column("compound_sum", sa.Float(), nullable=False),
+        sa.Column("keywords", sa.JSON(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_sentiment_totals_product_platform",
+        "sentiment_totals",
+        ["product_id", "platform"],
+        unique=True,
+    )
+
+    # Existing reviews would otherwise be missing from the summary until a manual backfill.
+    # Keywords need the rows in Python, so offline (--sql) upgrades leave them to database.backfill
+    backfill_counts()
+    if not context.is_offline_mode():
+        backfill_keywords()
+
+
+def downgrade() -> None:
+    op.drop_table("sentiment_totals")
@@ -0,0 +1,30 @@
+"""product scan schedule
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("products") as batch_op:
+        batch_op.add_column(sa.Column("scan_interval_minutes", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("next_scan_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("last_scan_at", sa.DateTime(), nullable=True))
+        batch_op.create_index("ix_products_next_scan_at", ["next_scan_at"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("products") as batch_op:
+        batch_op.drop_index("ix_products_next_scan_at")
+        batch_op.drop_column("last_scan_at")
+        batch_op.drop_column("next_scan_at")
+        batch_op.drop_column("scan_interval_minutes")
@@ -1,17 +1,20 @@
-from .sentiment import sentiment_analyzer
-from .sources import (
-    GooglePlaySource,
-    IOSAppStoreSource,
-    YouTubeSource,
-    ProductHuntSource,
-    RedditSource,
-)
+# Names are resolved on first use, so importing one submodule (e.g. in a spawned
+# sentiment worker) does not load VADER, the sources and their clients as well
+from importlib import import_module
 
-__all__ = [
-    "sentiment_analyzer",
-    "GooglePlaySource",
-    "IOSAppStoreSource",
-    "YouTubeSource",
-    "ProductHuntSource",
-    "RedditSource",
-]
+_EXPORTS = {
+    "sentiment_analyzer": ".sentiment",
+    "GooglePlaySource": ".sources",
+    "IOSAppStoreSource": ".sources",
+    "YouTubeSource": ".sources",
+    "ProductHuntSource": ".sources",
+    "RedditSource": ".sources",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
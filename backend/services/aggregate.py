@@ -0,0 +1,80 @@
+# Mergeable sentiment aggregates: label counts, compound sum and keyword accumulator
+from typing import Any, Dict, Iterable, List
+
+from .keywords import SCORE_SCALE, KeywordAccumulator, score_units, tokenize
+
+
+def sentiment_label(compound_score: float) -> str:
+    """Convert compound score to sentiment label."""
+    if compound_score >= 0.05:
+        return "positive"
+    elif compound_score <= -0.05:
+        return "negative"
+    else:
+        return "neutral"
+
+
+class AggregateState:
+    """Running totals behind a sentiment result.
+
+    Reviews are added one at a time and two states merge without touching
+    the reviews again, so per-source, combined and all-time product results
+    are kept up to date in O(new reviews). Score sums are exact, so a merged
+    state summarizes identically to one built from all the reviews at once.
+    """
+
+    __slots__ = ("breakdown", "compound_units", "keywords")
+
+    def __init__(self):
+        self.breakdown: Dict[str, int] = {"positive": 0, "negative": 0, "neutral": 0}
+        self.compound_units = 0
+        self.keywords = KeywordAccumulator()
+
+    @property
+    def compound_sum(self) -> float:
+        return self.compound_units / SCORE_SCALE
+
+    @property
+    def average_score(self) -> float:
+        total = self.total
+        return self.compound_units / (total * SCORE_SCALE) if total else 0.0
+
+    @property
+    def total(self) -> int:
+        return self.breakdown["positive"] + self.breakdown["negative"] + self.breakdown["neutral"]
+
+    def add(self, score: float, tokens: Iterable[str] = ()) -> None:
+        self.compound_units += score_units(score)
+        self.breakdown[sentiment_label(score)] += 1
+        self.keywords.add_tokens(tokens, score)
+
+    def add_reviews(self, reviews: List[Dict[str, Any]]) -> "AggregateState":
+        """Add scored review dicts; reviews without a comment are not counted."""
+        for review in reviews:
+            comment = review.get("comment", "")
+            if comment:
+                self.add(review["sentiment_score"], tokenize(comment))
+        return self
+
+    def merge(self, other: "AggregateState") -> "AggregateState":
+        """Fold `other` into this state in place."""
+        for label, count in other.breakdown.items():
+            self.breakdown[label] += count
+        self.compound_units += other.compound_units
+        self.keywords.merge(other.keywords)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "breakdown": dict(self.breakdown),
+            "compound_sum": self.compound_sum,
+            "keywords": self.keywords.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AggregateState":
+        state = cls()
+        state.breakdown.update(data.get("breakdown", {}))
+        state.compound_units = score_units(float(data.get("compound_sum", 0.0)))
+        state.keywords = KeywordAccumulator.from_dict(data.get("keywords"))
+        return state
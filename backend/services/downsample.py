@@ -0,0 +1,44 @@
+# Largest-Triangle-Three-Buckets downsampling for chart series
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def lttb(points: Sequence[T], threshold: int, x: Callable[[T], float], y: Callable[[T], float]) -> List[T]:
+    """Pick `threshold` of `points` (sorted by x ascending) that keep the series' visual shape.
+
+    The first and last points are always kept. Each bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, so peaks and dips survive.
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+
+    xs = [x(p) for p in points]
+    ys = [y(p) for p in points]
+    every = (n - 2) / (threshold - 2)
+
+    sampled = [points[0]]
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the triangle's third corner
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        span = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a]))
+            if area > best_area:
+                best, best_area = j, area
+
+        sampled.append(points[best])
+        a = best
+
+    sampled.append(points[-1])
+    return sampled
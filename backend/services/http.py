@@ -0,0 +1,130 @@
+# Process-wide pooled HTTP client shared by all API-based sources
+import asyncio
+from collections import defaultdict
+from typing import Dict, Optional, Any
+
+import httpx
+
+from config import (
+    HTTP_TIMEOUT_SECONDS,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_KEEPALIVE_SECONDS,
+    HTTP2_ENABLED,
+    RATE_LIMIT_MAX_RETRIES,
+)
+from .rate_limit import rate_limiter
+from .tracing import tracer
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HTTPClient:
+    """Keep-alive connection pool with per-host concurrency limits.
+
+    Owned by the app lifecycle (see main.py), but started lazily so scripts
+    and benchmarks can use the sources without running the app.
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "new_connections": 0}
+        )
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED and HTTP2_AVAILABLE,
+            follow_redirects=True,
+            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_SECONDS
+            )
+        )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_limits.clear()
+
+    def _host_limit(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+        return self._host_limits[host]
+
+    async def request(self, source: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request on behalf of `source` through its platform rate limit.
+
+        Responses tune the limit from their rate-limit headers; a 429 holds
+        the platform's queue for Retry-After and is retried up to
+        RATE_LIMIT_MAX_RETRIES times before it is returned to the caller.
+        """
+        bucket = rate_limiter.bucket(source)
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await bucket.acquire()
+            response = await self._send(source, method, url, **kwargs)
+            if response.status_code != 429:
+                bucket.update(response.headers)
+                return response
+            bucket.throttle(response.headers)
+        return response
+
+    async def _send(self, source: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send one request, recording connection reuse."""
+        if self._client is None:
+            await self.start()
+
+        stats = self._stats[source]
+
+        async def trace(event_name: str, info: dict) -> None:
+            # Only fired when the pool has to open a new TCP connection
+            if event_name == "connection.connect_tcp.complete":
+                stats["new_connections"] += 1
+
+        extensions = kwargs.pop("extensions", None) or {}
+        extensions["trace"] = trace
+
+        parsed = httpx.URL(url)
+        with tracer.span("http.request", source=source, method=method, host=parsed.host, path=parsed.path) as span:
+            async with self._host_limit(parsed.host):
+                response = await self._client.request(method, url, extensions=extensions, **kwargs)
+            if span:
+                span.set(status_code=response.status_code)
+        stats["requests"] += 1
+        return response
+
+    async def get(self, source: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request(source, "GET", url, **kwargs)
+
+    async def post(self, source: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request(source, "POST", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-source request and connection counts."""
+        sources = {}
+        for source, stats in self._stats.items():
+            reused = max(stats["requests"] - stats["new_connections"], 0)
+            sources[source] = {
+                **stats,
+                "reused_connections": reused,
+                "reuse_ratio": round(reused / stats["requests"], 3) if stats["requests"] else 0.0
+            }
+        return {
+            "http2": HTTP2_ENABLED and HTTP2_AVAILABLE,
+            "sources": sources
+        }
+
+
+# Singleton instance shared by every source
+http_client = HTTPClient()
@@ -0,0 +1,253 @@
+# Background scan jobs: bounded asyncio worker pool with progress and cancellation
+import asyncio
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config import MAX_CONCURRENT_SCANS, MAX_QUEUED_SCANS, JOB_HISTORY_SIZE
+from .tracing import tracer
+
+QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED = "queued", "running", "completed", "failed", "cancelled"
+FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class ScanFailedError(Exception):
+    pass
+
+
+class ScanJob:
+    """One submitted scan: status, current stage, per-source progress and the final result."""
+
+    def __init__(self, product_name: str, platforms: List[str], runner: Callable[["ScanJob"], Awaitable[dict]]):
+        self.id = uuid.uuid4().hex
+        self.product_name = product_name
+        self.status = QUEUED
+        self.stage: Optional[str] = None
+        self.sources: Dict[str, Dict[str, Any]] = {platform: {"status": "pending"} for platform in platforms}
+        self.result: Optional[dict] = None
+        # (event, data) pairs published while the job runs, e.g. each source's processed result
+        self.events: List[Tuple[str, Any]] = []
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.runner = runner
+        # Span of the request that submitted the job; the scan's spans continue its trace
+        self.parent_span = tracer.current_span()
+        self.task: Optional[asyncio.Task] = None
+        self.version = 0
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def _notify(self) -> None:
+        # Wake everyone waiting on the current version, then arm a fresh event
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait_changed(self, version: int) -> None:
+        if self.version == version:
+            await self._changed.wait()
+
+    def set_stage(self, stage: str) -> None:
+        self.stage = stage
+        self._notify()
+
+    def update_source(self, platform: str, **progress: Any) -> None:
+        self.sources[platform] = progress
+        self._notify()
+
+    def publish(self, event: str, data: Any) -> None:
+        self.events.append((event, data))
+        self._notify()
+
+    def finish(self, status: str, result: Optional[dict] = None, error: Optional[str] = None) -> None:
+        self.status = status
+        # Whatever stage the scan reached, a finished job reports "done"; status says how it ended
+        self.stage = "done"
+        self.result = result
+        self.error = error
+        self.finished_at = datetime.utcnow()
+        self._notify()
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "product_name": self.product_name,
+            "status": self.status,
+            "stage": self.stage,
+            "sources": self.sources,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """Queue of scan jobs drained by at most `max_concurrent` asyncio workers.
+
+    Jobs live in memory; the newest `history_size` finished jobs stay
+    available for polling.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_SCANS,
+        max_queued: int = MAX_QUEUED_SCANS,
+        history_size: int = JOB_HISTORY_SIZE
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.history_size = history_size
+        self.jobs: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._workers = [asyncio.ensure_future(self._worker()) for _ in range(self.max_concurrent)]
+
+    async def stop(self) -> None:
+        # Workers first: each cancels its running job on the way out. Cancelling the
+        # job tasks first would let a worker mistake its own cancellation for the job's.
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        for job in self.jobs.values():
+            if not job.finished:
+                self.cancel(job.id)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status == QUEUED:
+                    await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ScanJob) -> None:
+        with tracer.span("scan.job", parent=job.parent_span, job_id=job.id, product=job.product_name) as span:
+            await self._run_job(job)
+            if span:
+                span.set(status=job.status)
+
+    async def _run_job(self, job: ScanJob) -> None:
+        job.status = RUNNING
+        job.started_at = datetime.utcnow()
+        # A separate task, so cancelling the job never takes its worker down with it
+        job.task = asyncio.ensure_future(job.runner(job))
+        try:
+            result = await asyncio.shield(job.task)
+        except asyncio.CancelledError:
+            if not job.task.cancelled():
+                # The worker itself is being stopped
+                job.task.cancel()
+                job.finish(CANCELLED, error="Server shutting down")
+                raise
+            job.finish(CANCELLED)
+        except Exception as e:
+            job.finish(FAILED, error=str(e))
+        else:
+            job.finish(COMPLETED, result=result)
+
+    async def submit(
+        self,
+        product_name: str,
+        platforms: List[str],
+        runner: Callable[[ScanJob], Awaitable[dict]]
+    ) -> ScanJob:
+        """Queue a scan; raises QueueFullError once max_queued scans are waiting."""
+        await self.start()
+        job = ScanJob(product_name, platforms, runner)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(f"Scan queue is full ({self.max_queued} waiting)")
+        self.jobs[job.id] = job
+        self._prune()
+        return job
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[ScanJob]:
+        return self.jobs.get(job_id)
+
+    def is_active(self, product_name: str) -> bool:
+        """Whether a scan of this product is queued or running."""
+        name = product_name.strip().lower()
+        return any(
+            not job.finished and job.product_name.strip().lower() == name
+            for job in self.jobs.values()
+        )
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; False if it is unknown or already finished."""
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+        if job.task is None:
+            # Still queued: the worker skips it when it comes up
+            job.finish(CANCELLED)
+        else:
+            job.task.cancel()
+        return True
+
+    async def wait(self, job: ScanJob) -> ScanJob:
+        while not job.finished:
+            await job.wait_changed(job.version)
+        return job
+
+    async def watch(self, job: ScanJob) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the job's state after every change, ending with its final state."""
+        while True:
+            version = job.version
+            yield job.to_dict(include_result=job.finished)
+            if job.finished:
+                return
+            await job.wait_changed(version)
+
+    async def events(self, job: ScanJob) -> AsyncIterator[Tuple[str, Any]]:
+        """Yield every event the job publishes, from the first, until it finishes."""
+        sent = 0
+        while True:
+            version = job.version
+            while sent < len(job.events):
+                yield job.events[sent]
+                sent += 1
+            if job.finished:
+                return
+            await job.wait_changed(version)
+
+    def get_stats(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "max_concurrent": self.max_concurrent,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "jobs": counts,
+        }
+
+
+# Singleton used by main.py
+job_manager = JobManager()
@@ -0,0 +1,109 @@
+# Keyword extraction with mergeable running accumulators
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Lowercased words of 3+ ASCII letters
+TOKEN_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "must", "shall", "can", "need",
+    "this", "that", "these", "those", "i", "you", "he", "she", "it",
+    "we", "they", "what", "which", "who", "whom", "whose", "where",
+    "when", "why", "how", "all", "each", "every", "both", "few", "more",
+    "most", "other", "some", "such", "no", "nor", "not", "only", "own",
+    "same", "so", "than", "too", "very", "just", "also", "now", "here",
+    "there", "then", "once", "if", "my", "your", "its", "our", "their",
+    "app", "use", "using", "used", "really", "much", "get", "got",
+    "one", "two", "first", "new", "even", "still", "well", "way", "many"
+})
+
+# Words seen fewer times than this are never reported
+MIN_KEYWORD_COUNT = 2
+
+# VADER rounds compound scores to 4 decimals; sums are kept as exact integer counts of 1e-4
+# so states merged in any order add up to exactly what one pass over the reviews would
+SCORE_SCALE = 10_000
+
+
+def score_units(score: float) -> int:
+    """A compound score as an integer number of 1e-4 steps."""
+    return round(score * SCORE_SCALE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Keyword candidates in `text`, in order, with stop words removed."""
+    return [word for word in TOKEN_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
+
+
+class KeywordAccumulator:
+    """Per-word occurrence counts and compound score sums (in score units).
+
+    Memory grows with the vocabulary, not the number of texts, and two
+    accumulators can be merged without re-tokenizing anything. Words keep
+    first-seen order so ties rank the same way as a single pass would.
+    """
+
+    __slots__ = ("counts", "score_sums")
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.score_sums: Dict[str, int] = {}
+
+    def add_tokens(self, tokens: Iterable[str], score: float) -> None:
+        counts = self.counts
+        score_sums = self.score_sums
+        units = score_units(score)
+        for word in tokens:
+            if word in counts:
+                counts[word] += 1
+                score_sums[word] += units
+            else:
+                counts[word] = 1
+                score_sums[word] = units
+
+    def add(self, text: str, score: float) -> None:
+        if text:
+            self.add_tokens(tokenize(text), score)
+
+    def add_many(self, texts: Iterable[str], scores: Iterable[float]) -> "KeywordAccumulator":
+        for text, score in zip(texts, scores):
+            self.add(text, score)
+        return self
+
+    def merge(self, other: "KeywordAccumulator") -> "KeywordAccumulator":
+        """Fold `other` into this accumulator in place."""
+        counts = self.counts
+        score_sums = self.score_sums
+        for word, count in other.counts.items():
+            if word in counts:
+                counts[word] += count
+                score_sums[word] += other.score_sums[word]
+            else:
+                counts[word] = count
+                score_sums[word] = other.score_sums[word]
+        return self
+
+    def top(self, top_n: int = 20) -> List[Tuple[str, int, float]]:
+        """(word, count, average score) for the most frequent words, most frequent first."""
+        candidates = (
+            (word, count) for word, count in self.counts.items() if count >= MIN_KEYWORD_COUNT
+        )
+        return [
+            (word, count, self.score_sums[word] / (count * SCORE_SCALE))
+            for word, count in heapq.nlargest(top_n, candidates, key=lambda item: item[1])
+        ]
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        return {word: [count, self.score_sums[word] / SCORE_SCALE] for word, count in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, List[float]]]) -> "KeywordAccumulator":
+        accumulator = cls()
+        for word, (count, score_sum) in (data or {}).items():
+            accumulator.counts[word] = int(count)
+            accumulator.score_sums[word] = score_units(score_sum)
+        return accumulator
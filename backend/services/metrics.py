@@ -0,0 +1,219 @@
+# In-process metrics (counters and histograms) rendered in the Prometheus text format
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
+
+from config import METRICS_ENABLED
+
+T = TypeVar("T")
+
+# Seconds; spans sub-millisecond cache hits up to slow source fetches
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if not METRICS_ENABLED:
+            return
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts, sum, count); the last bucket is +Inf
+        self._series: Dict[LabelValues, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not METRICS_ENABLED:
+            return
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+        """Decorator recording the duration of each call, for plain and async functions.
+
+        With metrics disabled the function is returned unwrapped.
+        """
+        def decorator(func: Callable[..., T]) -> Callable[..., T]:
+            if not METRICS_ENABLED:
+                return func
+
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    start = time.perf_counter()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        self.observe(time.perf_counter() - start, **labels)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(time.perf_counter() - start, **labels)
+            return wrapper
+
+        return decorator
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Gauge:
+    """A value read from `read` each time metrics are rendered."""
+
+    def __init__(self, name: str, documentation: str, read: Callable[[], float]):
+        self.name = name
+        self.documentation = documentation
+        self.read = read
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format_value(self.read())}",
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, read: Callable[[], float]) -> Gauge:
+        return self._register(Gauge(name, documentation, read))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def instrument_methods(histogram: Histogram, exclude: Tuple[str, ...] = ()) -> Callable[[type], type]:
+    """Class decorator timing every public method into `histogram`, labelled method=<name>."""
+    def decorator(cls: type) -> type:
+        if not METRICS_ENABLED:
+            return cls
+        for name, attr in list(vars(cls).items()):
+            if name.startswith("_") or name in exclude or not inspect.isfunction(attr):
+                continue
+            setattr(cls, name, histogram.time(method=name)(attr))
+        return cls
+
+    return decorator
+
+
+# Process-wide registry and the metrics recorded on the scan path
+registry = MetricsRegistry()
+
+SOURCE_FETCH_SECONDS = registry.histogram(
+    "source_fetch_seconds", "Time to fetch reviews from one source", ("platform", "outcome")
+)
+REVIEWS_FETCHED = registry.counter(
+    "reviews_fetched_total", "Reviews returned by sources", ("platform",)
+)
+REVIEWS_DEDUPLICATED = registry.counter(
+    "reviews_deduplicated_total", "Fetched reviews skipped because they were already stored", ("platform",)
+)
+REVIEWS_INSERTED = registry.counter(
+    "reviews_inserted_total", "New reviews written to the database", ("platform",)
+)
+SENTIMENT_SECONDS = registry.histogram(
+    "sentiment_seconds", "Time spent in sentiment analysis calls", ("operation",)
+)
+DB_SECONDS = registry.histogram(
+    "db_method_seconds", "Time spent in DatabaseService methods", ("method",)
+)
+SCAN_CACHE_REQUESTS = registry.counter(
+    "scan_cache_requests_total", "Cached scan lookups by how they were served (hit, stale, miss, coalesced)", ("result",)
+)
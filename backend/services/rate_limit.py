@@ -0,0 +1,238 @@
+# Shared per-platform rate limiting: token buckets tuned by response headers, plus YouTube quota units
+import asyncio
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Mapping, Optional
+from zoneinfo import ZoneInfo
+
+from config import (
+    RATE_LIMIT_GOOGLE_PLAY_PER_MINUTE,
+    RATE_LIMIT_IOS_PER_MINUTE,
+    RATE_LIMIT_YOUTUBE_PER_MINUTE,
+    RATE_LIMIT_PRODUCT_HUNT_PER_MINUTE,
+    RATE_LIMIT_REDDIT_PER_MINUTE,
+    RATE_LIMIT_BURST,
+    YOUTUBE_DAILY_QUOTA,
+)
+
+# Requests per minute for each source's platform_name; other platforms get the default
+PLATFORM_RATES = {
+    "Google Play Store": RATE_LIMIT_GOOGLE_PLAY_PER_MINUTE,
+    "iOS App Store": RATE_LIMIT_IOS_PER_MINUTE,
+    "YouTube": RATE_LIMIT_YOUTUBE_PER_MINUTE,
+    "Product Hunt": RATE_LIMIT_PRODUCT_HUNT_PER_MINUTE,
+    "Reddit": RATE_LIMIT_REDDIT_PER_MINUTE,
+}
+DEFAULT_RATE_PER_MINUTE = 60.0
+
+# Wait applied to a 429 that carries no Retry-After or reset header (seconds)
+DEFAULT_RETRY_AFTER = 60.0
+
+# YouTube Data API v3 units per call (https://developers.google.com/youtube/v3/determine_quota_cost)
+YOUTUBE_QUOTA_COSTS = {
+    "videos.list": 1,
+    "commentThreads.list": 1,
+    "search.list": 100,
+}
+
+
+def _header(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _seconds_until(reset: float) -> float:
+    # Reset headers are either seconds from now or a Unix timestamp
+    if reset > 1e9:
+        return max(0.0, reset - time.time())
+    return max(0.0, reset)
+
+
+class QuotaExceededError(Exception):
+    pass
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `capacity`; callers queue until a token is free.
+
+    The bucket is the client's own guess at the platform's limit. Rate-limit
+    headers on responses override it: a nearly spent window drains the
+    bucket, and an exhausted one (or a 429) holds every caller until the
+    window resets. A rate of 0 or less turns the bucket's own limit off;
+    header and 429 holds still apply.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = RATE_LIMIT_BURST, reserve: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self.reserve = reserve
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self.requests = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+
+    @property
+    def limited(self) -> bool:
+        return self.rate > 0
+
+    def _refill(self, now: float) -> None:
+        if not self.limited:
+            return
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, cost: float = 1) -> None:
+        # asyncio.Lock wakes waiters in order, so queued requests keep their place
+        async with self._lock:
+            started = time.monotonic()
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if self.limited:
+                    wait = max(wait, (cost - self.tokens) / self.rate)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.limited:
+                self.tokens -= cost
+            self.requests += 1
+            waited = time.monotonic() - started
+            if waited > 0.001:
+                self.waits += 1
+                self.wait_seconds += waited
+
+    def budget(self, seconds: float) -> float:
+        """Requests the bucket can grant within `seconds` from now, ignoring other waiters."""
+        now = time.monotonic()
+        self._refill(now)
+        seconds -= max(0.0, self.blocked_until - now)
+        if seconds <= 0:
+            return 0.0
+        if not self.limited:
+            return float("inf")
+        return max(0.0, self.tokens) + self.rate * seconds
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Align with the x-ratelimit-* / x-rate-limit-* headers of a response."""
+        remaining = _header(headers, "x-ratelimit-remaining", "x-rate-limit-remaining")
+        reset = _header(headers, "x-ratelimit-reset", "x-rate-limit-reset")
+        if remaining is None:
+            return
+        now = time.monotonic()
+        self._refill(now)
+        # Requests still in flight were already taken from the bucket, so only ever lower it
+        self.tokens = min(self.tokens, remaining - self.reserve)
+        if remaining <= self.reserve and reset is not None:
+            self.blocked_until = max(self.blocked_until, now + _seconds_until(reset))
+
+    def throttle(self, headers: Mapping[str, str]) -> float:
+        """Hold all requests after a 429; returns the wait the server asked for."""
+        retry_after = _header(headers, "retry-after", "x-ratelimit-reset", "x-rate-limit-reset")
+        wait = _seconds_until(retry_after) if retry_after is not None else DEFAULT_RETRY_AFTER
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+        self.blocked_until = max(self.blocked_until, now + wait)
+        self.throttled += 1
+        return wait
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "rate_per_minute": round(self.rate * 60, 2),
+            "requests": self.requests,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "throttled": self.throttled,
+            "blocked_for": round(max(0.0, self.blocked_until - time.monotonic()), 3),
+        }
+
+
+class QuotaTracker:
+    """Daily API units spent per call type; refuses calls the remaining quota can't cover.
+
+    Unlike a request rate, a spent daily quota doesn't come back for hours,
+    so calls fail immediately instead of queueing.
+    """
+
+    def __init__(self, name: str, daily_units: int, costs: Dict[str, int], timezone_name: str = "America/Los_Angeles"):
+        self.name = name
+        self.daily_units = daily_units
+        self.costs = costs
+        self.timezone = ZoneInfo(timezone_name)
+        self.day: Optional[date] = None
+        self.used: Dict[str, int] = {}
+        self.exhausted = False
+
+    def _roll_over(self) -> None:
+        today = datetime.now(timezone.utc).astimezone(self.timezone).date()
+        if today != self.day:
+            self.day = today
+            self.used = {}
+            self.exhausted = False
+
+    @property
+    def remaining(self) -> int:
+        self._roll_over()
+        if self.exhausted:
+            return 0
+        return max(0, self.daily_units - sum(self.used.values()))
+
+    def spend(self, call: str) -> None:
+        """Record one `call` (e.g. "commentThreads.list"); raises QuotaExceededError if it doesn't fit."""
+        cost = self.costs.get(call, 1)
+        if cost > self.remaining:
+            raise QuotaExceededError(f"{self.name} API quota exceeded. Try again tomorrow.")
+        self.used[call] = self.used.get(call, 0) + cost
+
+    def mark_exhausted(self) -> None:
+        """The API reported quotaExceeded: stop calling it until the quota resets."""
+        self._roll_over()
+        self.exhausted = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "daily_units": self.daily_units,
+            "remaining": self.remaining,
+            "used": dict(self.used),
+        }
+
+
+class RateLimiter:
+    """One token bucket per platform, shared by every scan running in the process."""
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        self.rates = PLATFORM_RATES if rates is None else rates
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, platform: str) -> TokenBucket:
+        if platform not in self._buckets:
+            self._buckets[platform] = TokenBucket(self.rates.get(platform, DEFAULT_RATE_PER_MINUTE))
+        return self._buckets[platform]
+
+    async def acquire(self, platform: str, cost: float = 1) -> None:
+        await self.bucket(platform).acquire(cost)
+
+    def budget(self, platform: str, seconds: float) -> float:
+        return self.bucket(platform).budget(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "platforms": {platform: bucket.get_stats() for platform, bucket in self._buckets.items()},
+            "youtube_quota": youtube_quota.get_stats(),
+        }
+
+
+# Singletons shared by the HTTP client and every source
+rate_limiter = RateLimiter()
+youtube_quota = QuotaTracker("YouTube", YOUTUBE_DAILY_QUOTA, YOUTUBE_QUOTA_COSTS)
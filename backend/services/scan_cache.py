@@ -0,0 +1,168 @@
+# In-memory cache of scan results: per-platform freshness, stale-while-revalidate and single-flight scans
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from config import (
+    SCAN_CACHE_TTL_GOOGLE_PLAY_SECONDS,
+    SCAN_CACHE_TTL_IOS_SECONDS,
+    SCAN_CACHE_TTL_YOUTUBE_SECONDS,
+    SCAN_CACHE_TTL_PRODUCT_HUNT_SECONDS,
+    SCAN_CACHE_TTL_REDDIT_SECONDS,
+    SCAN_CACHE_STALE_SECONDS,
+    SCAN_CACHE_ERROR_TTL_SECONDS,
+    SCAN_CACHE_MAX_ENTRIES,
+)
+from .metrics import registry, SCAN_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# Seconds a result stays fresh, by source platform_name
+PLATFORM_TTLS = {
+    "Google Play Store": SCAN_CACHE_TTL_GOOGLE_PLAY_SECONDS,
+    "iOS App Store": SCAN_CACHE_TTL_IOS_SECONDS,
+    "YouTube": SCAN_CACHE_TTL_YOUTUBE_SECONDS,
+    "Product Hunt": SCAN_CACHE_TTL_PRODUCT_HUNT_SECONDS,
+    "Reddit": SCAN_CACHE_TTL_REDDIT_SECONDS,
+}
+
+# Product name plus the (field, identifier) pairs that were scanned
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+HIT, STALE, MISS, COALESCED = "hit", "stale", "miss", "coalesced"
+
+
+def make_key(product_name: str, sources: Dict[str, Optional[str]]) -> CacheKey:
+    """Key that ignores name case/whitespace and unset sources."""
+    return (
+        product_name.strip().lower(),
+        tuple(sorted((field, value.strip()) for field, value in sources.items() if value and value.strip())),
+    )
+
+
+def ttl_for(platforms: Iterable[str], ttls: Optional[Dict[str, float]] = None) -> float:
+    """A scan is only as fresh as its fastest-moving platform."""
+    ttls = PLATFORM_TTLS if ttls is None else ttls
+    return min((ttls.get(platform, 0.0) for platform in platforms), default=0.0)
+
+
+class ScanCache:
+    """Scan results by CacheKey.
+
+    Fresh entries are returned as is. Expired ones are still returned for
+    `stale_seconds` while a background scan refreshes them. Concurrent
+    requests for a key with no usable entry share one in-flight scan.
+    Results in which a source failed are only kept for `error_ttl`, and
+    never served stale, so a timeout or rate limit isn't repeated for long.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SCAN_CACHE_MAX_ENTRIES,
+        stale_seconds: float = SCAN_CACHE_STALE_SECONDS,
+        error_ttl: float = SCAN_CACHE_ERROR_TTL_SECONDS
+    ):
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self.error_ttl = error_ttl
+        # key -> (result, fresh until, stale until), on the monotonic clock
+        self._entries: "OrderedDict[CacheKey, Tuple[dict, float, float]]" = OrderedDict()
+        self._in_flight: Dict[CacheKey, asyncio.Task] = {}
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "refreshes": 0, "evictions": 0}
+
+    async def get_or_scan(
+        self,
+        key: CacheKey,
+        ttl: float,
+        scan: Callable[[], Awaitable[dict]]
+    ) -> Tuple[dict, str]:
+        """Return (result, how it was served: hit, stale, miss or coalesced).
+
+        Exceptions raised by `scan` reach every caller waiting on it and
+        nothing is cached.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key) if ttl > 0 else None
+        if entry:
+            result, fresh_until, stale_until = entry
+            if now < fresh_until:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                SCAN_CACHE_REQUESTS.inc(result=HIT)
+                return result, HIT
+            if now < stale_until:
+                self._entries.move_to_end(key)
+                self._stats["stale_hits"] += 1
+                SCAN_CACHE_REQUESTS.inc(result=STALE)
+                if key not in self._in_flight:
+                    self._stats["refreshes"] += 1
+                    self._start(key, ttl, scan)
+                return result, STALE
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+            SCAN_CACHE_REQUESTS.inc(result=COALESCED)
+            status = COALESCED
+        else:
+            self._stats["misses"] += 1
+            SCAN_CACHE_REQUESTS.inc(result=MISS)
+            task = self._start(key, ttl, scan)
+            status = MISS
+        # A caller that goes away must not cancel the scan the others are waiting on
+        return await asyncio.shield(task), status
+
+    def _start(self, key: CacheKey, ttl: float, scan: Callable[[], Awaitable[dict]]) -> asyncio.Task:
+        async def run() -> dict:
+            try:
+                result = await scan()
+                self.put(key, result, ttl)
+                return result
+            finally:
+                self._in_flight.pop(key, None)
+
+        task = asyncio.ensure_future(run())
+        # Background refreshes have no awaiter; retrieve their exception so it is logged once, here
+        task.add_done_callback(self._log_failure)
+        self._in_flight[key] = task
+        return task
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Scan for cache failed: %s", task.exception())
+
+    def put(self, key: CacheKey, result: dict, ttl: float) -> None:
+        stale_seconds = self.stale_seconds
+        if result.get("errors"):
+            ttl, stale_seconds = min(ttl, self.error_ttl), 0.0
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+        now = time.monotonic()
+        self._entries[key] = (result, now + ttl, now + ttl + stale_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"] + self._stats["coalesced"]
+        served = self._stats["hits"] + self._stats["stale_hits"]
+        return {
+            **self._stats,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "in_flight": len(self._in_flight),
+            "hit_ratio": round(served / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Singleton used by main.py
+scan_cache = ScanCache()
+
+SCAN_CACHE_HIT_RATIO = registry.gauge(
+    "scan_cache_hit_ratio", "Share of cached scan lookups served from the cache (fresh or stale)",
+    lambda: scan_cache.get_stats()["hit_ratio"]
+)
@@ -0,0 +1,118 @@
+# Concurrent fan-out of review sources for a single scan
+import asyncio
+import time
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from config import DEFAULT_REVIEW_COUNT, SOURCE_TIMEOUT_SECONDS, SCAN_DEADLINE_SECONDS
+from .metrics import SOURCE_FETCH_SECONDS, REVIEWS_FETCHED
+from .tracing import tracer
+from .sources.base import BaseSource, SourceResult, Watermark
+
+# A source paired with the identifier to scan on it
+SourceJob = Tuple[BaseSource, str]
+
+
+def _error_result(source: BaseSource, identifier: str, error: str) -> SourceResult:
+    return SourceResult(
+        platform=source.platform_name,
+        identifier=identifier,
+        average_rating=0.0,
+        total_reviews=0,
+        reviews=[],
+        error=error
+    )
+
+
+async def _fetch_with_timeout(
+    source: BaseSource,
+    identifier: str,
+    count: int,
+    timeout: float,
+    since: Optional[Watermark] = None
+) -> SourceResult:
+    start = time.perf_counter()
+    with tracer.span(
+        "source.fetch", platform=source.platform_name, identifier=identifier, incremental=since is not None
+    ) as span:
+        try:
+            result = await asyncio.wait_for(source.fetch_reviews(identifier, count=count, since=since), timeout)
+        except asyncio.TimeoutError:
+            result = _error_result(source, identifier, f"Timed out after {timeout:g}s")
+        except Exception as e:
+            result = _error_result(source, identifier, str(e))
+        if span:
+            span.set(reviews=len(result.reviews), error=result.error)
+
+    SOURCE_FETCH_SECONDS.observe(
+        time.perf_counter() - start, platform=source.platform_name, outcome="error" if result.error else "ok"
+    )
+    REVIEWS_FETCHED.inc(len(result.reviews), platform=source.platform_name)
+    return result
+
+
+async def iter_source_results(
+    jobs: List[SourceJob],
+    count: int = DEFAULT_REVIEW_COUNT,
+    timeout: float = SOURCE_TIMEOUT_SECONDS,
+    deadline: float = SCAN_DEADLINE_SECONDS,
+    watermarks: Optional[Dict[str, Watermark]] = None
+) -> AsyncIterator[Tuple[int, SourceResult]]:
+    """Run all jobs concurrently and yield (job index, result) as each one finishes.
+
+    Every job gets its own timeout; jobs still running when the scan deadline
+    passes are cancelled and reported as errors so callers always get one
+    result per job. Sources with an entry in `watermarks` (keyed by platform
+    name) only fetch reviews newer than it.
+    """
+    watermarks = watermarks or {}
+    loop = asyncio.get_running_loop()
+    tasks = {
+        asyncio.ensure_future(_fetch_with_timeout(
+            source, identifier, count, timeout, watermarks.get(source.platform_name)
+        )): index
+        for index, (source, identifier) in enumerate(jobs)
+    }
+    pending = set(tasks)
+    end = loop.time() + deadline
+
+    try:
+        while pending:
+            remaining = end - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield tasks[task], task.result()
+
+        for task in pending:
+            task.cancel()
+            source, identifier = jobs[tasks[task]]
+            yield tasks[task], _error_result(
+                source, identifier, f"Scan deadline of {deadline:g}s exceeded"
+            )
+    finally:
+        # Also reached when the consumer stops iterating early
+        for task in pending:
+            task.cancel()
+
+
+async def fetch_sources(
+    jobs: List[SourceJob],
+    count: int = DEFAULT_REVIEW_COUNT,
+    timeout: float = SOURCE_TIMEOUT_SECONDS,
+    deadline: float = SCAN_DEADLINE_SECONDS,
+    watermarks: Optional[Dict[str, Watermark]] = None,
+    on_result: Optional[Callable[[SourceResult], None]] = None
+) -> List[SourceResult]:
+    """Fetch all jobs concurrently and return results in job order.
+
+    `on_result` is called with each result as soon as its source finishes.
+    """
+    results: Dict[int, SourceResult] = {}
+    async for index, source_result in iter_source_results(jobs, count, timeout, deadline, watermarks):
+        results[index] = source_result
+        if on_result:
+            on_result(source_result)
+    return [results[index] for index in range(len(jobs))]
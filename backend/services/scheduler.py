@@ -0,0 +1,146 @@
+# Recurring product scans: due products are submitted to the job queue with jitter and per-source limits
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config import (
+    SCHEDULER_TICK_SECONDS,
+    SCHEDULER_JITTER,
+    SCHEDULER_MAX_PER_SOURCE,
+    SCHEDULER_CATCHUP_WINDOW_MINUTES,
+)
+from database.connection import session_scope
+from database.models import Product
+from database.service import AsyncDatabaseService
+from .jobs import job_manager, QueueFullError
+
+logger = logging.getLogger(__name__)
+
+# Product columns that identify a source; each counts against its own per-tick budget
+PRODUCT_SOURCE_COLUMNS = (
+    "google_play_id", "ios_app_id", "youtube_video_id", "product_hunt_slug", "reddit_subreddit",
+)
+
+
+def product_sources(product: Product) -> List[str]:
+    return [column for column in PRODUCT_SOURCE_COLUMNS if getattr(product, column)]
+
+
+def next_run(now: datetime, interval_minutes: int, jitter: float = SCHEDULER_JITTER) -> datetime:
+    """`now` plus the interval, stretched or shrunk by up to `jitter` of it so products drift apart."""
+    factor = 1 + random.uniform(-jitter, jitter)
+    return now + timedelta(minutes=interval_minutes * factor)
+
+
+def first_run(now: datetime, interval_minutes: int, window_minutes: float = SCHEDULER_CATCHUP_WINDOW_MINUTES) -> datetime:
+    """A random start within the first interval (capped at the window), so new schedules don't line up."""
+    return now + timedelta(minutes=random.uniform(0, min(interval_minutes, window_minutes)))
+
+
+class Scheduler:
+    """Periodically submits scans for products whose next_scan_at has passed.
+
+    Next-run times live on the product rows, so schedules survive restarts.
+    Every check starts at most `max_per_source` scans per source; the rest
+    stay due and are picked up by later checks. A product whose previous
+    scan is still queued or running is skipped until its next interval.
+    """
+
+    def __init__(
+        self,
+        tick_seconds: float = SCHEDULER_TICK_SECONDS,
+        max_per_source: int = SCHEDULER_MAX_PER_SOURCE,
+        catchup_window_minutes: float = SCHEDULER_CATCHUP_WINDOW_MINUTES
+    ):
+        self.tick_seconds = tick_seconds
+        self.max_per_source = max_per_source
+        self.catchup_window_minutes = catchup_window_minutes
+        self._submit: Optional[Callable[[Product], Awaitable[Any]]] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_tick: Optional[datetime] = None
+        self.submitted = 0
+        self.skipped = 0
+
+    async def start(self, submit: Callable[[Product], Awaitable[Any]]) -> None:
+        """Spread scans that fell due while the server was down, then start checking."""
+        if self._task:
+            return
+        self._submit = submit
+        await self.spread_overdue(datetime.utcnow())
+        self._task = asyncio.ensure_future(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("Scheduled scan check failed")
+            await asyncio.sleep(self.tick_seconds)
+
+    async def spread_overdue(self, now: datetime) -> int:
+        """Move every overdue run to a random point in the catch-up window instead of now."""
+        async with session_scope() as db:
+            db_service = AsyncDatabaseService(db)
+            overdue = await db_service.get_due_products(now, limit=None)
+            for product in overdue:
+                await db_service.set_next_scan(product.id, first_run(
+                    now, product.scan_interval_minutes, self.catchup_window_minutes
+                ))
+        return len(overdue)
+
+    async def tick(self, now: Optional[datetime] = None) -> int:
+        """Submit scans for due products; returns how many were submitted."""
+        now = now or datetime.utcnow()
+        self.last_tick = now
+        budget = dict.fromkeys(PRODUCT_SOURCE_COLUMNS, self.max_per_source)
+        submitted = 0
+
+        async with session_scope() as db:
+            db_service = AsyncDatabaseService(db)
+            # Enough rows to fill every source's budget even if some are skipped
+            due = await db_service.get_due_products(now, limit=self.max_per_source * len(PRODUCT_SOURCE_COLUMNS) * 4)
+
+            for product in due:
+                sources = product_sources(product)
+                if sources and any(budget[column] <= 0 for column in sources):
+                    # Over this check's budget for one of its sources; stays due for the next check
+                    continue
+
+                if sources and not job_manager.is_active(product.name):
+                    try:
+                        await self._submit(product)
+                    except QueueFullError:
+                        break
+                    for column in sources:
+                        budget[column] -= 1
+                    submitted += 1
+                else:
+                    # Nothing to scan, or the last scan has not finished: wait a full interval
+                    self.skipped += 1
+
+                await db_service.set_next_scan(product.id, next_run(now, product.scan_interval_minutes))
+
+        self.submitted += submitted
+        return submitted
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "tick_seconds": self.tick_seconds,
+            "max_per_source": self.max_per_source,
+            "last_tick": self.last_tick.isoformat() if self.last_tick else None,
+            "submitted": self.submitted,
+            "skipped": self.skipped,
+        }
+
+
+# Singleton used by main.py
+scheduler = Scheduler()
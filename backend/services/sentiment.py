@@ -1,130 +1,228 @@
 # Sentiment analysis using VADER (works well for social media text)
-from typing import List, Dict, Any
-from collections import Counter
-import re
+from typing import Callable, List, Dict, Any, Optional, TypeVar
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+import asyncio
+import contextvars
+import functools
+import hashlib
+import math
+import multiprocessing
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from config import (
+    DEFAULT_REVIEW_COUNT,
+    SENTIMENT_CACHE_SIZE,
+    SENTIMENT_CACHE_PATH,
+    SENTIMENT_WORKERS,
+    SENTIMENT_BATCH_CUTOVER,
+)
+from .aggregate import AggregateState, sentiment_label
+from .keywords import KeywordAccumulator, tokenize
+from .metrics import SENTIMENT_SECONDS
+from .tracing import tracer
+from .sentiment_cache import SentimentCache, Scores
+from .sentiment_worker import init_worker, score_chunk
+
+T = TypeVar("T")
+
+NEUTRAL_SCORES: Scores = (0.0, 0.0, 0.0, 1.0)
 
 class SentimentAnalyzer:
-    def __init__(self):
+    def __init__(self, workers: int = SENTIMENT_WORKERS, batch_cutover: int = SENTIMENT_BATCH_CUTOVER):
         self.analyzer = SentimentIntensityAnalyzer()
+        self.cache = SentimentCache(
+            SENTIMENT_CACHE_SIZE,
+            version=self._analyzer_version(),
+            path=SENTIMENT_CACHE_PATH or None
+        )
+        self.workers = workers
+        self.batch_cutover = batch_cutover
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _analyzer_version(self) -> str:
+        """Package version plus lexicon fingerprint; changing either invalidates cached scores."""
+        lexicon = hashlib.sha256(
+            (self.analyzer.lexicon_full_filepath + self.analyzer.emoji_full_filepath).encode("utf-8")
+        ).hexdigest()[:12]
+        return f"vader-{version('vaderSentiment')}-{lexicon}"
 
+    @SENTIMENT_SECONDS.time(operation="analyze_text")
     def analyze_text(self, text: str) -> Dict[str, Any]:
-        """Analyze sentiment of a single text."""
+        """Analyze sentiment of a single text (cached by content)."""
         if not text:
             return {"compound": 0.0, "positive": 0.0, "negative": 0.0, "neutral": 1.0}
 
-        scores = self.analyzer.polarity_scores(text)
+        cached = self.cache.get(text)
+        if cached is None:
+            scores = self.analyzer.polarity_scores(text)
+            cached = (scores["compound"], scores["pos"], scores["neg"], scores["neu"])
+            self.cache.set(text, cached)
+
+        return self._scores_to_dict(cached)
+
+    def _scores_to_dict(self, scores: Scores) -> Dict[str, Any]:
         return {
-            "compound": scores["compound"],
-            "positive": scores["pos"],
-            "negative": scores["neg"],
-            "neutral": scores["neu"]
+            "compound": scores[0],
+            "positive": scores[1],
+            "negative": scores[2],
+            "neutral": scores[3]
         }
 
-    def get_sentiment_label(self, compound_score: float) -> str:
-        """Convert compound score to sentiment label."""
-        if compound_score >= 0.05:
-            return "positive"
-        elif compound_score <= -0.05:
-            return "negative"
-        else:
-            return "neutral"
-
-    def extract_keywords(self, texts: List[str], top_n: int = 20) -> List[Dict[str, Any]]:
-        """Extract common keywords from texts with their sentiment."""
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
-            "be", "have", "has", "had", "do", "does", "did", "will", "would",
-            "could", "should", "may", "might", "must", "shall", "can", "need",
-            "this", "that", "these", "those", "i", "you", "he", "she", "it",
-            "we", "they", "what", "which", "who", "whom", "whose", "where",
-            "when", "why", "how", "all", "each", "every", "both", "few", "more",
-            "most", "other", "some", "such", "no", "nor", "not", "only", "own",
-            "same", "so", "than", "too", "very", "just", "also", "now", "here",
-            "there", "then", "once", "if", "my", "your", "its", "our", "their",
-            "app", "use", "using", "used", "really", "very", "much", "get", "got",
-            "one", "two", "first", "new", "even", "still", "well", "way", "many"
-        }
+    @SENTIMENT_SECONDS.time(operation="analyze_batch")
+    @tracer.traced("sentiment.analyze_batch")
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze many texts, fanning cache misses out to worker processes.
 
-        word_sentiments = {}
-        word_counts = Counter()
+        Batches with fewer uncached texts than `batch_cutover` (or a single
+        worker) are scored in-process, where pool overhead would dominate.
+        Results are returned in input order.
+        """
+        results: List[Optional[Scores]] = [None] * len(texts)
+        misses: Dict[str, List[int]] = {}
 
-        for text in texts:
+        for i, text in enumerate(texts):
             if not text:
+                results[i] = NEUTRAL_SCORES
                 continue
+            cached = self.cache.get(text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(text, []).append(i)
 
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-            sentiment = self.analyze_text(text)
-
-            for word in words:
-                if word not in stop_words:
-                    word_counts[word] += 1
-                    if word not in word_sentiments:
-                        word_sentiments[word] = []
-                    word_sentiments[word].append(sentiment["compound"])
-
-        keywords = []
-        for word, count in word_counts.most_common(top_n * 2):
-            if count >= 2:
-                avg_sentiment = sum(word_sentiments[word]) / len(word_sentiments[word])
-                keywords.append({
-                    "word": word,
-                    "count": count,
-                    "sentiment": self.get_sentiment_label(avg_sentiment),
-                    "score": round(avg_sentiment, 3)
-                })
-
-        return sorted(keywords, key=lambda x: x["count"], reverse=True)[:top_n]
+        unique_texts = list(misses)
+        span = tracer.current_span()
+        if span:
+            span.set(texts=len(texts), cache_misses=len(unique_texts))
+        if len(unique_texts) < self.batch_cutover or self.workers <= 1:
+            scored = [
+                (s["compound"], s["pos"], s["neg"], s["neu"])
+                for s in map(self.analyzer.polarity_scores, unique_texts)
+            ]
+        else:
+            # A few chunks per worker keeps them busy without per-text IPC
+            chunk_size = math.ceil(len(unique_texts) / (self.workers * 4))
+            chunks = [unique_texts[i:i + chunk_size] for i in range(0, len(unique_texts), chunk_size)]
+            scored = [scores for chunk in self._get_pool().map(score_chunk, chunks) for scores in chunk]
 
-    # Main method - analyzes list of reviews and returns overall sentiment
-    def analyze_reviews(self, reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze sentiment for a list of reviews."""
-        if not reviews:
-            return {
-                "overall": "neutral",
-                "breakdown": {"positive": 0, "negative": 0, "neutral": 0},
-                "percentages": {"positive": 0.0, "negative": 0.0, "neutral": 0.0},
-                "total_analyzed": 0,
-                "average_score": 0.0,
-                "keywords": []
-            }
+        for text, scores in zip(unique_texts, scored):
+            self.cache.set(text, scores)
+            for i in misses[text]:
+                results[i] = scores
+        self.cache.flush()
 
-        sentiments = []
-        texts = []
+        return [self._scores_to_dict(scores) for scores in results]
 
-        for review in reviews:
-            comment = review.get("comment", "")
-            if comment:
-                texts.append(comment)
-                sentiment = self.analyze_text(comment)
-                sentiments.append(sentiment)
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn avoids forking a process that already runs the event loop and thread pools
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker
+            )
+        return self._pool
+
+    @property
+    def uses_pool(self) -> bool:
+        """Whether a batch of one scan's new reviews is large enough for the worker pool."""
+        return self.workers > 1 and self.batch_cutover <= DEFAULT_REVIEW_COUNT
+
+    def warm_up(self) -> None:
+        """Start the worker pool and load VADER in every worker, so the first batch doesn't pay for it."""
+        pool = self._get_pool()
+        for future in [pool.submit(score_chunk, []) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Stop batch worker processes and flush the score cache."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self.cache.flush()
 
-        if not sentiments:
+    def get_sentiment_label(self, compound_score: float) -> str:
+        """Convert compound score to sentiment label."""
+        return sentiment_label(compound_score)
+
+    def score_reviews(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Attach sentiment_score/sentiment_label to each review dict in place.
+
+        Reviews that already carry a score are left untouched, so a review is
+        only ever run through VADER once per scan.
+        """
+        unscored = [r for r in reviews if r.get("sentiment_score") is None]
+        sentiments = self.analyze_batch([r.get("comment", "") for r in unscored])
+
+        for review, sentiment in zip(unscored, sentiments):
+            review["sentiment_score"] = sentiment["compound"]
+            review["sentiment_label"] = self.get_sentiment_label(sentiment["compound"])
+        return reviews
+
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking analyzer call in the default thread pool, keeping the caller's trace context."""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, functools.partial(context.run, func, *args))
+
+    async def score_reviews_async(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """score_reviews off the event loop thread (VADER or the wait on worker processes)."""
+        return await self._run_in_executor(self.score_reviews, reviews)
+
+    async def analyze_reviews_async(
+        self,
+        reviews: List[Dict[str, Any]],
+        keywords: Optional[KeywordAccumulator] = None
+    ) -> Dict[str, Any]:
+        """analyze_reviews off the event loop thread (tokenizing and aggregation)."""
+        return await self._run_in_executor(self.analyze_reviews, reviews, keywords)
+
+    @SENTIMENT_SECONDS.time(operation="extract_keywords")
+    def extract_keywords(
+        self,
+        texts: List[str],
+        top_n: int = 20,
+        scores: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract common keywords from texts with their sentiment.
+
+        Pass `scores` (compound score per text) to reuse already computed
+        sentiment instead of analyzing every text again.
+        """
+        if scores is None:
+            scores = [s["compound"] for s in self.analyze_batch(texts)]
+        return self.format_keywords(KeywordAccumulator().add_many(texts, scores), top_n)
+
+    def format_keywords(self, keywords: KeywordAccumulator, top_n: int = 20) -> List[Dict[str, Any]]:
+        """Top keywords from an accumulator with their average sentiment."""
+        return [
+            {
+                "word": word,
+                "count": count,
+                "sentiment": self.get_sentiment_label(avg_sentiment),
+                "score": round(avg_sentiment, 3)
+            }
+            for word, count, avg_sentiment in keywords.top(top_n)
+        ]
+
+    @SENTIMENT_SECONDS.time(operation="summarize")
+    def summarize(self, state: AggregateState, top_n: int = 20) -> Dict[str, Any]:
+        """Sentiment result (overall, breakdown, percentages, keywords) for an aggregate state."""
+        total_reviews = state.total
+        if not total_reviews:
             return {
                 "overall": "neutral",
                 "breakdown": {"positive": 0, "negative": 0, "neutral": 0},
                 "percentages": {"positive": 0.0, "negative": 0.0, "neutral": 0.0},
                 "total_analyzed": 0,
                 "average_score": 0.0,
-                "keywords": []
+                "keywords": [],
+                "aggregate_state": state
             }
 
-        breakdown = {"positive": 0, "negative": 0, "neutral": 0}
-        total_compound = 0.0
-
-        for s in sentiments:
-            total_compound += s["compound"]
-            label = self.get_sentiment_label(s["compound"])
-            breakdown[label] += 1
-
-        avg_compound = total_compound / len(sentiments)
-        overall = self.get_sentiment_label(avg_compound)
-
-        keywords = self.extract_keywords(texts)
-
-        total_reviews = len(sentiments)
+        breakdown = dict(state.breakdown)
+        avg_compound = state.average_score
         percentages = {
             "positive": round((breakdown["positive"] / total_reviews) * 100, 1),
             "negative": round((breakdown["negative"] / total_reviews) * 100, 1),
@@ -132,14 +230,43 @@ class SentimentAnalyzer:
         }
 
         return {
-            "overall": overall,
+            "overall": self.get_sentiment_label(avg_compound),
             "breakdown": breakdown,
             "percentages": percentages,
             "total_analyzed": total_reviews,
             "average_score": round(avg_compound, 3),
-            "keywords": keywords
+            "keywords": self.format_keywords(state.keywords, top_n),
+            "aggregate_state": state
         }
 
+    # Main method - analyzes list of reviews and returns overall sentiment
+    @SENTIMENT_SECONDS.time(operation="analyze_reviews")
+    def analyze_reviews(
+        self,
+        reviews: List[Dict[str, Any]],
+        keywords: Optional[KeywordAccumulator] = None
+    ) -> Dict[str, Any]:
+        """Analyze sentiment for a list of reviews.
+
+        Uses each review's precomputed sentiment_score when present (see
+        score_reviews), so aggregating already scored reviews never calls VADER.
+        Pass `keywords` (e.g. merged per-source accumulators) to skip
+        tokenizing the texts again. The AggregateState behind the result is
+        returned as "aggregate_state" so it can be merged or persisted.
+        """
+        state = AggregateState()
+        for review in reviews:
+            comment = review.get("comment", "")
+            if comment:
+                score = review.get("sentiment_score")
+                if score is None:
+                    score = self.analyze_text(comment)["compound"]
+                state.add(score, tokenize(comment) if keywords is None else ())
+
+        if keywords is not None:
+            state.keywords = keywords
+        return self.summarize(state)
+
 
 # Singleton instance used by main.py and service.py
 sentiment_analyzer = SentimentAnalyzer()
@@ -0,0 +1,117 @@
+# Content-hash cache for sentiment scores (in-memory LRU + optional SQLite file)
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Any
+
+# compound, positive, negative, neutral
+Scores = Tuple[float, float, float, float]
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace; VADER tokenizes on whitespace so scores are unchanged."""
+    return " ".join(text.split())
+
+
+class SentimentCache:
+    """Two-tier cache keyed by analyzer version + hash of the normalized text.
+
+    The memory tier is a bounded LRU. When `path` is set, entries are also
+    written to a SQLite file so scores survive restarts; disk hits are
+    promoted back into memory.
+    """
+
+    def __init__(self, max_size: int, version: str, path: Optional[str] = None):
+        self.max_size = max_size
+        self.version = version
+        self._memory: "OrderedDict[str, Scores]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Scores] = {}
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self._disk: Optional[sqlite3.Connection] = None
+        if path:
+            self._disk = sqlite3.connect(path, check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                "key TEXT PRIMARY KEY, compound REAL, positive REAL, negative REAL, neutral REAL)"
+            )
+
+    def make_key(self, text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{self.version}:{digest}"
+
+    def get(self, text: str) -> Optional[Scores]:
+        key = self.make_key(text)
+        with self._lock:
+            scores = self._memory.get(key)
+            if scores is not None:
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                return scores
+
+            scores = self._pending.get(key) or self._read_disk(key)
+            if scores is not None:
+                self._stats["disk_hits"] += 1
+                self._remember(key, scores)
+                return scores
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, text: str, scores: Scores) -> None:
+        key = self.make_key(text)
+        with self._lock:
+            self._remember(key, scores)
+            if self._disk is not None:
+                self._pending[key] = scores
+                if len(self._pending) >= 500:
+                    self._flush_locked()
+
+    def flush(self) -> None:
+        """Write buffered entries to the disk tier."""
+        with self._lock:
+            self._flush_locked()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            hits = self._stats["hits"] + self._stats["disk_hits"]
+            return {
+                **self._stats,
+                "size": len(self._memory),
+                "max_size": self.max_size,
+                "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+                "persistent": self._disk is not None,
+                "version": self.version
+            }
+
+    def _remember(self, key: str, scores: Scores) -> None:
+        if self.max_size <= 0:
+            return
+        self._memory[key] = scores
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _read_disk(self, key: str) -> Optional[Scores]:
+        if self._disk is None:
+            return None
+        row = self._disk.execute(
+            "SELECT compound, positive, negative, neutral FROM sentiment_cache WHERE key = ?",
+            (key,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def _flush_locked(self) -> None:
+        if self._disk is None or not self._pending:
+            return
+        with self._disk:
+            self._disk.executemany(
+                "INSERT OR REPLACE INTO sentiment_cache VALUES (?, ?, ?, ?, ?)",
+                [(key, *scores) for key, scores in self._pending.items()]
+            )
+        self._pending.clear()
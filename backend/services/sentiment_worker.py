@@ -0,0 +1,21 @@
+# Entry points for sentiment batch worker processes; imports nothing from the app so spawned workers stay light
+from typing import List, Optional, Tuple
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+# Warm VADER instance inside each worker process, loaded once by the pool initializer
+_analyzer: Optional[SentimentIntensityAnalyzer] = None
+
+
+def init_worker() -> None:
+    global _analyzer
+    _analyzer = SentimentIntensityAnalyzer()
+
+
+def score_chunk(texts: List[str]) -> List[Tuple[float, float, float, float]]:
+    """(compound, positive, negative, neutral) for each text."""
+    results = []
+    for text in texts:
+        scores = _analyzer.polarity_scores(text)
+        results.append((scores["compound"], scores["pos"], scores["neg"], scores["neu"]))
+    return results
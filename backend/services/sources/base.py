@@ -1,9 +1,22 @@
 # Base classes for all review sources
+import asyncio
+import concurrent.futures
+import functools
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Callable, TypeVar
 from pydantic import BaseModel
 
-from config import DEFAULT_REVIEW_COUNT
+from config import DEFAULT_REVIEW_COUNT, SOURCE_IO_WORKERS, SOURCE_TIMEOUT_SECONDS
+from ..rate_limit import rate_limiter
+
+T = TypeVar("T")
+
+# Shared, bounded pool for blocking library calls so they never run on the event loop
+_blocking_executor = ThreadPoolExecutor(
+    max_workers=SOURCE_IO_WORKERS,
+    thread_name_prefix="source-io"
+)
 
 
 # Standard review format - all sources return this
@@ -25,6 +38,20 @@ class SourceResult(BaseModel):
     total_reviews: int
     reviews: List[Review]
     error: Optional[str] = None
+    cursor: Optional[str] = None  # Source-specific resume position for the next incremental scan
+
+
+# Newest reviews already stored for a (product, platform); incremental fetches stop there
+class Watermark(BaseModel):
+    ids: List[str] = []
+    date: str = ""  # Newest stored review date (YYYY-MM-DD)
+    cursor: Optional[str] = None
+
+    def reached(self, review: Review) -> bool:
+        """True once a newest-first listing gets to reviews that are already stored."""
+        if review.id in self.ids:
+            return True
+        return bool(self.date and review.date) and review.date < self.date
 
 
 # Abstract class - all sources inherit from this
@@ -32,10 +59,68 @@ class BaseSource(ABC):
     platform_name: str = "Unknown"
 
     @abstractmethod
-    async def fetch_reviews(self, identifier: str, count: int = DEFAULT_REVIEW_COUNT) -> SourceResult:
-        """Fetch reviews from the source platform."""
+    async def fetch_reviews(
+        self,
+        identifier: str,
+        count: int = DEFAULT_REVIEW_COUNT,
+        since: Optional[Watermark] = None
+    ) -> SourceResult:
+        """Fetch reviews from the source platform.
+
+        With `since`, only reviews newer than the watermark are returned and
+        sources stop paging as soon as they reach stored reviews.
+        """
         pass
 
+    def take_new(self, reviews: List[Review], since: Optional[Watermark]) -> List[Review]:
+        """Leading reviews of a newest-first page that come before the watermark."""
+        if since is None:
+            return reviews
+        for index, review in enumerate(reviews):
+            if since.reached(review):
+                return reviews[:index]
+        return reviews
+
+    async def run_blocking(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking library call in the shared source executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _blocking_executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def run_limited(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """run_blocking for a library call that makes one request, queued behind the platform's rate limit."""
+        await rate_limiter.acquire(self.platform_name)
+        return await self.run_blocking(func, *args, **kwargs)
+
+    def blocking_rate_limit(self) -> Callable[[], None]:
+        """A function that blocking code running in the executor calls before each request it makes.
+
+        It raises instead of waiting once the fetch that started the blocking
+        code has finished or been cancelled, or when no token comes within
+        SOURCE_TIMEOUT_SECONDS, so the executor thread stops paging.
+        """
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+
+        def wait() -> None:
+            if task is not None and task.done():
+                raise RuntimeError(f"{self.platform_name} fetch was cancelled")
+            future = asyncio.run_coroutine_threadsafe(rate_limiter.acquire(self.platform_name), loop)
+            try:
+                future.result(timeout=SOURCE_TIMEOUT_SECONDS)
+            except concurrent.futures.TimeoutError:
+                # Leave the queue so the token goes to a request that will still use it
+                future.cancel()
+                raise TimeoutError(
+                    f"{self.platform_name} rate limit wait exceeded {SOURCE_TIMEOUT_SECONDS:g}s"
+                )
+            except concurrent.futures.CancelledError:
+                raise RuntimeError(f"{self.platform_name} rate limit wait was cancelled")
+
+        return wait
+
     def calculate_average_rating(self, reviews: List[Review]) -> float:
         """Calculate average rating from a list of reviews."""
         ratings = [r.rating for r in reviews if r.rating is not None]
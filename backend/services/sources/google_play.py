@@ -1,23 +1,55 @@
 # Google Play Store reviews via google-play-scraper (no API key needed)
+from typing import Optional
+
 from google_play_scraper import reviews, Sort
 from google_play_scraper.exceptions import NotFoundError
 
-from config import DEFAULT_REVIEW_COUNT
-from .base import BaseSource, Review, SourceResult
+from config import DEFAULT_REVIEW_COUNT, INCREMENTAL_PAGE_SIZE
+from .base import BaseSource, Review, SourceResult, Watermark
 
 
 class GooglePlaySource(BaseSource):
     platform_name = "Google Play Store"
 
-    async def fetch_reviews(self, identifier: str, count: int = DEFAULT_REVIEW_COUNT) -> SourceResult:
+    def _to_review(self, r: dict) -> Review:
+        return Review(
+            id=r.get("reviewId", ""),
+            user=r.get("userName", "Anonymous"),
+            rating=float(r.get("score", 0)),
+            comment=r.get("content", ""),
+            date=str(r.get("at", ""))[:10] if r.get("at") else "",
+            platform=self.platform_name,
+            likes=r.get("thumbsUpCount", 0)
+        )
+
+    async def fetch_reviews(
+        self,
+        identifier: str,
+        count: int = DEFAULT_REVIEW_COUNT,
+        since: Optional[Watermark] = None
+    ) -> SourceResult:
         try:
-            result, _ = reviews(
-                identifier,
-                lang="en",
-                country="us",
-                sort=Sort.NEWEST,
-                count=count
-            )
+            # Incremental scans start small and follow continuation tokens only while every review is new
+            page_size = min(count, INCREMENTAL_PAGE_SIZE) if since else count
+            result = []
+            token = None
+            while len(result) < count:
+                if token is None:
+                    page, token = await self.run_limited(
+                        reviews,
+                        identifier,
+                        lang="en",
+                        country="us",
+                        sort=Sort.NEWEST,
+                        count=page_size
+                    )
+                else:
+                    page, token = await self.run_limited(reviews, identifier, continuation_token=token)
+
+                new = self.take_new([self._to_review(r) for r in page], since)
+                result.extend(new)
+                if len(new) < len(page) or not page or token.token is None:
+                    break
 
             if not result:
                 return SourceResult(
@@ -29,19 +61,7 @@ class GooglePlaySource(BaseSource):
                     error=None
                 )
 
-            review_list = []
-
-            for r in result:
-                review = Review(
-                    id=r.get("reviewId", ""),
-                    user=r.get("userName", "Anonymous"),
-                    rating=float(r.get("score", 0)),
-                    comment=r.get("content", ""),
-                    date=str(r.get("at", ""))[:10] if r.get("at") else "",
-                    platform=self.platform_name,
-                    likes=r.get("thumbsUpCount", 0)
-                )
-                review_list.append(review)
+            review_list = result[:count]
 
             return SourceResult(
                 platform=self.platform_name,
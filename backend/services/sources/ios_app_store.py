@@ -1,28 +1,74 @@
 # iOS App Store reviews via RSS feed scraper (no API key needed)
-import requests
-from app_store_web_scraper import AppStoreEntry
+from typing import Callable, List, Optional
+
+from app_store_web_scraper import AppStoreEntry, AppStoreSession
 
 from config import DEFAULT_REVIEW_COUNT
-from .base import BaseSource, Review, SourceResult
+from ..http import http_client
+from .base import BaseSource, Review, SourceResult, Watermark
+
+# Reviews per page of the customer reviews RSS feed
+FEED_PAGE_SIZE = 50
 
 
 class IOSAppStoreSource(BaseSource):
     platform_name = "iOS App Store"
 
-    def _validate_app(self, app_id: str) -> bool:
+    def __init__(self):
+        # One urllib3 pool for every RSS feed fetch instead of a new one per app
+        self._session = AppStoreSession()
+
+    async def _validate_app(self, app_id: str) -> bool:
         try:
-            response = requests.get(
-                f"https://itunes.apple.com/lookup?id={app_id}",
-                timeout=30
+            response = await http_client.get(
+                self.platform_name,
+                "https://itunes.apple.com/lookup",
+                params={"id": app_id}
             )
             data = response.json()
             return data.get("resultCount", 0) > 0
         except Exception:
             return False
 
-    async def fetch_reviews(self, identifier: str, count: int = DEFAULT_REVIEW_COUNT) -> SourceResult:
+    def _read_feed(
+        self,
+        app: AppStoreEntry,
+        count: int,
+        since: Optional[Watermark],
+        wait_for_request: Callable[[], None]
+    ) -> List[Review]:
+        """Read the most-recent feed, which fetches its next page only when iteration reaches it."""
+        review_list = []
+        feed = iter(app.reviews(limit=count))
+        for index in range(count):
+            if index % FEED_PAGE_SIZE == 0:
+                # The next item comes from a new page request
+                wait_for_request()
+            r = next(feed, None)
+            if r is None:
+                break
+            review = Review(
+                id=str(r.id),
+                user=r.user_name or 'Anonymous',
+                rating=float(r.rating),
+                comment=f"{r.title}: {r.content}" if r.title else r.content,
+                date=r.date.strftime('%Y-%m-%d') if r.date else '',
+                platform=self.platform_name
+            )
+            if since and since.reached(review):
+                break
+            review_list.append(review)
+        return review_list
+
+    async def fetch_reviews(
+        self,
+        identifier: str,
+        count: int = DEFAULT_REVIEW_COUNT,
+        since: Optional[Watermark] = None
+    ) -> SourceResult:
         try:
-            if not self._validate_app(identifier):
+            # An app with a watermark was validated by an earlier scan
+            if since is None and not await self._validate_app(identifier):
                 return SourceResult(
                     platform=self.platform_name,
                     identifier=identifier,
@@ -34,21 +80,13 @@ class IOSAppStoreSource(BaseSource):
 
             app = AppStoreEntry(
                 app_id=int(identifier),
-                country="us"
+                country="us",
+                session=self._session
+            )
+            # The RSS scraper pages through the feed with blocking requests
+            review_list = await self.run_blocking(
+                self._read_feed, app, count, since, self.blocking_rate_limit()
             )
-            raw_reviews = list(app.reviews(limit=count))
-
-            review_list = [
-                Review(
-                    id=str(r.id),
-                    user=r.user_name or 'Anonymous',
-                    rating=float(r.rating),
-                    comment=f"{r.title}: {r.content}" if r.title else r.content,
-                    date=r.date.strftime('%Y-%m-%d') if r.date else '',
-                    platform=self.platform_name
-                )
-                for r in raw_reviews
-            ]
 
             return SourceResult(
                 platform=self.platform_name,
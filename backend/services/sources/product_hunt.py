@@ -1,32 +1,40 @@
 # Product Hunt comments via GraphQL API (requires PRODUCT_HUNT_API_TOKEN)
 # Note: Product Hunt API only exposes launch post comments, not product reviews
 import os
-import requests
+from typing import Optional
+
+import httpx
 
 from config import DEFAULT_REVIEW_COUNT
-from .base import BaseSource, Review, SourceResult
+from ..http import http_client
+from .base import BaseSource, Review, SourceResult, Watermark
 
 
 class ProductHuntSource(BaseSource):
     platform_name = "Product Hunt"
     api_url = "https://api.producthunt.com/v2/api/graphql"
 
-    def _make_request(self, query: str) -> dict:
+    async def _make_request(self, query: str) -> dict:
         headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
             "Authorization": f"Bearer {os.getenv('PRODUCT_HUNT_API_TOKEN')}",
         }
-        response = requests.post(
+        response = await http_client.post(
+            self.platform_name,
             self.api_url,
             headers=headers,
-            json={"query": query},
-            timeout=30
+            json={"query": query}
         )
         response.raise_for_status()
         return response.json()
 
-    async def fetch_reviews(self, identifier: str, count: int = DEFAULT_REVIEW_COUNT) -> SourceResult:
+    async def fetch_reviews(
+        self,
+        identifier: str,
+        count: int = DEFAULT_REVIEW_COUNT,
+        since: Optional[Watermark] = None
+    ) -> SourceResult:
         if not os.getenv("PRODUCT_HUNT_API_TOKEN"):
             return SourceResult(
                 platform=self.platform_name,
@@ -66,7 +74,7 @@ class ProductHuntSource(BaseSource):
             }}
             """
 
-            data = self._make_request(query)
+            data = await self._make_request(query)
 
             if "errors" in data:
                 return SourceResult(
@@ -109,6 +117,9 @@ class ProductHuntSource(BaseSource):
                 )
                 review_list.append(review)
 
+            # One query returns the newest comments; keep those not stored yet
+            review_list = self.take_new(review_list, since)
+
             return SourceResult(
                 platform=self.platform_name,
                 identifier=identifier,
@@ -117,7 +128,7 @@ class ProductHuntSource(BaseSource):
                 reviews=review_list
             )
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 error_msg = "Invalid or expired API token"
             elif e.response.status_code == 429:
@@ -1,20 +1,37 @@
 # Reddit comments via public JSON API (no API key needed)
-import requests
+import asyncio
+import httpx
 from datetime import datetime
+from typing import Callable, List, Optional, Tuple
 
-from config import DEFAULT_REVIEW_COUNT
-from .base import BaseSource, Review, SourceResult
+from config import (
+    DEFAULT_REVIEW_COUNT,
+    REDDIT_MAX_POSTS,
+    REDDIT_COMMENTS_PER_POST,
+    REDDIT_CONCURRENCY,
+    REDDIT_RECHECK_POSTS,
+    SOURCE_TIMEOUT_SECONDS,
+)
+from ..http import http_client
+from ..rate_limit import rate_limiter
+from .base import BaseSource, Review, SourceResult, Watermark
+
+# A comment with its created_utc, and the test deciding whether an incremental scan keeps it
+TimedReview = Tuple[float, Review]
+NewComment = Callable[[float, Review], bool]
+
+# Comment fetching stops at this share of SOURCE_TIMEOUT_SECONDS, so the comments gathered
+# so far are returned instead of being discarded by the scanner's timeout
+COLLECT_FRACTION = 0.8
 
 
 class RedditSource(BaseSource):
     platform_name = "Reddit"
 
-    def _fetch_json(self, url: str) -> dict:
-        headers = {"User-Agent": "PerceptionScanner/1.0"}
-        response = requests.get(
-            url,
-            headers=headers,
-            timeout=30
+    async def _fetch_json(self, url: str) -> dict:
+        # Rate limiting (including x-ratelimit-* headers and 429 retries) happens in http_client
+        response = await http_client.get(
+            self.platform_name, url, headers={"User-Agent": "PerceptionScanner/1.0"}
         )
         response.raise_for_status()
         return response.json()
@@ -24,14 +41,195 @@ class RedditSource(BaseSource):
             return ""
         return datetime.utcfromtimestamp(timestamp).strftime('%Y-%m-%d')
 
-    async def fetch_reviews(self, identifier: str, count: int = DEFAULT_REVIEW_COUNT) -> SourceResult:
+    def _parse_comments(self, listing: dict, limit: int, is_new: NewComment) -> List[TimedReview]:
+        """(created_utc, review) for the comments in a listing that `is_new` accepts."""
+        review_list = []
+        for item in listing.get("data", {}).get("children", [])[:limit]:
+            if item.get("kind") != "t1":
+                continue
+            comment = item.get("data", {})
+            if not comment.get("body"):
+                continue
+            created = float(comment.get("created_utc") or 0)
+            review = Review(
+                id=comment.get("id", ""),
+                user=comment.get("author", "Anonymous"),
+                rating=None,
+                comment=comment.get("body", ""),
+                date=self._timestamp_to_date(comment.get("created_utc")),
+                platform=self.platform_name,
+                likes=comment.get("score", 0)
+            )
+            if is_new(created, review):
+                review_list.append((created, review))
+        return review_list
+
+    def _cursor_time(self, since: Optional[Watermark]) -> Optional[float]:
+        """created_utc stored as the watermark cursor; None for full scans and older watermarks."""
+        if since is None or not since.cursor:
+            return None
+        try:
+            return float(since.cursor)
+        except ValueError:
+            return None
+
+    def _new_comment_filter(self, since: Optional[Watermark]) -> NewComment:
+        """Accepts comments posted after the last scan's newest one, on any post.
+
+        The cursor is that comment's created_utc. Watermarks saved before it
+        existed fall back to the stored ids and date.
+        """
+        if since is None:
+            return lambda created, review: True
+        after = self._cursor_time(since)
+        if after is None:
+            return lambda created, review: not since.reached(review)
+        return lambda created, review: created > after and review.id not in since.ids
+
+    def _posts_to_read(self, posts: List[dict], since: Optional[Watermark]) -> List[dict]:
+        """Posts with comments, in listing order; incremental scans skip most older posts.
+
+        Every post created after the cursor is read, plus the
+        REDDIT_RECHECK_POSTS newest ones before it, where new comments on
+        old posts usually land.
+        """
+        after = self._cursor_time(since)
+        selected = []
+        rechecked = 0
+        for post in posts:
+            data = post.get("data", {})
+            # Posts reporting zero comments would only cost a request
+            if not data.get("permalink") or data.get("num_comments", 1) <= 0:
+                continue
+            if after is not None and float(data.get("created_utc") or 0) <= after:
+                if rechecked >= REDDIT_RECHECK_POSTS:
+                    continue
+                rechecked += 1
+            selected.append(post)
+        return selected
+
+    def _next_cursor(self, comments: List[TimedReview], since: Optional[Watermark]) -> Optional[str]:
+        """created_utc of the newest comment seen so far, as the next scan's cursor."""
+        newest = max((created for created, _ in comments), default=None)
+        if since and since.cursor:
+            try:
+                newest = max(newest or 0.0, float(since.cursor))
+            except ValueError:
+                pass
+        return repr(newest) if newest else None
+
+    async def _fetch_more_posts(
+        self,
+        listing_url: str,
+        posts: List[dict],
+        after: Optional[str],
+        count: int,
+        since: Optional[Watermark] = None
+    ) -> List[dict]:
+        """Page through the listing until the posts can plausibly supply `count` comments.
+
+        Incremental scans also stop once the listing reaches posts created
+        before the cursor, since only a few of those are read again.
+        """
+        cursor_time = self._cursor_time(since)
+
+        def expected_comments() -> int:
+            return sum(
+                min(p.get("data", {}).get("num_comments", 0), REDDIT_COMMENTS_PER_POST)
+                for p in posts
+            )
+
+        def reached_cursor() -> bool:
+            return cursor_time is not None and bool(posts) and (
+                float(posts[-1].get("data", {}).get("created_utc") or 0) <= cursor_time
+            )
+
+        while after and len(posts) < REDDIT_MAX_POSTS and expected_comments() < count and not reached_cursor():
+            limit = min(100, REDDIT_MAX_POSTS - len(posts))
+            data = await self._fetch_json(f"{listing_url}?limit={limit}&after={after}")
+            page = data.get("data", {}).get("children", [])
+            if not page:
+                break
+            posts.extend(page)
+            after = data.get("data", {}).get("after")
+
+        return posts
+
+    async def _fetch_post_comments(
+        self,
+        permalink: str,
+        semaphore: asyncio.Semaphore,
+        is_new: NewComment
+    ) -> List[TimedReview]:
+        async with semaphore:
+            try:
+                post_url = f"https://www.reddit.com{permalink}.json?limit={REDDIT_COMMENTS_PER_POST}"
+                post_json = await self._fetch_json(post_url)
+            except Exception:
+                return []
+
+        if isinstance(post_json, list) and len(post_json) > 1:
+            return self._parse_comments(post_json[1], REDDIT_COMMENTS_PER_POST, is_new)
+        return []
+
+    async def _fetch_subreddit_comments(
+        self,
+        posts: List[dict],
+        count: int,
+        is_new: NewComment,
+        deadline: float
+    ) -> List[TimedReview]:
+        """Fetch comments for many posts concurrently, keeping post order.
+
+        Tasks are awaited in listing order so results are deterministic, and
+        the rest are cancelled as soon as enough comments have been collected.
+        At `deadline` (loop time) the comments collected so far are returned.
+        Only as many posts as the rate limiter can grant before the deadline
+        are requested.
+        """
+        loop = asyncio.get_running_loop()
+        budget = rate_limiter.budget(self.platform_name, deadline - loop.time())
+        if budget < len(posts):
+            posts = posts[:int(budget)]
+        semaphore = asyncio.Semaphore(REDDIT_CONCURRENCY)
+        tasks = [
+            asyncio.ensure_future(self._fetch_post_comments(p["data"]["permalink"], semaphore, is_new))
+            for p in posts
+        ]
+
+        review_list = []
+        try:
+            for index, task in enumerate(tasks):
+                done, _ = await asyncio.wait({task}, timeout=max(0.0, deadline - loop.time()))
+                if not done:
+                    # Out of time: keep whatever later posts already returned
+                    for finished in tasks[index + 1:]:
+                        if finished.done() and not finished.cancelled():
+                            review_list.extend(finished.result())
+                    break
+                review_list.extend(task.result())
+                if len(review_list) >= count:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return review_list[:count]
+
+    async def fetch_reviews(
+        self,
+        identifier: str,
+        count: int = DEFAULT_REVIEW_COUNT,
+        since: Optional[Watermark] = None
+    ) -> SourceResult:
+        deadline = asyncio.get_running_loop().time() + SOURCE_TIMEOUT_SECONDS * COLLECT_FRACTION
         try:
             if identifier.startswith("r/") or "/" in identifier:
                 url = f"https://www.reddit.com/{identifier}.json?limit={count}"
             else:
-                url = f"https://www.reddit.com/r/{identifier}/new.json?limit=25"
+                url = f"https://www.reddit.com/r/{identifier}/new.json?limit={min(100, REDDIT_MAX_POSTS)}"
 
-            data = self._fetch_json(url)
+            data = await self._fetch_json(url)
 
             if isinstance(data, dict) and data.get("error"):
                 return SourceResult(
@@ -43,26 +241,11 @@ class RedditSource(BaseSource):
                     error=f"Reddit returned error: {data.get('message', 'Not found')}"
                 )
 
-            review_list = []
-
+            # New comments can land on old posts, so repeat scans read new posts plus the most
+            # recent older ones and keep only comments posted after the last scan's newest one
+            is_new = self._new_comment_filter(since)
             if isinstance(data, list) and len(data) > 1:
-                comments = data[1].get("data", {}).get("children", [])
-                for item in comments[:count]:
-                    if item.get("kind") != "t1":
-                        continue
-                    comment = item.get("data", {})
-                    if not comment.get("body"):
-                        continue
-                    review = Review(
-                        id=comment.get("id", ""),
-                        user=comment.get("author", "Anonymous"),
-                        rating=None,
-                        comment=comment.get("body", ""),
-                        date=self._timestamp_to_date(comment.get("created_utc")),
-                        platform=self.platform_name,
-                        likes=comment.get("score", 0)
-                    )
-                    review_list.append(review)
+                comments = self._parse_comments(data[1], count, is_new)
             else:
                 posts = data.get("data", {}).get("children", [])
 
@@ -76,52 +259,25 @@ class RedditSource(BaseSource):
                         error=f"Subreddit 'r/{identifier}' not found or empty"
                     )
 
-                for post in posts[:10]:
-                    post_data = post.get("data", {})
-                    permalink = post_data.get("permalink", "")
-                    if not permalink:
-                        continue
-
-                    try:
-                        post_url = f"https://www.reddit.com{permalink}.json?limit=10"
-                        post_json = self._fetch_json(post_url)
-
-                        if isinstance(post_json, list) and len(post_json) > 1:
-                            comments = post_json[1].get("data", {}).get("children", [])
-                            for item in comments[:10]:
-                                if item.get("kind") != "t1":
-                                    continue
-                                comment = item.get("data", {})
-                                if not comment.get("body"):
-                                    continue
-                                review = Review(
-                                    id=comment.get("id", ""),
-                                    user=comment.get("author", "Anonymous"),
-                                    rating=None,
-                                    comment=comment.get("body", ""),
-                                    date=self._timestamp_to_date(comment.get("created_utc")),
-                                    platform=self.platform_name,
-                                    likes=comment.get("score", 0)
-                                )
-                                review_list.append(review)
-
-                                if len(review_list) >= count:
-                                    break
-                    except Exception:
-                        continue
-
-                    if len(review_list) >= count:
-                        break
+                posts = await self._fetch_more_posts(
+                    url.split("?")[0], posts, data.get("data", {}).get("after"), count, since
+                )
+                comments = await self._fetch_subreddit_comments(
+                    self._posts_to_read(posts, since), count, is_new, deadline
+                )
+
+            review_list = [review for _, review in comments]
 
             return SourceResult(
                 platform=self.platform_name,
                 identifier=identifier,
                 average_rating=0.0,
                 total_reviews=len(review_list),
-                reviews=review_list[:count]
+                reviews=review_list[:count],
+                cursor=self._next_cursor(comments, since)
             )
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 error_msg = f"Subreddit or post '{identifier}' not found"
             elif e.response.status_code == 403:
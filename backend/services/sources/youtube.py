@@ -1,10 +1,13 @@
 # YouTube comments via official API (requires YOUTUBE_API_KEY)
 import os
+from typing import Optional
+
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from config import DEFAULT_REVIEW_COUNT
-from .base import BaseSource, Review, SourceResult
+from ..rate_limit import youtube_quota
+from .base import BaseSource, Review, SourceResult, Watermark
 
 
 class YouTubeSource(BaseSource):
@@ -16,7 +19,12 @@ class YouTubeSource(BaseSource):
             return None
         return build("youtube", "v3", developerKey=api_key)
 
-    async def fetch_reviews(self, identifier: str, count: int = DEFAULT_REVIEW_COUNT) -> SourceResult:
+    async def fetch_reviews(
+        self,
+        identifier: str,
+        count: int = DEFAULT_REVIEW_COUNT,
+        since: Optional[Watermark] = None
+    ) -> SourceResult:
         if not os.getenv("YOUTUBE_API_KEY"):
             return SourceResult(
                 platform=self.platform_name,
@@ -28,36 +36,47 @@ class YouTubeSource(BaseSource):
             )
 
         try:
-            youtube = self._get_youtube_client()
-
-            video_response = youtube.videos().list(
-                part="snippet",
-                id=identifier
-            ).execute()
-
-            if not video_response.get("items"):
-                return SourceResult(
-                    platform=self.platform_name,
-                    identifier=identifier,
-                    average_rating=0.0,
-                    total_reviews=0,
-                    reviews=[],
-                    error=f"Video '{identifier}' not found on YouTube"
+            youtube = await self.run_blocking(self._get_youtube_client)
+
+            # googleapiclient is blocking; each execute() runs in the source executor behind
+            # the YouTube rate limit, and is charged to the daily quota before it is sent
+            # A video with a watermark was found by an earlier scan, so skip the extra quota unit
+            if since is None:
+                youtube_quota.spend("videos.list")
+                video_response = await self.run_limited(
+                    youtube.videos().list(
+                        part="snippet",
+                        id=identifier
+                    ).execute
                 )
 
+                if not video_response.get("items"):
+                    return SourceResult(
+                        platform=self.platform_name,
+                        identifier=identifier,
+                        average_rating=0.0,
+                        total_reviews=0,
+                        reviews=[],
+                        error=f"Video '{identifier}' not found on YouTube"
+                    )
+
             review_list = []
             next_page_token = None
 
             while len(review_list) < count:
-                response = youtube.commentThreads().list(
-                    part="snippet",
-                    videoId=identifier,
-                    maxResults=min(100, count - len(review_list)),
-                    pageToken=next_page_token,
-                    textFormat="plainText",
-                    order="time"  # Newest comments first
-                ).execute()
+                youtube_quota.spend("commentThreads.list")
+                response = await self.run_limited(
+                    youtube.commentThreads().list(
+                        part="snippet",
+                        videoId=identifier,
+                        maxResults=min(100, count - len(review_list)),
+                        pageToken=next_page_token,
+                        textFormat="plainText",
+                        order="time"  # Newest comments first
+                    ).execute
+                )
 
+                page = []
                 for item in response.get("items", []):
                     snippet = item["snippet"]["topLevelComment"]["snippet"]
                     review = Review(
@@ -69,10 +88,14 @@ class YouTubeSource(BaseSource):
                         platform=self.platform_name,
                         likes=snippet.get("likeCount", 0)
                     )
-                    review_list.append(review)
+                    page.append(review)
+
+                new = self.take_new(page, since)
+                review_list.extend(new)
 
                 next_page_token = response.get("nextPageToken")
-                if not next_page_token:
+                # Stop paging once a page reaches comments stored by an earlier scan
+                if not next_page_token or len(new) < len(page):
                     break
 
             return SourceResult(
@@ -88,6 +111,7 @@ class YouTubeSource(BaseSource):
             if "commentsDisabled" in error_msg:
                 error_msg = "Comments are disabled for this video"
             elif "quotaExceeded" in error_msg:
+                youtube_quota.mark_exhausted()
                 error_msg = "YouTube API quota exceeded. Try again tomorrow."
             elif "videoNotFound" in error_msg:
                 error_msg = f"Video '{identifier}' not found on YouTube"
@@ -0,0 +1,174 @@
+# Request-scoped tracing: nested spans in a contextvar, exported as OpenTelemetry-style JSON lines
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from config import TRACING_ENABLED, TRACING_EXPORTER, TRACING_FILE
+
+T = TypeVar("T")
+
+# W3C trace context header: version-traceid-parentid-flags
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+class Span:
+    """One timed operation; spans started inside it (same task or tasks it spawns) become its children."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes", "start_ns", "end_ns", "error")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """OTLP/JSON span fields, so files can be loaded by OpenTelemetry tooling."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "attributes": self.attributes,
+            "status": {"code": "ERROR", "message": self.error} if self.error else {"code": "OK"},
+        }
+
+
+class SpanExporter:
+    """Writes finished spans as JSON lines to a file or stderr ("console")."""
+
+    def __init__(self, kind: str, path: str):
+        self.kind = kind
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            if self.kind == "console":
+                print(line, file=sys.stderr)
+            elif self.kind == "file":
+                if self._file is None:
+                    self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Tracer:
+    def __init__(self, enabled: bool = TRACING_ENABLED, exporter: Optional[SpanExporter] = None):
+        self.enabled = enabled
+        self.exporter = exporter or SpanExporter(TRACING_EXPORTER, TRACING_FILE)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        traceparent: Optional[str] = None,
+        **attributes: Any
+    ) -> Iterator[Optional[Span]]:
+        """Time the block as a child of `parent` (default: the current span).
+
+        `traceparent` (a W3C header value) continues a trace started by the
+        caller. Yields None when tracing is disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = parent or _current_span.get()
+        trace_id, parent_id = (parent.trace_id, parent.span_id) if parent else (None, None)
+        match = TRACEPARENT_PATTERN.match(traceparent or "")
+        if trace_id is None and match:
+            trace_id, parent_id = match.groups()
+
+        span = Span(name, trace_id or _new_id(16), parent_id, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}" if not isinstance(e, asyncio.CancelledError) else "cancelled"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self.exporter.export(span)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def traced(self, name: Optional[str] = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+        """Decorator running each call (plain or async) in a span; unwrapped when tracing is off."""
+        def decorator(func: Callable[..., T]) -> Callable[..., T]:
+            if not self.enabled:
+                return func
+            span_name = name or func.__qualname__
+
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+
+        return decorator
+
+    def trace_methods(self, prefix: str) -> Callable[[type], type]:
+        """Class decorator putting every public method in a span named `<prefix>.<method>`."""
+        def decorator(cls: type) -> type:
+            if not self.enabled:
+                return cls
+            for name, attr in list(vars(cls).items()):
+                if not name.startswith("_") and inspect.isfunction(attr):
+                    setattr(cls, name, self.traced(f"{prefix}.{name}")(attr))
+            return cls
+
+        return decorator
+
+    def shutdown(self) -> None:
+        self.exporter.close()
+
+
+# Singleton used across the app
+tracer = Tracer()
@@ -0,0 +1,80 @@
+# Merged per-source aggregates must summarize exactly like one pass over all the reviews
+import random
+
+from services.aggregate import AggregateState
+from services.sentiment import SentimentAnalyzer
+
+WORDS = ["fast", "slow", "crash", "great", "battery", "update", "login", "love", "hate", "screen"]
+
+analyzer = SentimentAnalyzer(workers=1)
+
+
+def make_reviews(seed: int, n: int):
+    """Fixed reviews with VADER-style (4 decimal) scores that don't add up exactly as floats."""
+    rng = random.Random(seed)
+    return [
+        {
+            "comment": " ".join(rng.choices(WORDS, k=rng.randint(1, 6))),
+            "sentiment_score": round(rng.uniform(-1, 1), 4),
+        }
+        for _ in range(n)
+    ]
+
+
+SOURCES = [make_reviews(seed, n) for seed, n in ((1, 37), (2, 120), (3, 1), (4, 64))]
+ALL_REVIEWS = [review for reviews in SOURCES for review in reviews]
+
+
+def without_state(result):
+    return {key: value for key, value in result.items() if key != "aggregate_state"}
+
+
+def baseline_summary(reviews):
+    """analyze_reviews as it was before aggregates: one float sum over every review."""
+    breakdown = {"positive": 0, "negative": 0, "neutral": 0}
+    total_compound = 0.0
+    for review in reviews:
+        total_compound += review["sentiment_score"]
+        breakdown[analyzer.get_sentiment_label(review["sentiment_score"])] += 1
+    return breakdown, round(total_compound / len(reviews), 3)
+
+
+def test_merged_sources_match_single_pass():
+    merged = AggregateState()
+    for reviews in SOURCES:
+        merged.merge(analyzer.analyze_reviews(reviews)["aggregate_state"])
+
+    assert without_state(analyzer.summarize(merged)) == without_state(analyzer.analyze_reviews(ALL_REVIEWS))
+
+
+def test_merge_order_does_not_change_totals():
+    forward, backward = AggregateState(), AggregateState()
+    states = [AggregateState().add_reviews(reviews) for reviews in SOURCES]
+    for state in states:
+        forward.merge(state)
+    for state in reversed(states):
+        backward.merge(state)
+
+    assert forward.compound_units == backward.compound_units
+    assert forward.keywords.score_sums == backward.keywords.score_sums
+
+
+def test_single_pass_matches_baseline_arithmetic():
+    result = analyzer.analyze_reviews(ALL_REVIEWS)
+    breakdown, average_score = baseline_summary(ALL_REVIEWS)
+
+    assert result["breakdown"] == breakdown
+    assert result["average_score"] == average_score
+    for keyword in result["keywords"]:
+        scores = [r["sentiment_score"] for r in ALL_REVIEWS for word in r["comment"].split() if word == keyword["word"]]
+        assert keyword["count"] == len(scores)
+        assert keyword["score"] == round(sum(scores) / len(scores), 3)
+
+
+def test_persisted_state_round_trips():
+    state = AggregateState().add_reviews(ALL_REVIEWS)
+    restored = AggregateState.from_dict(state.to_dict())
+
+    assert without_state(analyzer.summarize(restored)) == without_state(analyzer.summarize(state))
+    assert restored.compound_units == state.compound_units
+    assert restored.keywords.score_sums == state.keywords.score_sums